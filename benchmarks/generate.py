@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Synthetic C++ project generator, for benchmarking CodeStacker.
+"""
+
+####################################################################################################
+
+# Files per directory, and subdirectories per directory.
+_FILES_PER_DIR = 16
+_DIRS_PER_DIR = 8
+
+_BLUEPRINT = '''default:
+  binary: bin
+  build: build
+  include: include
+  sources: src
+  output: Bench
+'''
+
+def generate(root, sources, headers, fanout=4, depth=3, dir_depth=2, seed=0):
+    """
+    Generate a project: headers are spread over "depth" levels, each header including "fanout"
+    headers of the next level; each source file includes "fanout" headers of any level. Files are
+    spread over nested directories.
+
+    :param root: The project's folder (created if needed).
+    :param sources: The number of source files (not counting "main.cpp").
+    :param headers: The number of headers.
+    :param fanout: The number of headers included by each file.
+    :param depth: The number of headers levels.
+    :param dir_depth: The number of nested directories levels.
+    :param seed: The seed of the random inclusions.
+
+    :returns: The list of source files and the list of headers, as generated.
+    """
+    import os
+    import random
+
+    rng = random.Random(seed)
+    depth = max(1, min(depth, headers))
+
+    header_names = [_get_path('h{}'.format(x), x, dir_depth) + '.hpp' for x in range(headers)]
+    levels = [header_names[x::depth] for x in range(depth)]
+    level_of = {x: index for index, level in enumerate(levels) for x in level}
+
+    for index, name in enumerate(header_names):
+        next_level = levels[level_of[name] + 1] if level_of[name] + 1 < depth else []
+        includes = rng.sample(next_level, min(fanout, len(next_level)))
+
+        _write(os.path.join(root, 'include', name), _get_header(index, includes))
+
+    source_names = [_get_path('s{}'.format(x), x, dir_depth) + '.cpp' for x in range(sources)]
+
+    for index, name in enumerate(source_names):
+        includes = rng.sample(header_names, min(fanout, headers))
+
+        _write(os.path.join(root, 'src', name), _get_source(index, includes))
+
+    _write(os.path.join(root, 'src', 'main.cpp'), 'int main() { return 0; }\n')
+    _write(os.path.join(root, 'blueprint.yaml'), _BLUEPRINT)
+
+    return (
+        [os.path.join(root, 'src', x) for x in source_names],
+        [os.path.join(root, 'include', x) for x in header_names])
+
+####################################################################################################
+
+def _get_path(name, index, dir_depth):
+    """
+    Place a file in nested directories, "_FILES_PER_DIR" files per directory.
+
+    :param name: The file's name.
+    :param index: The file's index.
+    :param dir_depth: The number of nested directories levels.
+
+    :returns: The file's relative path.
+    """
+    import os
+
+    parts = []
+    number = index // _FILES_PER_DIR
+
+    for _ in range(dir_depth):
+        parts.append('d{}'.format(number % _DIRS_PER_DIR))
+        number //= _DIRS_PER_DIR
+
+    return os.path.join(*parts, name)
+
+####################################################################################################
+
+def _get_header(index, includes):
+    """Return a header's content: some inline code, using the headers it includes."""
+    import os
+
+    calls = ''.join(' + h{}(x)'.format(os.path.basename(x)[1:-4]) for x in includes)
+
+    return (
+        '#pragma once\n'
+        + ''.join('#include "{}"\n'.format(x) for x in includes)
+        + 'template <typename T> struct H{0} {{ T value; T get() const {{ return value; }} }};\n'
+          'inline int h{0}(int x) {{ return H{0}<int>{{x * {0}}}.get(){1}; }}\n'.format(
+              index, calls))
+
+####################################################################################################
+
+def _get_source(index, includes):
+    """Return a source file's content: a function using the headers it includes."""
+    import os
+
+    calls = ''.join(' + h{}({})'.format(os.path.basename(x)[1:-4], index) for x in includes)
+
+    return (
+        ''.join('#include "{}"\n'.format(x) for x in includes)
+        + 'int s{}() {{ return 0{}; }}\n'.format(index, calls))
+
+####################################################################################################
+
+def _write(file, content):
+    """Write a file, creating its directory if needed."""
+    import os
+
+    os.makedirs(os.path.dirname(file), exist_ok=True)
+
+    with open(file, 'w') as stream:
+        stream.write(content)
+
+####################################################################################################
+
+def add_arguments(parser):
+    """
+    Add the generator's arguments to a parser.
+
+    :param parser: The parser to complete.
+    """
+    parser.add_argument(
+        '--headers', type=int, help='number of headers (half the source files by default)')
+    parser.add_argument('--fanout', type=int, default=4, help='headers included by each file')
+    parser.add_argument('--depth', type=int, default=3, help='levels of headers')
+    parser.add_argument('--dir-depth', type=int, default=2, help='levels of nested directories')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random inclusions')
+
+####################################################################################################
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('root', help='folder of the project to generate')
+    parser.add_argument('-n', '--sources', type=int, default=100, help='number of source files')
+
+    add_arguments(parser)
+
+    arguments = parser.parse_args()
+
+    generate(
+        arguments.root, arguments.sources,
+        arguments.headers if arguments.headers is not None else arguments.sources // 2,
+        arguments.fanout, arguments.depth, arguments.dir_depth, arguments.seed)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the graph engine ("codestacker.graph_tools"), on generated graphs of increasing sizes.
+"""
+
+####################################################################################################
+
+_HEADER = '{:>8} {:<8} {:>9} {:>9} {:>9} {:>9}'.format(
+    'nodes', 'shape', 'edges', 'dag (s)', 'order (s)', 'sets (s)')
+
+def run_benchmarks(sizes, fanout, seed=0):
+    """
+    Time the cycle detection, the topological ordering and the ready sets grouping, on a chain (the
+    deepest graph) and on a random DAG, for each size.
+
+    :param sizes: The numbers of nodes.
+    :param fanout: The number of children of each node, in the random DAG.
+    :param seed: The seed of the random DAG.
+
+    :returns: A list of results (one dictionary per size and shape).
+    """
+    import time
+
+    from codestacker.graph_tools import get_ready_sets, get_topological_ordering
+    from codestacker.graph_tools import is_directed_acyclic_graph
+
+    results = []
+
+    print(_HEADER)
+
+    for size in sizes:
+        for shape, graph in (('chain', _get_chain(size)), ('random', _get_dag(size, fanout, seed))):
+            result = {'size': size, 'shape': shape, 'edges': sum(len(x) for x in graph.values())}
+
+            for name, function in (
+                    ('dag', is_directed_acyclic_graph),
+                    ('order', get_topological_ordering),
+                    ('sets', get_ready_sets)):
+                start = time.perf_counter()
+
+                function(graph)
+
+                result[name] = time.perf_counter() - start
+
+            results.append(result)
+
+            print('{:>8} {:<8} {:>9} {:>9.3f} {:>9.3f} {:>9.3f}'.format(
+                size, shape, result['edges'], result['dag'], result['order'], result['sets']))
+
+    return results
+
+####################################################################################################
+
+def _get_chain(size):
+    """Return a graph where each node has the next one as only child."""
+    return {x: set([x + 1]) for x in range(size - 1)}
+
+####################################################################################################
+
+def _get_dag(size, fanout, seed):
+    """Return a random DAG, where each node has up to "fanout" children among the next nodes."""
+    import random
+
+    rng = random.Random(seed)
+
+    return {
+        x: set(rng.randrange(x + 1, size) for _ in range(min(fanout, size - x - 1)))
+        for x in range(size)}
+
+####################################################################################################
+
+if __name__ == '__main__':
+    import argparse
+    import json
+    import os
+    import sys
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[1000, 10000, 100000], help='numbers of nodes')
+    parser.add_argument('--fanout', type=int, default=4, help='children of each node')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random DAG')
+    parser.add_argument('--json', help='file to write the results in, as JSON')
+
+    arguments = vars(parser.parse_args())
+    json_file = arguments.pop('json')
+
+    results = run_benchmarks(**arguments)
+
+    if json_file is not None:
+        with open(json_file, 'w') as stream:
+            json.dump(results, stream, indent=2)
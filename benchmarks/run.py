@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark suite for CodeStacker: builds generated projects of increasing sizes, and reports the
+time spent by CodeStacker itself apart from the time spent by the compiler (and the linker).
+"""
+
+####################################################################################################
+
+# Categories of the traced spans spent in external tools.
+_TOOL_CATEGORIES = ('compile', 'link', 'precompile', 'scan')
+
+_HEADER = '{:>7} {:<16} {:>9} {:>9} {:>9} {:>9}'.format(
+    'N', 'scenario', 'compiled', 'wall (s)', 'tools (s)', 'own (s)')
+
+def run_benchmarks(sizes, jobs, headers=None, keep=None, **options):
+    """
+    Benchmark the cold build, the no-op build, and the builds after touching a header or a source
+    file, for each project size.
+
+    :param sizes: The numbers of source files of the projects.
+    :param jobs: The number of compilation jobs.
+    :param headers: The optional number of headers (half the source files by default).
+    :param keep: An optional folder to keep the projects in (a temporary one otherwise).
+    :param options: The other options of the generator (fanout, depth, etc.).
+
+    :returns: A list of results (one dictionary per size and scenario).
+    """
+    import os
+    import tempfile
+
+    from generate import generate
+
+    results = []
+
+    print(_HEADER)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in sizes:
+            root = os.path.join(keep or temp_dir, 'project_{}'.format(size))
+
+            sources, header_files = generate(
+                root, size, headers if headers is not None else size // 2, **options)
+
+            scenarios = [
+                ('cold', None),
+                ('no-op', None),
+                ('header touched', header_files[-1] if header_files else None),
+                ('source touched', sources[0] if sources else None)]
+
+            for scenario, touched in scenarios:
+                if touched is not None:
+                    _touch(touched)
+
+                result = _build(root, jobs)
+                result.update({'size': size, 'scenario': scenario})
+                results.append(result)
+
+                print('{:>7} {:<16} {:>9} {:>9.3f} {:>9.3f} {:>9.3f}'.format(
+                    size, scenario, result['compiled'], result['wall'], result['tools'],
+                    result['own']))
+
+    return results
+
+####################################################################################################
+
+def _build(root, jobs):
+    """
+    Build a project, and measure where the time went.
+
+    :param root: The project's folder.
+    :param jobs: The number of compilation jobs.
+
+    :returns: The wall time, the time with at least one tool running, the remaining time (spent by
+              CodeStacker itself, startup included), and the number of compiled units.
+    """
+    import json
+    import os
+    import subprocess
+    import sys
+    import time
+
+    trace_file = os.path.join(root, 'trace.json')
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    start = time.perf_counter()
+
+    subprocess.run(
+        [sys.executable, '-m', 'codestacker', '-j', str(jobs), '--trace', trace_file, 'build'],
+        cwd=root, env=env, stdout=subprocess.DEVNULL, check=True)
+
+    wall = time.perf_counter() - start
+
+    with open(trace_file, 'r') as stream:
+        events = [x for x in json.load(stream)['traceEvents'] if x['ph'] == 'X']
+
+    spans = sorted(
+        (x['ts'], x['ts'] + x['dur']) for x in events if x['cat'] in _TOOL_CATEGORIES)
+
+    tools = _get_union(spans) / 1e6
+
+    return {
+        'wall': wall,
+        'tools': tools,
+        'own': wall - tools,
+        'compiled': sum(1 for x in events if x['cat'] == 'compile')}
+
+####################################################################################################
+
+def _get_union(spans):
+    """
+    Return the total length of sorted spans, overlapping ones counted once.
+
+    :param spans: The (start, end) pairs, sorted.
+
+    :returns: The length.
+    """
+    total = 0
+    current_start, current_end = None, None
+
+    for start, end in spans:
+        if (current_end is None) or (start > current_end):
+            if current_end is not None:
+                total += current_end - current_start
+
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+
+    if current_end is not None:
+        total += current_end - current_start
+
+    return total
+
+####################################################################################################
+
+def _touch(file):
+    """Make a file newer than anything built so far."""
+    import os
+
+    # Not in the future: the outputs of the next build would look outdated too.
+    os.utime(file)
+
+####################################################################################################
+
+if __name__ == '__main__':
+    import argparse
+    import json
+    import os
+
+    from generate import add_arguments
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[100, 500, 1000],
+        help='numbers of source files of the projects to benchmark')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=os.cpu_count() or 1, help='number of compilation jobs')
+    parser.add_argument('--keep', help='folder to keep the generated projects in')
+    parser.add_argument('--json', help='file to write the results in, as JSON')
+
+    add_arguments(parser)
+
+    arguments = vars(parser.parse_args())
+    json_file = arguments.pop('json')
+
+    results = run_benchmarks(**arguments)
+
+    if json_file is not None:
+        with open(json_file, 'w') as stream:
+            json.dump(results, stream, indent=2)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of CodeStacker's startup: no-op builds of up-to-date generated projects, with and without
+the resolved configuration cached, compared to the startup of the Python interpreter alone.
+"""
+
+####################################################################################################
+
+_HEADER = '{:>7} {:<10} {:>10} {:>10} {:>10}'.format(
+    'N', 'scenario', 'best (s)', 'median (s)', 'own (s)')
+
+def run_benchmarks(sizes, runs, headers=None, **options):
+    """
+    Time the no-op builds of a project, for each project size: with the configuration resolved from
+    the blueprint (nothing cached), then with the cached one. The "own" time is the best one, minus
+    the interpreter's startup.
+
+    :param sizes: The numbers of source files of the projects.
+    :param runs: The number of runs of each scenario.
+    :param headers: The optional number of headers (half the source files by default).
+    :param options: The other options of the generator (fanout, depth, etc.).
+
+    :returns: A list of results (one dictionary per size and scenario).
+    """
+    import os
+    import subprocess
+    import sys
+    import tempfile
+
+    from generate import generate
+
+    results = []
+
+    print(_HEADER)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env['XDG_CACHE_HOME'] = os.path.join(temp_dir, 'cache')
+
+        baseline = min(_time([sys.executable, '-c', 'pass'], temp_dir, env, runs))
+
+        for size in sizes:
+            root = os.path.join(temp_dir, 'project_{}'.format(size))
+            command = [sys.executable, '-m', 'codestacker', 'build']
+
+            generate(root, size, headers if headers is not None else size // 2, **options)
+
+            # Built once, and its configuration cached.
+            subprocess.run(command, cwd=root, env=env, stdout=subprocess.DEVNULL, check=True)
+
+            for scenario, cached in (('resolved', False), ('cached', True)):
+                times = _time(command, root, env, runs, None if cached else env['XDG_CACHE_HOME'])
+
+                result = {
+                    'size': size,
+                    'scenario': scenario,
+                    'best': min(times),
+                    'median': sorted(times)[len(times) // 2],
+                    'own': min(times) - baseline}
+
+                results.append(result)
+
+                print('{:>7} {:<10} {:>10.3f} {:>10.3f} {:>10.3f}'.format(
+                    size, scenario, result['best'], result['median'], result['own']))
+
+    return results
+
+####################################################################################################
+
+def _time(command, cwd, env, runs, cache=None):
+    """
+    Time the runs of a command.
+
+    :param command: The command.
+    :param cwd: The folder to run it in.
+    :param env: The environment to run it with.
+    :param runs: The number of runs.
+    :param cache: An optional cache folder, deleted before each run.
+
+    :returns: The list of wall times.
+    """
+    import shutil
+    import subprocess
+    import time
+
+    times = []
+
+    for _ in range(runs):
+        if cache is not None:
+            shutil.rmtree(cache, ignore_errors=True)
+
+        start = time.perf_counter()
+
+        subprocess.run(command, cwd=cwd, env=env, stdout=subprocess.DEVNULL, check=True)
+
+        times.append(time.perf_counter() - start)
+
+    return times
+
+####################################################################################################
+
+if __name__ == '__main__':
+    import argparse
+    import json
+
+    from generate import add_arguments
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sizes', type=int, nargs='+', default=[10, 100, 1000],
+        help='numbers of source files of the projects to benchmark')
+    parser.add_argument('--runs', type=int, default=10, help='number of runs of each scenario')
+    parser.add_argument('--json', help='file to write the results in, as JSON')
+
+    add_arguments(parser)
+
+    arguments = vars(parser.parse_args())
+    json_file = arguments.pop('json')
+
+    results = run_benchmarks(**arguments)
+
+    if json_file is not None:
+        with open(json_file, 'w') as stream:
+            json.dump(results, stream, indent=2)
@@ -13,8 +13,13 @@ _DEFAULT_CONFIG = 'default'
 _FILE_DESC = '''specify the blueprint file to use; if not specified, the file "{}" will be used, if
                 it exists'''.format(_DEFAULT_FILE)
 _CONF_DESC = '''specify the configuration to use; if not specified, the configuration "{}" will be
-                used, if it exists'''.format(_DEFAULT_CONFIG)
+                used, if it exists. Given several times (or "{}" for all the configurations of the
+                blueprint), the configurations are built together'''
 _VERB_DESC = '''print more details about what the script is doing.'''
+_TRACE_DESC = '''write a timeline of the build (configuration loading, folders walks, scans,
+                 compilations and linking) in FILE, in the Chrome trace event format'''
+_JOBS_DESC = '''specify the number of compilation jobs to run simultaneously; if not specified, the
+                "jobs" key of the configuration will be used, or the number of CPUs'''
 
 def parse_args():
     """
@@ -27,18 +32,55 @@ def parse_args():
     import argparse
     import sys
 
+    from .config_inspector.retriever import ALL_CONFIGS
+
     parser = argparse.ArgumentParser(prog='codestacker')
     sub_parser = parser.add_subparsers(dest='command')
 
     parser.add_argument('-f', dest='file', default=_DEFAULT_FILE, help=_FILE_DESC)
-    parser.add_argument('-c', dest='config', default=_DEFAULT_CONFIG, help=_CONF_DESC)
+    parser.add_argument(
+        '-c', dest='config', action='append', metavar='CONFIG',
+        help=_CONF_DESC.format(_DEFAULT_CONFIG, ALL_CONFIGS))
     parser.add_argument('-v', dest='verbose', action='store_true', help=_VERB_DESC)
+    parser.add_argument('-j', '--jobs', dest='jobs', type=int, metavar='N', help=_JOBS_DESC)
+    parser.add_argument('--trace', dest='trace', metavar='FILE', help=_TRACE_DESC)
 
     # 'clean' argument.
-    sub_parser.add_parser('clean', help='clean the compilation results')
+    clean_parser = sub_parser.add_parser('clean', help='clean the compilation results')
+    clean_parser.add_argument(
+        'part', nargs='?', metavar='TARGET|FOLDER',
+        help='clean only the results of a target, or of a folder of sources')
 
     # 'build' argument.
-    sub_parser.add_parser('build', help='trigger the build process')
+    build_parser = sub_parser.add_parser('build', help='trigger the build process')
+    build_parser.add_argument(
+        '--changed', nargs='+', metavar='PATH',
+        help='only check the translation units affected by these files (as last indexed)')
+
+    # 'compile' argument.
+    compile_parser = sub_parser.add_parser(
+        'compile', help='compile source files, whether up to date or not, without linking')
+    compile_parser.add_argument('sources', nargs='+', metavar='SOURCE', help='files to compile')
+
+    # 'impact' argument.
+    impact_parser = sub_parser.add_parser(
+        'impact', help='list the translation units affected by files, with their rebuild cost')
+    impact_parser.add_argument('files', nargs='+', metavar='FILE', help='changed files')
+
+    # 'watch' argument.
+    sub_parser.add_parser('watch', help='build, then rebuild on every change until interrupted')
+
+    # 'daemon' argument.
+    daemon_parser = sub_parser.add_parser(
+        'daemon', help='manage the build daemon, serving the build commands')
+    daemon_parser.add_argument(
+        'action', choices=['start', 'stop', 'status', 'serve'],
+        help='start, stop or query the daemon, or serve in the foreground')
+
+    # 'cache' argument.
+    cache_parser = sub_parser.add_parser('cache', help='manage the compilation cache')
+    cache_parser.add_argument(
+        'action', choices=['stats', 'clear'], help='show the cache statistics, or clear the cache')
 
     # Parse the arguments.
     # May abort the script if unexpected arguments were passed.
@@ -49,4 +91,8 @@ def parse_args():
         parser.print_usage()
         sys.exit(0)
 
+    # Always a list of configurations.
+    if args.config is None:
+        args.config = [_DEFAULT_CONFIG]
+
     return vars(args)
@@ -12,44 +12,101 @@ def main():
     Script's main function.
     """
     import sys
+
+    from .args_parser import parse_args
+    from .daemon      import request_daemon
+
+    arguments = parse_args()
+
+    # Served by the daemon if it's running, in-process otherwise.
+    status = request_daemon(arguments)
+
+    sys.exit(run(arguments) if status is None else status)
+
+####################################################################################################
+
+def run(arguments, sessions=None):
+    """
+    Run the command passed to the script.
+
+    :param arguments: The arguments passed to CodeStacker (through CLI).
+    :param sessions: The optional configurations kept in memory from one command to the next (by
+                     the daemon).
+
+    :returns: The exit status.
+    """
     import traceback
 
-    from .args_parser                import parse_args
-    from .config_inspector.adaptor   import adapt_config
-    from .config_inspector.retriever import get_config
-    from .config_inspector.validator import validate_config
+    from .config_inspector.merger    import merge_configs
+    from .config_inspector.resolver  import resolve_config, resolve_config_names
     from .constants                  import keys
-    from .core.builder               import build
+    from .core.builder               import build, compile_sources
+    from .core.cache                 import manage_cache
     from .core.cleaner               import clean
+    from .core.index                 import show_impact
+    from .core.watcher               import watch
+    from .daemon                     import manage_daemon
     from .errors.exceptions          import Error
     from .logger                     import Logger
+    from .tracer                     import Tracer
 
-    arguments = parse_args()
+    if arguments.get('trace') is not None:
+        Tracer.start()
 
     try:
-        config = get_config(arguments)
+        if arguments['command'] == 'daemon':
+            manage_daemon(arguments['action'])
+        else:
+            names = resolve_config_names(arguments)
+            configs = []
+
+            for name in names:
+                if sessions is not None:
+                    configs.append(sessions.get_config(dict(arguments, config=name)))
+                else:
+                    configs.append(resolve_config(dict(arguments, config=name)))
 
-        validate_config(config)
-        adapt_config(config)
+            # Several configurations are built together: their compilations share one jobs pool.
+            if len(configs) == 1:
+                config = configs[0]
+            else:
+                config = merge_configs(dict(zip(names, configs)))
 
-        command = config[keys.COMMAND]
-        verbose = config[keys.VERBOSE]
+            command = config[keys.COMMAND]
+            verbose = config[keys.VERBOSE]
 
-        if command == 'build':
-            build(config, verbose)
-        elif command == 'clean':
-            clean(config)
+            if command == 'build':
+                build(config, verbose, arguments.get('changed'))
+            elif command == 'compile':
+                compile_sources(config, verbose, arguments['sources'])
+            elif command == 'impact':
+                show_impact(config, arguments['files'])
+            elif command == 'clean':
+                for config in configs:
+                    clean(config, arguments.get('part'))
+            elif command == 'watch':
+                watch(config, verbose)
+            elif command == 'cache':
+                for config in configs:
+                    manage_cache(config, config[keys.ACTION])
     except Error as error:
         error.print()
         Logger.abort('Aborting')
-        sys.exit(1)
+        return 1
     except KeyboardInterrupt:
         print()
         Logger.abort('Keyboard interruption')
-        sys.exit(1)
+        return 1
     except BaseException:
         traceback.print_exc()
-        sys.exit(1)
+        return 1
     else:
         Logger.close('End of script')
-        sys.exit(0)
+        return 0
+    finally:
+        # Failed builds included.
+        if Tracer.is_started():
+            try:
+                Tracer.save(arguments['trace'])
+            except Error as error:
+                error.print()
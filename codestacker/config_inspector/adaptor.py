@@ -7,12 +7,20 @@ Adapt the configuration.
 
 ####################################################################################################
 
+# In MiB.
+_DEFAULT_CACHE_SIZE = 5120
+
+# Compilation flags of the developer mode.
+_DEV_FLAGS = set(['-g', '-gsplit-dwarf'])
+
 def adapt_config(config):
     """
     Adapt a configuration to match process requirements (values, definition, etc.).
 
     :param config: The configuration to adapt.
     """
+    import os
+
     from codestacker.constants import keys
     from codestacker.logger    import Logger
 
@@ -22,14 +30,82 @@ def adapt_config(config):
     Logger.info('Adapt configuration keys')
 
     _adapt_path(root, config, keys.INCLUDE)
-    _adapt_path(root, config, keys.SOURCES)
+
+    if config.get(keys.TARGETS) is None:
+        _adapt_path(root, config, keys.SOURCES)
 
     _adapt_path(root, config, keys.BINARY, True)
     _adapt_path(root, config, keys.BUILD, True)
 
+    if config.get(keys.CACHE) is not None:
+        config[keys.CACHE] = os.path.expanduser(config[keys.CACHE])
+
+        _adapt_path(root, config, keys.CACHE, True)
+
     _turn_into_set(config, keys.FLAGS)
     _turn_into_set(config, keys.LIBRARIES)
 
+    _set_default(config, keys.CACHE_SIZE, _DEFAULT_CACHE_SIZE)
+    _set_default(config, keys.DETECTION, keys.DETECTION_TIMESTAMP)
+    _set_default(config, keys.DEV, False)
+    _set_default(config, keys.JOBS, os.cpu_count() or 1)
+    _set_default(config, keys.SCANNER, keys.SCANNER_PREPROCESSOR)
+    _set_default(config, keys.UNITY, False)
+
+    # Developer mode: split debug information, and the fastest linker installed.
+    if config[keys.DEV]:
+        config[keys.FLAGS] |= _DEV_FLAGS
+
+        _set_default(config, keys.LINKER, keys.LINKER_AUTO)
+
+    # A single executable by default.
+    _set_default(config, keys.TYPE, keys.TYPE_EXECUTABLE)
+    _set_default(config, keys.DEPENDS, [])
+
+    if config.get(keys.TARGETS) is not None:
+        _adapt_targets(config)
+
+####################################################################################################
+
+# Flag of the objects files of shared libraries.
+_PIC_FLAG = '-fPIC'
+
+def _adapt_targets(config):
+    """
+    Turn each target into a configuration of its own: the blueprint's keys, overridden (or
+    completed, for flags and libraries) by the target's ones. Each target is built in its own
+    sub-folder of the "build" folder.
+
+    :param config: The configuration to adapt.
+    """
+    import os
+
+    from codestacker.constants import keys
+
+    targets = {}
+
+    for name, target in config[keys.TARGETS].items():
+        target_config = {x: y for x, y in config.items() if x != keys.TARGETS}
+        target_config.update(target)
+
+        target_config[keys.TARGET] = name
+        target_config[keys.BUILD] = os.path.join(config[keys.BUILD], name)
+        target_config[keys.OUTPUT] = target.get(keys.OUTPUT, name)
+
+        _adapt_path(config[keys.ROOT], target_config, keys.SOURCES)
+        _adapt_path(config[keys.ROOT], target_config, keys.BUILD, True)
+
+        target_config[keys.FLAGS] = config[keys.FLAGS] | set(target.get(keys.FLAGS) or [])
+        target_config[keys.LIBRARIES] = (
+            config[keys.LIBRARIES] | set(target.get(keys.LIBRARIES) or []))
+
+        if target_config[keys.TYPE] == keys.TYPE_SHARED:
+            target_config[keys.FLAGS].add(_PIC_FLAG)
+
+        targets[name] = target_config
+
+    config[keys.TARGETS] = targets
+
 ####################################################################################################
 
 def _adapt_path(root, config, key, should_create=False):
@@ -72,3 +148,16 @@ def _turn_into_set(config, key):
     :param key: The key to transform.
     """
     config[key] = set() if key not in config else set(config[key])
+
+####################################################################################################
+
+def _set_default(config, key, value):
+    """
+    Give a default value to a configuration key (only if "None").
+
+    :param config: The configuration to operate on.
+    :param key: The key to set.
+    :param value: The default value.
+    """
+    if config.get(key) is None:
+        config[key] = value
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Merge several configurations into one, for them to be built together.
+"""
+
+####################################################################################################
+
+def merge_configs(configs):
+    """
+    Merge adapted configurations into a single one, holding the targets of all of them (named
+    "<configuration>:<target>"; a configuration without targets becomes a target itself). Their
+    compilations then run in one jobs pool, as many as the most of them allow.
+
+    :param configs: The configurations to merge (key = configuration name, value = configuration).
+
+    :returns: The merged configuration.
+
+    :raises FunctionalError: two targets share a build folder or an output.
+    """
+    from codestacker.constants         import keys
+    from codestacker.core.helpers      import get_output_file
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import FunctionalError
+
+    first = next(iter(configs.values()))
+
+    merged = {
+        keys.ACTION: first[keys.ACTION],
+        keys.COMMAND: first[keys.COMMAND],
+        keys.CONFIGS: list(configs),
+        keys.JOBS: max(x[keys.JOBS] for x in configs.values()),
+        keys.ROOT: first[keys.ROOT],
+        keys.VERBOSE: first[keys.VERBOSE],
+        keys.TARGETS: {}}
+
+    paths = set()
+
+    for config_name, config in configs.items():
+        targets = config.get(keys.TARGETS) or {None: config}
+
+        for name, target in targets.items():
+            # Copied: the configuration itself is left as is (e.g. kept by the daemon).
+            target = dict(target)
+            target[keys.TARGET] = _get_name(config_name, name)
+            target[keys.DEPENDS] = [_get_name(config_name, x) for x in target[keys.DEPENDS]]
+
+            for path in (target[keys.BUILD], get_output_file(target)):
+                if path in paths:
+                    raise FunctionalError(errors.CONFIGS_CLASH, path)
+
+                paths.add(path)
+
+            merged[keys.TARGETS][target[keys.TARGET]] = target
+
+    return merged
+
+####################################################################################################
+
+def _get_name(config_name, name):
+    """Return the name of a target in the merged configuration ("None" for a whole one)."""
+    return config_name if name is None else '{}:{}'.format(config_name, name)
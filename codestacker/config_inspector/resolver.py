@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Resolve a configuration (retrieve, validate and adapt it), once per version of the blueprint: the
+resolved configuration is cached, and reused as long as the blueprint is unchanged.
+"""
+
+####################################################################################################
+
+# Changed whenever the resolved configuration's layout does.
+_CACHE_FORMAT = 1
+
+def resolve_config(arguments):
+    """
+    Return the configuration matching the arguments, ready to use. The resolved configuration is
+    cached per blueprint (path), configuration name and jobs, and reused as long as the blueprint
+    has the same size, modification time and contents.
+
+    :param arguments: The arguments passed to CodeStacker (through CLI).
+
+    :returns: The configuration.
+
+    :raises TechnicalError: an input folder of the cached configuration is non-existent.
+    """
+    from .adaptor              import adapt_config
+    from .retriever            import get_config
+    from .validator            import validate_config
+    from codestacker.constants import keys
+    from codestacker.logger    import Logger
+    from codestacker.tracer    import Tracer
+
+    cache_file, signature = _get_cache_entry(arguments)
+
+    with Tracer.span('Load cached configuration', 'config'):
+        config = _load_cached_config(cache_file, signature)
+
+    if config is not None:
+        Logger.info('Configuration "{}" unchanged: resolved once already'.format(
+            arguments['config']))
+
+        # The folders the adaptation would have checked, or created.
+        for target in [config, *config.get(keys.TARGETS, {}).values()]:
+            _check_folders(target)
+
+        config[keys.ACTION] = arguments.get('action')
+        config[keys.COMMAND] = arguments['command']
+        config[keys.VERBOSE] = arguments['verbose']
+
+        return config
+
+    with Tracer.span('Load configuration', 'config'):
+        config = get_config(arguments)
+
+    with Tracer.span('Validate configuration', 'config'):
+        validate_config(config)
+
+    with Tracer.span('Adapt configuration', 'config'):
+        adapt_config(config)
+
+    if signature is not None:
+        _save_cached_config(cache_file, signature, config)
+
+    return config
+
+####################################################################################################
+
+def resolve_config_names(arguments):
+    """
+    Return the names of the configurations to operate on, as "get_config_names" does. All the
+    configurations' names (for "all") are cached like the resolved configurations, for the blueprint
+    not to be parsed again while it's unchanged.
+
+    :param arguments: The arguments passed to CodeStacker (through CLI).
+
+    :returns: A list of configuration names, without duplicates.
+    """
+    from .retriever import ALL_CONFIGS, get_config_names
+
+    if ALL_CONFIGS not in arguments['config']:
+        return get_config_names(arguments)
+
+    # Keyed apart from any configuration's name.
+    cache_file, signature = _get_cache_entry(dict(arguments, config=[ALL_CONFIGS]))
+    names = _load_cached_config(cache_file, signature)
+
+    if names is None:
+        names = get_config_names(arguments)
+
+        if signature is not None:
+            _save_cached_config(cache_file, signature, names)
+
+    return names
+
+####################################################################################################
+
+def _get_cache_entry(arguments):
+    """
+    Return where the resolved configuration matching the arguments is cached, and the signature of
+    the blueprint it must have been resolved from.
+
+    :param arguments: The arguments passed to CodeStacker (through CLI).
+
+    :returns: The cache file, and the blueprint's signature ("None" if it's unreadable).
+    """
+    import hashlib
+    import os
+
+    import codestacker
+
+    blueprint = os.path.realpath(arguments['file'])
+
+    key = hashlib.blake2b(
+        repr((blueprint, arguments['config'], arguments.get('jobs'))).encode(), digest_size=16)
+
+    cache_file = os.path.join(_get_cache_folder(), key.hexdigest() + '.pickle')
+
+    try:
+        with open(blueprint, 'rb') as stream:
+            status = os.fstat(stream.fileno())
+            content = stream.read()
+    except OSError:
+        return cache_file, None
+
+    return cache_file, (
+        codestacker.__version__, _CACHE_FORMAT, status.st_size, status.st_mtime_ns,
+        hashlib.blake2b(content).hexdigest())
+
+####################################################################################################
+
+def _get_cache_folder():
+    """Return the folder of the cached configurations."""
+    import os
+
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+
+    return os.path.join(cache_home, 'codestacker', 'configs')
+
+####################################################################################################
+
+def _load_cached_config(cache_file, signature):
+    """
+    Load a cached configuration.
+
+    :param cache_file: The cache file.
+    :param signature: The signature the blueprint must have had.
+
+    :returns: The configuration, or "None" if not cached (or out of date).
+    """
+    import pickle
+
+    if signature is None:
+        return None
+
+    try:
+        with open(cache_file, 'rb') as stream:
+            cached_signature, config = pickle.load(stream)
+    except Exception:
+        # Missing, truncated or left by another version: resolved again.
+        return None
+
+    return config if cached_signature == signature else None
+
+####################################################################################################
+
+def _save_cached_config(cache_file, signature, config):
+    """
+    Cache a resolved configuration (failures are ignored: the configuration is resolved again next
+    time).
+
+    :param cache_file: The cache file.
+    :param signature: The signature of the blueprint it was resolved from.
+    :param config: The configuration.
+    """
+    import os
+    import pickle
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+
+        # Written aside, then renamed: concurrent runs never read half a file.
+        descriptor, temp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file))
+
+        with os.fdopen(descriptor, 'wb') as stream:
+            pickle.dump((signature, config), stream, pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+####################################################################################################
+
+def _check_folders(config):
+    """
+    Check that the input folders of a configuration exist, and create its output folders if missing.
+
+    :param config: The configuration to check.
+
+    :raises TechnicalError: an input folder is non-existent.
+    """
+    import os
+
+    from codestacker.constants         import keys
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import TechnicalError
+
+    for key in (keys.INCLUDE, keys.SOURCES):
+        if (config.get(key) is not None) and (not os.path.exists(config[key])):
+            raise TechnicalError(errors.FOLDER_NOT_FOUND, config[key])
+
+    for key in (keys.BINARY, keys.BUILD, keys.CACHE):
+        if config.get(key) is not None:
+            os.makedirs(config[key], exist_ok=True)
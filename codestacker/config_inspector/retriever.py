@@ -7,6 +7,27 @@ Retrieve a configuration.
 
 ####################################################################################################
 
+# Configuration name standing for all the configurations of the blueprint.
+ALL_CONFIGS = 'all'
+
+def get_config_names(arguments):
+    """
+    Return the names of the configurations to operate on, as given by the arguments: all the
+    configurations of the blueprint, if "all" is given.
+
+    :param arguments: The arguments passed to CodeStacker (through CLI).
+
+    :returns: A list of configuration names, without duplicates.
+    """
+    from codestacker.system.yaml_handler import load_yaml
+
+    if ALL_CONFIGS in arguments['config']:
+        return sorted(load_yaml(arguments['file']))
+
+    return list(dict.fromkeys(arguments['config']))
+
+####################################################################################################
+
 def get_config(arguments):
     """
     Extract the wished configuration, based on the arguments in input.
@@ -30,8 +51,13 @@ def get_config(arguments):
         raise TechnicalError(errors.CONFIG_NOT_FOUND, arguments['config'])
 
     # Add those special keys to the configuration, for later processing.
+    config[keys.ACTION] = arguments.get('action')
     config[keys.COMMAND] = arguments['command']
     config[keys.ROOT] = os.path.realpath(os.path.dirname(arguments['file']))
     config[keys.VERBOSE] = arguments['verbose']
 
+    # The command line takes precedence over the blueprint.
+    if arguments.get('jobs') is not None:
+        config[keys.JOBS] = arguments['jobs']
+
     return config
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for merger.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestMerger(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        self.debug = {
+            '_action': None,
+            '_command': 'build',
+            '_root': '/project',
+            '_verbose': False,
+            'binary': '/project/bin/debug',
+            'build': '/project/build/debug',
+            'depends': [],
+            'jobs': 2,
+            'output': 'App',
+            'type': 'executable'}
+
+        self.release = {
+            '_action': None,
+            '_command': 'build',
+            '_root': '/project',
+            '_verbose': False,
+            'binary': '/project/bin/release',
+            'build': '/project/build/release',
+            'depends': [],
+            'jobs': 4,
+            'targets': {
+                'core': {
+                    'binary': '/project/bin/release',
+                    'build': '/project/build/release/core',
+                    'depends': [],
+                    'output': 'core',
+                    '_target': 'core',
+                    'type': 'static'},
+                'app': {
+                    'binary': '/project/bin/release',
+                    'build': '/project/build/release/app',
+                    'depends': ['core'],
+                    'output': 'App',
+                    '_target': 'app',
+                    'type': 'executable'}}}
+
+    def test_merge_configs(self):
+        """Test the merge of several configurations."""
+        from codestacker.config_inspector.merger import merge_configs
+
+        merged = merge_configs({'debug': self.debug, 'release': self.release})
+
+        self.assertEqual(4, merged['jobs'])
+        self.assertEqual(['debug', 'release:core', 'release:app'], list(merged['targets']))
+        self.assertEqual(['release:core'], merged['targets']['release:app']['depends'])
+
+        # The configurations themselves are left as is.
+        self.assertEqual(['core'], self.release['targets']['app']['depends'])
+        self.assertNotIn('_target', self.debug)
+
+    def test_merge_clashing_configs(self):
+        """Test the merge of configurations building into the same folder."""
+        from codestacker.config_inspector.merger import merge_configs
+        from codestacker.errors                  import errors
+        from codestacker.errors.exceptions       import FunctionalError
+
+        self.release['targets']['app']['build'] = self.debug['build']
+
+        with self.assertRaises(FunctionalError) as context:
+            merge_configs({'debug': self.debug, 'release': self.release})
+
+        context.exception.print()
+        self.assertEqual(context.exception.args[0], errors.CONFIGS_CLASH)
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for resolver.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestResolver(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        os.makedirs(os.path.join(root, 'src'))
+
+        self.blueprint = os.path.join(root, 'blueprint.yaml')
+        self._write_blueprint('Foo')
+
+        self.arguments = {
+            'file': self.blueprint,
+            'command': 'build',
+            'config': 'default',
+            'verbose': False}
+
+        # Cached configurations kept in the temporary folder.
+        self.environ = dict(os.environ)
+        os.environ['XDG_CACHE_HOME'] = os.path.join(root, 'cache')
+
+    def tearDown(self):
+        """Tear down."""
+        import os
+
+        os.environ.clear()
+        os.environ.update(self.environ)
+
+        self.temp_dir.cleanup()
+
+    def _write_blueprint(self, output):
+        """Write the blueprint, with the same modification time whatever the output's name."""
+        import os
+
+        with open(self.blueprint, 'w') as stream:
+            stream.write(
+                'default:\n  binary: bin\n  build: build\n  include: src\n  sources: src\n'
+                '  output: {}\n'.format(output))
+
+        os.utime(self.blueprint, ns=(0, 0))
+
+    def test_resolve_config(self):
+        """Test the caching of resolved configurations."""
+        import os
+        import shutil
+
+        from codestacker.config_inspector.resolver import resolve_config
+        from codestacker.errors.exceptions         import TechnicalError
+
+        config = resolve_config(self.arguments)
+
+        self.assertEqual('Foo', config['output'])
+        self.assertEqual(1, len(os.listdir(os.environ['XDG_CACHE_HOME'] + '/codestacker/configs')))
+
+        # Cached, the output folders being created again if needed.
+        shutil.rmtree(config['build'])
+
+        cached = resolve_config(dict(self.arguments, command='clean'))
+
+        self.assertEqual('clean', cached['_command'])
+        self.assertEqual(config['flags'], cached['flags'])
+        self.assertTrue(os.path.isdir(cached['build']))
+
+        # Cached, but the input folders are checked again.
+        os.rename(config['sources'], config['sources'] + '.old')
+
+        with self.assertRaises(TechnicalError):
+            resolve_config(self.arguments)
+
+        os.rename(config['sources'] + '.old', config['sources'])
+
+        # Same size and modification time, but another content.
+        self._write_blueprint('Bar')
+
+        self.assertEqual('Bar', resolve_config(self.arguments)['output'])
+
+    def test_resolve_config_names(self):
+        """Test the caching of the configurations' names."""
+        from unittest import mock
+
+        from codestacker.config_inspector.resolver import resolve_config_names
+
+        arguments = dict(self.arguments, config=['all'])
+
+        self.assertEqual(['default'], resolve_config_names(arguments))
+
+        # Cached: the blueprint isn't parsed again.
+        with mock.patch('codestacker.system.yaml_handler.load_yaml') as load_yaml:
+            self.assertEqual(['default'], resolve_config_names(arguments))
+            self.assertEqual(['release'], resolve_config_names(dict(arguments, config=['release'])))
+
+        load_yaml.assert_not_called()
+
+        # Same size and modification time, but another content.
+        with open(self.blueprint) as stream:
+            content = stream.read().replace('default:', 'release:')
+
+        with open(self.blueprint, 'w') as stream:
+            stream.write(content)
+
+        self.assertEqual(['release'], resolve_config_names(arguments))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -45,6 +45,19 @@ class TestRetriever(unittest.TestCase):
         context.exception.print()
         self.assertEqual(context.exception.args[0], errors.CONFIG_NOT_FOUND)
 
+    def test_get_config_names(self):
+        """Test the names of the configurations given on the command line."""
+        from codestacker.config_inspector.retriever import get_config_names
+
+        arguments = dict(self.arguments_good, config=['release', 'debug', 'release'])
+
+        self.assertEqual(['release', 'debug'], get_config_names(arguments))
+
+        # All the configurations of the blueprint.
+        arguments = dict(self.arguments_good, config=['debug', 'all'])
+
+        self.assertEqual(['default'], get_config_names(arguments))
+
 ####################################################################################################
 
 if __name__ == '__main__':
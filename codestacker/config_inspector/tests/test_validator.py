@@ -59,6 +59,23 @@ class TestValidator(unittest.TestCase):
             'output': 'Test',
             'sources': '$flags'}
 
+        self.config_invalid_jobs = {
+            'binary': 'bin',
+            'build': 'build',
+            'include': 'src',
+            'jobs': 0,
+            'output': 'Test',
+            'sources': 'src'}
+
+        self.config_targets = {
+            'binary': 'bin',
+            'build': 'build',
+            'include': 'include',
+            'project': 'src',
+            'targets': {
+                'core': {'sources': '$project/core', 'type': 'static'},
+                'app': {'sources': '$project/app', 'depends': ['core']}}}
+
     def test_validate_sources(self):
         """Test configuration validity."""
         from codestacker.config_inspector.validator import validate_config
@@ -99,6 +116,66 @@ class TestValidator(unittest.TestCase):
         context.exception.print()
         self.assertEqual(context.exception.args[0], errors.WRONG_VAR_TYPE)
 
+        # Invalid number of jobs.
+        with self.assertRaises(FunctionalError) as context:
+            validate_config(self.config_invalid_jobs)
+
+        context.exception.print()
+        self.assertEqual(context.exception.args[0], errors.INVALID_JOBS)
+
+    def test_validate_targets(self):
+        """Test targets validity."""
+        import copy
+
+        from codestacker.config_inspector.validator import validate_config
+        from codestacker.constants                  import keys
+        from codestacker.errors                     import errors
+        from codestacker.errors.exceptions          import FunctionalError
+
+        # Valid targets (no "output" nor "sources" at top level), variables substituted.
+        config = copy.deepcopy(self.config_targets)
+
+        validate_config(config)
+
+        self.assertEqual('src/core', config[keys.TARGETS]['core'][keys.SOURCES])
+
+        # Undefined target.
+        config = copy.deepcopy(self.config_targets)
+        config[keys.TARGETS]['app'][keys.DEPENDS] = ['gui']
+
+        with self.assertRaises(FunctionalError) as context:
+            validate_config(config)
+
+        self.assertEqual(context.exception.args[0], errors.UNDEFINED_TARGET)
+
+        # Executable depended on.
+        config = copy.deepcopy(self.config_targets)
+        config[keys.TARGETS]['tool'] = {'sources': 'src/tool', 'depends': ['app']}
+
+        with self.assertRaises(FunctionalError) as context:
+            validate_config(config)
+
+        self.assertEqual(context.exception.args[0], errors.EXECUTABLE_DEPENDENCY)
+
+        # Cyclic dependencies.
+        config = copy.deepcopy(self.config_targets)
+        config[keys.TARGETS]['app'][keys.TYPE] = 'shared'
+        config[keys.TARGETS]['core'][keys.DEPENDS] = ['app']
+
+        with self.assertRaises(FunctionalError) as context:
+            validate_config(config)
+
+        self.assertEqual(context.exception.args[0], errors.TARGET_GRAPH_ERROR)
+
+        # Unknown type.
+        config = copy.deepcopy(self.config_targets)
+        config[keys.TARGETS]['core'][keys.TYPE] = 'module'
+
+        with self.assertRaises(FunctionalError) as context:
+            validate_config(config)
+
+        self.assertEqual(context.exception.args[0], errors.WRONG_KEY_VALUE)
+
 ####################################################################################################
 
 if __name__ == '__main__':
@@ -29,17 +29,106 @@ def _check_keys(config):
     :param config: The configuration to operate on.
     """
     from codestacker.constants import keys
+    from codestacker.errors    import errors
 
     # Mandatory attributes.
     _check_key(keys.BINARY, config.get(keys.BINARY), str)
     _check_key(keys.BUILD, config.get(keys.BUILD), str)
     _check_key(keys.INCLUDE, config.get(keys.INCLUDE), str)
-    _check_key(keys.OUTPUT, config.get(keys.OUTPUT), str)
-    _check_key(keys.SOURCES, config.get(keys.SOURCES), str)
+
+    # Either a single executable, or several targets.
+    _check_key(keys.TARGETS, config.get(keys.TARGETS), dict, True)
+
+    if config.get(keys.TARGETS) is None:
+        _check_key(keys.OUTPUT, config.get(keys.OUTPUT), str)
+        _check_key(keys.SOURCES, config.get(keys.SOURCES), str)
+    else:
+        _check_targets(config[keys.TARGETS])
 
     # Optional attributes.
+    _check_key(keys.CACHE, config.get(keys.CACHE), str, True)
+    _check_key(keys.CACHE_SIZE, config.get(keys.CACHE_SIZE), int, True)
+    _check_key(keys.DETECTION, config.get(keys.DETECTION), str, True)
+    _check_key(keys.DEV, config.get(keys.DEV), bool, True)
     _check_key(keys.FLAGS, config.get(keys.FLAGS), list, True)
+    _check_key(keys.JOBS, config.get(keys.JOBS), int, True)
     _check_key(keys.LIBRARIES, config.get(keys.LIBRARIES), list, True)
+    _check_key(keys.LINKER, config.get(keys.LINKER), str, True)
+    _check_key(keys.PCH, config.get(keys.PCH), (str, list), True)
+    _check_key(keys.SCANNER, config.get(keys.SCANNER), str, True)
+    _check_key(keys.SHARDS, config.get(keys.SHARDS), int, True)
+    _check_key(keys.UNITY, config.get(keys.UNITY), bool, True)
+
+    _check_positive(config.get(keys.CACHE_SIZE), errors.INVALID_CACHE_SIZE)
+    _check_positive(config.get(keys.JOBS), errors.INVALID_JOBS)
+    _check_positive(config.get(keys.SHARDS), errors.INVALID_SHARDS)
+    _check_value(
+        keys.DETECTION, config.get(keys.DETECTION),
+        (keys.DETECTION_TIMESTAMP, keys.DETECTION_CONTENT), True)
+    _check_value(
+        keys.LINKER, config.get(keys.LINKER),
+        (keys.LINKER_AUTO, keys.LINKER_BFD, keys.LINKER_GOLD, keys.LINKER_LLD, keys.LINKER_MOLD),
+        True)
+    _check_value(
+        keys.SCANNER, config.get(keys.SCANNER),
+        (keys.SCANNER_PREPROCESSOR, keys.SCANNER_BUILTIN, keys.SCANNER_VERIFY), True)
+
+    if isinstance(config.get(keys.PCH), str):
+        _check_value(keys.PCH, config[keys.PCH], (keys.PCH_AUTO,))
+
+####################################################################################################
+
+def _check_targets(targets):
+    """
+    Perform presence and type checks on the targets' keys, and check their dependencies.
+
+    :param targets: The targets to check (key = name, value = keys).
+
+    :raises FunctionalError: a target is invalid, or depends on an invalid target.
+    """
+    import re
+
+    from codestacker.constants         import keys
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import FunctionalError, GraphError
+    from codestacker.graph_tools       import is_directed_acyclic_graph
+
+    graph = {}
+
+    for name, target in targets.items():
+        # Also the name of the target's folder in the "build" one.
+        if (not isinstance(name, str)) or (re.search(r'^\w+$', name) is None):
+            raise FunctionalError(errors.INVALID_TARGET_NAME, name)
+
+        _check_key('{}: {}'.format(keys.TARGETS, name), target, dict)
+
+        _check_key(keys.SOURCES, target.get(keys.SOURCES), str)
+        _check_key(keys.DEPENDS, target.get(keys.DEPENDS), list, True)
+        _check_key(keys.FLAGS, target.get(keys.FLAGS), list, True)
+        _check_key(keys.LIBRARIES, target.get(keys.LIBRARIES), list, True)
+        _check_key(keys.OUTPUT, target.get(keys.OUTPUT), str, True)
+        _check_key(keys.TYPE, target.get(keys.TYPE), str, True)
+
+        _check_value(
+            keys.TYPE, target.get(keys.TYPE),
+            (keys.TYPE_EXECUTABLE, keys.TYPE_STATIC, keys.TYPE_SHARED), True)
+
+        graph[name] = set(target.get(keys.DEPENDS) or [])
+
+    for dependencies in graph.values():
+        for dependency in dependencies:
+            if dependency not in targets:
+                raise FunctionalError(errors.UNDEFINED_TARGET, dependency)
+
+            # Nothing to link against.
+            if targets[dependency].get(keys.TYPE, keys.TYPE_EXECUTABLE) == keys.TYPE_EXECUTABLE:
+                raise FunctionalError(errors.EXECUTABLE_DEPENDENCY, dependency)
+
+    try:
+        is_directed_acyclic_graph(graph)
+    except GraphError as error:
+        raise FunctionalError(
+            errors.TARGET_GRAPH_ERROR, '{}: {}'.format(error.args[0], error.args[1]))
 
 ####################################################################################################
 
@@ -64,6 +153,44 @@ def _check_key(key, value, key_type, optional=False):
 
 ####################################################################################################
 
+def _check_value(key, value, allowed_values, optional=False):
+    """
+    Check that a key's value is among the allowed ones.
+
+    :param key: The key to check.
+    :param value: The value to check.
+    :param allowed_values: The allowed values.
+    :param optional: An optional boolean to check... optional keys.
+
+    :raises FunctionalError: the value is not allowed.
+    """
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import FunctionalError
+
+    if (value is None) and optional:
+        return
+
+    if value not in allowed_values:
+        raise FunctionalError(errors.WRONG_KEY_VALUE, '{}: {}'.format(key, value))
+
+####################################################################################################
+
+def _check_positive(value, error):
+    """
+    Check that a number (if any) is a positive integer.
+
+    :param value: The number to check.
+    :param error: The error to raise with.
+
+    :raises FunctionalError: the number is not strictly positive.
+    """
+    from codestacker.errors.exceptions import FunctionalError
+
+    if (value is not None) and (isinstance(value, bool) or value < 1):
+        raise FunctionalError(error, value)
+
+####################################################################################################
+
 def _check_and_substitute_vars(config):
     """
     Check if variables are well-defined (type + existence), and proceed with variables substitution.
@@ -75,6 +202,7 @@ def _check_and_substitute_vars(config):
     """
     import re
 
+    from codestacker.constants         import keys
     from codestacker.errors            import errors
     from codestacker.errors.exceptions import FunctionalError, GraphError
     from codestacker.graph_tools       import is_directed_acyclic_graph, get_topological_ordering
@@ -105,7 +233,8 @@ def _check_and_substitute_vars(config):
     try:
         is_directed_acyclic_graph(all_vars)
     except GraphError as error:
-        raise FunctionalError(errors.VAR_GRAPH_ERROR, error.args[0])
+        raise FunctionalError(
+            errors.VAR_GRAPH_ERROR, '{}: {}'.format(error.args[0], error.args[1]))
 
     # Based on their topological ordering, proceed with the substitutions.
     for var in get_topological_ordering(all_vars):
@@ -114,3 +243,17 @@ def _check_and_substitute_vars(config):
                 continue
 
             config[key] = config[key].replace('${}'.format(var), config[var])
+
+    # Targets' keys may reference the (now substituted) variables too.
+    for target in (config.get(keys.TARGETS) or {}).values():
+        for key, value in target.items():
+            if not isinstance(value, str):
+                continue
+
+            for var in pattern.findall(value):
+                if var not in config:
+                    raise FunctionalError(errors.UNDEFINED_VAR, var)
+                elif not isinstance(config[var], str):
+                    raise FunctionalError(errors.WRONG_VAR_TYPE, var)
+
+            target[key] = pattern.sub(lambda match: config[match.group(1)], value)
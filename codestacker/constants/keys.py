@@ -6,15 +6,51 @@ Configuration keys.
 """
 
 # Special keys.
+ACTION = '_action'
 COMMAND = '_command'
+CONFIGS = '_configs'
 ROOT = '_root'
+SCANS = '_scans'
+SNAPSHOT = '_snapshot'
+STATE = '_state'
+TARGET = '_target'
+UNITS = '_units'
 VERBOSE = '_verbose'
 
 # Common keys.
 BINARY = 'binary'
 BUILD = 'build'
+CACHE = 'cache'
+CACHE_SIZE = 'cache_size'
+DEPENDS = 'depends'
+DETECTION = 'detection'
+DEV = 'dev'
 FLAGS = 'flags'
 INCLUDE = 'include'
+JOBS = 'jobs'
 LIBRARIES = 'libraries'
+LINKER = 'linker'
 OUTPUT = 'output'
+PCH = 'pch'
+SCANNER = 'scanner'
+SHARDS = 'shards'
 SOURCES = 'sources'
+TARGETS = 'targets'
+TYPE = 'type'
+UNITY = 'unity'
+
+# Keys values.
+DETECTION_CONTENT = 'content'
+DETECTION_TIMESTAMP = 'timestamp'
+LINKER_AUTO = 'auto'
+LINKER_BFD = 'bfd'
+LINKER_GOLD = 'gold'
+LINKER_LLD = 'lld'
+LINKER_MOLD = 'mold'
+PCH_AUTO = 'auto'
+SCANNER_BUILTIN = 'builtin'
+SCANNER_PREPROCESSOR = 'preprocessor'
+SCANNER_VERIFY = 'verify'
+TYPE_EXECUTABLE = 'executable'
+TYPE_SHARED = 'shared'
+TYPE_STATIC = 'static'
@@ -7,30 +7,104 @@ Compilation + linking.
 
 ####################################################################################################
 
-def build(config, verbose):
+def build(config, verbose, changed=None):
     """
-    Build the project (compile + link).
+    Build the project (compile + link): the translation units of all the targets are compiled
+    together, then the targets are linked level by level, each one after the ones it depends on.
+    The linking time and the critical path of the build are reported at the end (the latter, as
+    estimated and as measured).
 
     :param config: The configuration to operate on.
+    :param verbose: The boolean flag to output the commands.
+    :param changed: The optional files known to have changed: only the translation units they affect
+                    may be recompiled (by default, all of them).
     """
-    from codestacker.logger import Logger
+    from .critical_path        import get_critical_path
+    from .helpers              import get_targets, share_scans
+    from .state                import load_states, save_state
+    from codestacker.constants import keys
+    from codestacker.logger    import Logger
 
     Logger.begin('Building...')
 
-    _check_prerequisites(config)
+    targets = get_targets(config)
+
+    # Already loaded by the previous build, in watch mode.
+    load_states(targets)
+    share_scans(targets)
+
+    _check_prerequisites(config, targets)
 
-    _compile(config, verbose)
-    _link(config, verbose)
+    # Checked before compiling anything (per target: they may come from several configurations).
+    linkers = {x.get(keys.TARGET): _get_linker(x) for x in targets}
+
+    try:
+        estimate, durations, phase = _compile(config, verbose, changed)
+        link_durations, link_phases = _link(config, verbose, linkers)
+    finally:
+        for target in targets:
+            save_state(target)
+
+    if link_durations:
+        Logger.info('Linking time: {:.2f}s ({} linker)'.format(
+            sum(link_durations.values()),
+            ', '.join(sorted(set(x or 'default' for x in linkers.values())))))
+
+    if durations or link_durations:
+        phases = ([phase] if durations else []) + link_phases
+        length, path = get_critical_path(config, durations, link_durations, phases)
+
+        # No estimate without the durations of a previous build.
+        if estimate[0]:
+            Logger.info('Critical path: {:.2f}s (estimated: {:.2f}s): {}'.format(
+                length, estimate[0], ' > '.join(path)))
+        else:
+            Logger.info('Critical path: {:.2f}s: {}'.format(length, ' > '.join(path)))
 
     Logger.end('Done')
 
 ####################################################################################################
 
-def _check_prerequisites(config):
+def compile_sources(config, verbose, sources):
+    """
+    Compile source files (along with the batch including them, in a unity build), whether up to
+    date or not, without linking: e.g. from an editor, when saving a file.
+
+    :param config: The configuration to operate on.
+    :param verbose: The boolean flag to output the commands.
+    :param sources: The source files to compile.
+    """
+    import os
+
+    from .helpers           import get_targets, share_scans
+    from .state             import load_states, save_state
+    from codestacker.logger import Logger
+
+    Logger.begin('Compiling...')
+
+    targets = get_targets(config)
+
+    load_states(targets)
+    share_scans(targets)
+
+    _check_prerequisites(config, targets)
+
+    try:
+        _compile(config, verbose, None, set(os.path.normpath(os.path.abspath(x)) for x in sources))
+    finally:
+        for target in targets:
+            save_state(target)
+
+    Logger.end('Done')
+
+####################################################################################################
+
+def _check_prerequisites(config, targets):
     """
     Check if headers and sources filenames are valid.
 
     :param config: The configuration to operate on.
+    :param targets: The targets' configurations.
     """
     import re
 
@@ -42,119 +116,400 @@ def _check_prerequisites(config):
 
     Logger.info('Check headers and sources')
 
-    check_files(config[keys.INCLUDE], extensions.HEADERS)
-    check_files(config[keys.SOURCES], extensions.SOURCES)
+    # Each include folder once (several configurations may share one).
+    includes = {x[keys.INCLUDE]: x[keys.SNAPSHOT] for x in targets}
 
-    if re.search(r'^\w+$', config[keys.OUTPUT]) is None:
-        raise FunctionalError(errors.INVALID_OUTPUT_NAME)
+    for include_dir, snapshot in includes.items():
+        check_files(include_dir, extensions.HEADERS, snapshot)
 
-####################################################################################################
+    for target in targets:
+        check_files(target[keys.SOURCES], extensions.SOURCES, target[keys.SNAPSHOT])
+
+        if re.search(r'^\w+$', target[keys.OUTPUT]) is None:
+            raise FunctionalError(errors.INVALID_OUTPUT_NAME, target[keys.OUTPUT])
 
-_SPECIAL_FLAG = '-fdiagnostics-color=always'
+####################################################################################################
 
-def _compile(config, verbose):
+def _compile(config, verbose, changed, sources=None):
     """
-    Compile the source files into object files.
+    Compile the source files of all the targets into object files.
 
     :param config: The configuration to operate on.
     :param verbose: The boolean flag to output compilation command.
+    :param changed: The files known to have changed ("None" if unknown): only the translation units
+                    they affect may be recompiled.
+    :param sources: The optional set of source files (normalized) to compile, whether up to date or
+                    not; the other ones aren't compiled.
+
+    :returns: The estimated critical path, the compilations' durations (key = (target name, source
+              file)), and how long they took altogether.
 
-    :raises TechnicalError: a source file compilation failed.
+    :raises TechnicalError: a source file compilation failed (no further compilation is started).
     """
+    import functools
     import os
-    import re
-    import subprocess
-
-    from .helpers                      import get_files_to_recompile
-    from codestacker.constants         import keys, extensions
+    import time
+
+    from .cache                        import Cache
+    from .critical_path                import sort_by_priority
+    from .pch                          import prepare_pch
+    from .helpers                      import get_compile_command, get_depfile, get_object_file
+    from .helpers                      import get_files_to_recompile, get_label, get_targets
+    from .helpers                      import prune_objects, record_compilation
+    from .index                        import get_affected_units
+    from .scheduler                    import run_jobs
+    from .unity                        import prepare_unity
+    from codestacker.constants         import keys
     from codestacker.errors            import errors
-    from codestacker.errors.exceptions import TechnicalError
+    from codestacker.errors.exceptions import FunctionalError
     from codestacker.logger            import Logger
 
-    files_to_compile = get_files_to_recompile(config)
+    files_to_compile = []
+    targets = get_targets(config)
+
+    for target in targets:
+        prepare_pch(target, verbose)
+        prepare_unity(target)
+
+        # The state records the objects of the previous builds: the ones matching no translation
+        # unit anymore would only take space (they're not linked).
+        pruned = prune_objects(target)
+
+        if pruned:
+            Logger.info('Deleted {} orphaned object file(s)'.format(pruned))
+
+    # Once the units are known (e.g. the batches of a unity build).
+    candidates = None if changed is None else set(get_affected_units(config, changed))
+
+    for target in targets:
+        # Steps 1 to 3: compiler, compilation flags and include directory (per target).
+        compile_command = get_compile_command(target)
+
+        if sources is None:
+            files = get_files_to_recompile(target, candidates)
+        else:
+            files = _get_units_of(target, sources)
+
+        files_to_compile.extend((target, compile_command, x) for x in sorted(files))
+
+    if (sources is not None) and (not files_to_compile):
+        raise FunctionalError(errors.UNKNOWN_SOURCES, ', '.join(sorted(sources)))
 
     if not files_to_compile:
         Logger.info('Nothing to (re)compile')
-        return
+        return (0, []), {}, 0
 
     Logger.begin('Compilation...')
 
-    # Step 1: compiler.
-    compile_command = ['g++']
+    # Edited files first, then the longest chains of compilation and linkings first.
+    files_to_compile, estimate = sort_by_priority(config, files_to_compile)
+
+    # One per cache folder (several configurations may share one). Not in developer mode: the debug
+    # information files aren't cached along with object files.
+    caches = {}
+
+    directories = set()
+    jobs = []
+
+    for target, compile_command, file in files_to_compile:
+        if (target.get(keys.CACHE) is not None) and (not target[keys.DEV]):
+            if target[keys.CACHE] not in caches:
+                caches[target[keys.CACHE]] = Cache(target)
 
-    # Step 2: compilation flags.
-    compile_command.extend(config[keys.FLAGS])
+            cache = caches[target[keys.CACHE]]
+        else:
+            cache = None
 
-    # Add this special flag to force the compiler to print its output in colors.
-    if _SPECIAL_FLAG not in compile_command:
-        compile_command.append(_SPECIAL_FLAG)
+        object_file = get_object_file(target, file)
 
-    # Step 3: include directory.
-    compile_command.extend(['-I', config[keys.INCLUDE]])
+        # The "build" folder mirrors the "sources" one.
+        directory = os.path.dirname(object_file)
 
-    pattern = re.compile(r'(' + r'|'.join([re.escape(x) for x in extensions.SOURCES]) + r')$')
+        if directory not in directories:
+            os.makedirs(directory, exist_ok=True)
+            directories.add(directory)
 
-    for file in files_to_compile:
-        Logger.info('Compiling {}'.format(os.path.relpath(file, config[keys.ROOT])))
+        # Which configuration it's compiled for, when several are built together.
+        label = get_label(
+            config, target.get(keys.TARGET),
+            'Compiling {}'.format(os.path.relpath(file, config[keys.ROOT])))
+
+        # Compile through the cache, which may restore the object file instead.
+        if cache is not None:
+            jobs.append((
+                label,
+                functools.partial(
+                    cache.compile, compile_command, file, object_file, get_depfile(object_file))))
+            continue
 
         # Step 4: source file to compile.
         file_to_compile = ['-c', file]
 
-        target_filename = pattern.sub('.o', os.path.basename(file))
+        # Step 5: object file to produce, along with its dependency file.
+        file_to_compile.extend(['-o', object_file, '-MMD', '-MF', get_depfile(object_file)])
+
+        jobs.append((label, [*compile_command, *file_to_compile]))
+
+    start = time.perf_counter()
+
+    # Step 6: run up to "jobs" compilers at once, whatever the targets.
+    try:
+        results = run_jobs(jobs, config[keys.JOBS], errors.COMPILATION_FAILED, verbose)
+    finally:
+        for cache in caches.values():
+            cache.close()
 
-        # Step 5: object file to produce.
-        file_to_compile.extend(['-o', os.path.join(config[keys.BUILD], target_filename)])
+    elapsed = time.perf_counter() - start
 
-        full_command = [*compile_command, *file_to_compile]
+    durations = {}
 
-        try:
-            if verbose:
-                Logger.info('Execute:\n{}'.format(' '.join(full_command)))
+    for (target, _, file), result in zip(files_to_compile, results):
+        record_compilation(target, file, result.duration)
 
-            subprocess.run(full_command, stderr=subprocess.PIPE, check=True, encoding='UTF-8')
-        except subprocess.CalledProcessError as error:
-            raise TechnicalError(errors.COMPILATION_FAILED, error=error.stderr)
+        durations[(target.get(keys.TARGET), file)] = result.duration
 
     Logger.end('Success')
 
+    return estimate, durations, elapsed
+
 ####################################################################################################
 
-def _link(config, verbose):
+def _get_units_of(config, sources):
     """
-    Link the object files into an executable.
+    Return the translation units compiling some source files: the files themselves, or in a unity
+    build, the batches including them.
+
+    :param config: The configuration to operate on.
+    :param sources: The source files (normalized).
+
+    :returns: A list of units.
+    """
+    import os
+
+    from .helpers import get_units
+    from .unity   import get_batches
+
+    batches = get_batches(config)
+
+    return [
+        x for x in get_units(config)
+        if not sources.isdisjoint(os.path.normpath(y) for y in [x, *batches.get(x, ())])]
+
+####################################################################################################
+
+# Beyond that length, object files are passed through a response file: well below the command
+# line's limit ("ARG_MAX", shared with the environment).
+_MAX_OBJECTS_LENGTH = 1 << 15
+
+def _link(config, verbose, linkers=None):
+    """
+    Link the object files of each target into an executable or a library, unless it's already up to
+    date. The targets of a same level are linked concurrently; a target is relinked when the
+    libraries it depends on were. Long lists of object files are passed through response files.
 
     :param config: The configuration to operate on.
     :param verbose: The boolean flag to output linking command.
+    :param linkers: The optional linkers to use (key = target name), the compiler's default one
+                    otherwise.
+
+    :returns: The linkings' durations (key = target name), and how long each level of linkings
+              took.
 
-    :raises TechnicalError: the linking command failed.
+    :raises TechnicalError: a linking command failed.
     """
     import os
-    import subprocess
+    import time
 
-    from codestacker.constants             import keys
-    from codestacker.errors                import errors
-    from codestacker.errors.exceptions     import TechnicalError
-    from codestacker.logger                import Logger
-    from codestacker.system.file_utilities import get_files
+    from .helpers                      import get_dependencies, get_link_duration, get_object_file
+    from .helpers                      import get_output_file, get_relink_reason, get_target_levels
+    from .helpers                      import get_label, get_units, record_link
+    from .scheduler                    import run_jobs
+    from codestacker.constants         import keys
+    from codestacker.errors            import errors
+    from codestacker.logger            import Logger
 
-    Logger.begin('Linking...')
+    durations = {}
+    phases = []
+
+    for level in get_target_levels(config):
+        jobs = []
+        records = []
+
+        # Longest linkings first.
+        level = sorted(level, key=lambda x: -(get_link_duration(x, get_output_file(x)) or 0))
+
+        for target in level:
+            output = get_output_file(target)
+            linker = (linkers or {}).get(target.get(keys.TARGET))
+
+            # Only the object files of the current units: leftovers (e.g. of the sources now in a
+            # batch) would clash with them.
+            objects = sorted(get_object_file(target, x) for x in get_units(target))
+
+            # Static libraries are only archives: they're not linked against their dependencies.
+            if target[keys.TYPE] == keys.TYPE_STATIC:
+                dependencies = []
+            else:
+                dependencies = get_dependencies(config, target)
+
+            linking_command = _get_linking_command(target, output, objects, dependencies, linker)
+            reason = get_relink_reason(
+                target, output, [*objects, *(get_output_file(x) for x in dependencies)],
+                linking_command)
+
+            if reason is None:
+                continue
+
+            # Archives are updated in place: the members of the removed sources would remain.
+            if (target[keys.TYPE] == keys.TYPE_STATIC) and os.path.exists(output):
+                os.remove(output)
+
+            # Recorded as is, but run with the object files in a response file (beyond a length).
+            command = linking_command
+
+            if sum(len(x) + 1 for x in objects) > _MAX_OBJECTS_LENGTH:
+                response_file = _write_response_file(target, output, objects)
+                command = _get_linking_command(
+                    target, output, ['@' + response_file], dependencies, linker)
+
+            jobs.append((
+                get_label(
+                    config, target.get(keys.TARGET),
+                    'Linking {} ({})'.format(os.path.relpath(output, config[keys.ROOT]), reason)),
+                command))
+            records.append((target, output, linking_command))
+
+        if not jobs:
+            continue
+
+        if not durations:
+            Logger.begin('Linking...')
+
+        start = time.perf_counter()
+        results = run_jobs(jobs, config[keys.JOBS], errors.LINKING_FAILED, verbose, 'link')
+
+        phases.append(time.perf_counter() - start)
+
+        for (target, output, linking_command), result in zip(records, results):
+            record_link(target, output, linking_command, result.duration)
+
+            durations[target.get(keys.TARGET)] = result.duration
+
+    if not durations:
+        Logger.info('Nothing to (re)link')
+        return durations, phases
+
+    Logger.end('Success')
+
+    return durations, phases
+
+####################################################################################################
+
+def _get_linking_command(config, output, objects, dependencies, linker=None):
+    """
+    Return the command linking a target.
+
+    :param config: The target's configuration.
+    :param output: The executable or library to produce.
+    :param objects: The object files to link.
+    :param dependencies: The targets to link against, in linking order.
+    :param linker: The optional linker to use.
+
+    :returns: The command, as a list of arguments.
+    """
+    from .helpers              import get_output_file
+    from codestacker.constants import keys
+
+    if config[keys.TYPE] == keys.TYPE_STATIC:
+        return ['ar', 'rcs', output, *objects]
 
     # Step 1: compiler.
     linking_command = ['g++']
 
-    # Step 2, 3: output executable and object files.
-    linking_command.extend(['-o', os.path.join(config[keys.BINARY], config[keys.OUTPUT])])
-    linking_command.extend(get_files(config[keys.BUILD], '.o'))
+    if config[keys.TYPE] == keys.TYPE_SHARED:
+        linking_command.append('-shared')
 
-    # Step 4: libraries.
-    linking_command.extend('-l' + x for x in config[keys.LIBRARIES])
+    if linker is not None:
+        linking_command.append('-fuse-ld=' + linker)
 
-    try:
-        if verbose:
-            Logger.info('Execute:\n{}'.format(' '.join(linking_command)))
+    # Developer mode: index of the debug information, for the debugger not to build it at startup.
+    if config[keys.DEV] and (linker not in (None, keys.LINKER_BFD)):
+        linking_command.append('-Wl,--gdb-index')
 
-        subprocess.run(linking_command, stderr=subprocess.PIPE, check=True, encoding='UTF-8')
-    except subprocess.CalledProcessError as error:
-        raise TechnicalError(errors.LINKING_FAILED, error=error.stderr)
+    # Step 2, 3: output file and object files.
+    linking_command.extend(['-o', output])
+    linking_command.extend(objects)
 
-    Logger.end('Success')
+    # Step 4: libraries built by the targets depended on (looked for next to the output file, when
+    # shared), then their own libraries.
+    linking_command.extend(get_output_file(x) for x in dependencies)
+
+    if any(x[keys.TYPE] == keys.TYPE_SHARED for x in dependencies):
+        linking_command.append('-Wl,-rpath,$ORIGIN')
+
+    libraries = set(config[keys.LIBRARIES])
+
+    for dependency in dependencies:
+        libraries |= dependency[keys.LIBRARIES]
+
+    linking_command.extend('-l' + x for x in sorted(libraries))
+
+    return linking_command
+
+####################################################################################################
+
+def _write_response_file(config, output, objects):
+    """
+    Write the object files to link into a response file, read by the compiler (or the archiver) in
+    place of a long command line.
+
+    :param config: The target's configuration.
+    :param output: The executable or library to produce.
+    :param objects: The object files to link.
+
+    :returns: The response file's path, in the target's "build" folder.
+    """
+    import os
+    import re
+
+    from codestacker.constants import keys
+
+    response_file = os.path.join(config[keys.BUILD], os.path.basename(output) + '.rsp')
+
+    # Spaces, quotes and backslashes escaped.
+    with open(response_file, 'w') as stream:
+        stream.write(''.join(re.sub(r'([\s\\\'"])', r'\\\1', x) + '\n' for x in objects))
+
+    return response_file
+
+####################################################################################################
+
+# Alternative linkers, the fastest first.
+_LINKERS = ('mold', 'lld', 'gold', 'bfd')
+
+def _get_linker(config):
+    """
+    Return the linker to use: the one of the configuration, or in "auto" mode the fastest one
+    installed.
+
+    :param config: The configuration to operate on.
+
+    :returns: The linker's name (as given to "-fuse-ld"), or "None" for the compiler's default one.
+
+    :raises TechnicalError: the linker is not installed.
+    """
+    import shutil
+
+    from codestacker.constants         import keys
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import TechnicalError
+
+    linker = config.get(keys.LINKER)
+
+    if linker == keys.LINKER_AUTO:
+        return next((x for x in _LINKERS if shutil.which('ld.' + x) is not None), None)
+
+    if (linker is not None) and (shutil.which('ld.' + linker) is None):
+        raise TechnicalError(errors.LINKER_NOT_FOUND, linker)
+
+    return linker
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Local compilation cache, shared by all the builds using the same cache directory.
+"""
+
+####################################################################################################
+
+def manage_cache(config, action):
+    """
+    Show the cache statistics, or clear the cache.
+
+    :param config: The configuration to operate on.
+    :param action: Either "stats" or "clear".
+
+    :raises FunctionalError: no cache directory is configured.
+    """
+    from codestacker.constants         import keys
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import FunctionalError
+    from codestacker.logger            import Logger
+
+    if config.get(keys.CACHE) is None:
+        raise FunctionalError(errors.NO_CACHE)
+
+    cache = Cache(config)
+
+    if action == 'clear':
+        Logger.begin('Clearing cache...')
+
+        cache.clear()
+
+        Logger.end('Clear-up successful')
+    else:
+        entries, size = cache.get_usage()
+        stats = cache.get_stats()
+        lookups = stats[_HITS] + stats[_MISSES]
+
+        Logger.begin('Cache "{}"'.format(config[keys.CACHE]))
+        Logger.info('Hits: {}'.format(stats[_HITS]))
+        Logger.info('Misses: {}'.format(stats[_MISSES]))
+        Logger.info('Hit rate: {:.1f}%'.format(100 * stats[_HITS] / lookups if lookups else 0))
+        Logger.info('Objects: {}'.format(entries))
+        Logger.end('Size: {:.1f} / {} MiB'.format(size / _MIB, config[keys.CACHE_SIZE]))
+
+####################################################################################################
+
+# Statistics.
+_HITS = 'hits'
+_MISSES = 'misses'
+_SIZE = 'size'
+
+_MIB = 1 << 20
+
+_STATS_FILE = 'stats.json'
+
+class Cache():
+    """
+    Content-addressed compilation cache. Object files are stored under a key made of the compiler's
+    identity, the compilation command and the preprocessed source file; on a cache hit, the object
+    file is restored instead of being compiled. Least recently used objects are evicted beyond the
+    cache's maximal size.
+
+    The paths under the project's root are mapped to relative ones (in the key, and in the object
+    files through "-ffile-prefix-map"), so that several copies of a project (e.g. worktrees) share
+    their entries.
+    """
+    def __init__(self, config):
+        """
+        Constructor.
+
+        :param config: The configuration to operate on.
+        """
+        import os
+        import threading
+
+        from codestacker.constants import keys
+
+        self.__directory = config[keys.CACHE]
+        self.__root = config[keys.ROOT]
+        self.__max_size = config[keys.CACHE_SIZE] * _MIB
+        self.__objects_dir = os.path.join(self.__directory, 'objects')
+
+        self.__compiler_id = None
+        self.__lock = threading.Lock()
+        self.__stats = {_HITS: 0, _MISSES: 0, _SIZE: 0}
+
+    def compile(self, compile_command, source, target, depfile):
+        """
+        Compile a source file into an object file, through the cache (this method is thread-safe).
+
+        :param compile_command: The compilation command shared by all the source files.
+        :param source: The source file to compile.
+        :param target: The object file to produce.
+        :param depfile: The dependency file to produce.
+
+        :returns: The completed process (either the preprocessor's, or the compiler's).
+        """
+        import hashlib
+        import os
+        import subprocess
+
+        from .scheduler import run_process
+
+        prefix = os.path.join(self.__root, '')
+        signature = '\0'.join(
+            '.' if x == self.__root else x.replace(prefix, './') for x in compile_command)
+
+        # "__FILE__" and the debug information relative to the root, like the key.
+        compile_command = [*compile_command, '-ffile-prefix-map={}=.'.format(self.__root)]
+
+        # Preprocess the source file, which also writes its dependency file.
+        preprocessed = run_process(
+            [*compile_command, '-E', source, '-MMD', '-MF', depfile, '-MT', target], None)
+
+        if preprocessed.returncode != 0:
+            return subprocess.CompletedProcess(
+                preprocessed.args, preprocessed.returncode, '', preprocessed.stderr.decode())
+
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(self.__get_compiler_id().encode())
+        hasher.update(signature.encode())
+
+        # The line markers hold absolute paths.
+        hasher.update(preprocessed.stdout.replace(os.fsencode(prefix), b'./'))
+
+        key = hasher.hexdigest()
+        entry = os.path.join(self.__objects_dir, key[:2], key)
+
+        # The object file may be a hard link to a cache entry: never write through it.
+        if os.path.lexists(target):
+            os.unlink(target)
+
+        if self.__restore(entry, target):
+            self.__count(_HITS)
+
+            return subprocess.CompletedProcess(preprocessed.args, 0, '', '')
+
+        self.__count(_MISSES)
+
+        compiled = run_process(
+            [*compile_command, '-c', source, '-o', target, '-MMD', '-MF', depfile])
+
+        if compiled.returncode == 0:
+            self.__store(target, entry)
+
+        return compiled
+
+    def close(self):
+        """
+        Save the statistics of this build, and evict the least recently used objects if the cache
+        grew too big.
+        """
+        from codestacker.logger import Logger
+
+        Logger.info('Cache: {} hit(s), {} miss(es)'.format(
+            self.__stats[_HITS], self.__stats[_MISSES]))
+
+        stats = self.__update_stats(self.__stats)
+
+        if stats[_SIZE] > self.__max_size:
+            self.__evict()
+
+    def get_stats(self):
+        """Return the cache statistics (hits, misses and estimated size)."""
+        return self.__update_stats({})
+
+    def get_usage(self):
+        """Return the number of objects in the cache, and their total size."""
+        entries = self.__get_entries()
+
+        return len(entries), sum(x[1] for x in entries)
+
+    def clear(self):
+        """Remove all the objects from the cache, and reset its statistics."""
+        import shutil
+
+        shutil.rmtree(self.__objects_dir, ignore_errors=True)
+
+        self.__update_stats(None)
+
+    def __get_compiler_id(self):
+        """Identify the compiler (path, modification time and version), once per build."""
+        import os
+        import shutil
+        import subprocess
+
+        with self.__lock:
+            if self.__compiler_id is None:
+                path = os.path.realpath(shutil.which('g++') or 'g++')
+                version = subprocess.run(
+                    ['g++', '--version'],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, encoding='UTF-8')
+
+                self.__compiler_id = '{}\0{}\0{}'.format(
+                    path, os.stat(path).st_mtime_ns, version.stdout)
+
+            return self.__compiler_id
+
+    def __count(self, stat, value=1):
+        """Increment one of the statistics of this build."""
+        with self.__lock:
+            self.__stats[stat] += value
+
+    def __restore(self, entry, target):
+        """Restore a cache entry as an object file, by hard link (or copy); "False" if none."""
+        import os
+        import shutil
+
+        try:
+            try:
+                os.link(entry, target)
+            except FileNotFoundError:
+                return False
+            except OSError:
+                shutil.copyfile(entry, target)
+
+            # Refresh the entry for the eviction, and the object file for the timestamps checks.
+            os.utime(target)
+        except OSError:
+            return False
+
+        return True
+
+    def __store(self, target, entry):
+        """Store an object file in the cache (atomically, concurrent builds may share the cache)."""
+        import os
+        import shutil
+        import threading
+
+        temp_entry = '{}.{}.{}.tmp'.format(entry, os.getpid(), threading.get_ident())
+
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            shutil.copyfile(target, temp_entry)
+            os.replace(temp_entry, entry)
+
+            self.__count(_SIZE, os.path.getsize(entry))
+        except OSError:
+            pass
+
+    def __get_entries(self):
+        """List the cache entries, as (path, size, last use) tuples."""
+        import os
+
+        entries = []
+
+        for current_dir, _, files in os.walk(self.__objects_dir):
+            for file in files:
+                try:
+                    stat = os.stat(os.path.join(current_dir, file))
+                except OSError:
+                    continue
+
+                entries.append((os.path.join(current_dir, file), stat.st_size, stat.st_mtime))
+
+        return entries
+
+    def __evict(self):
+        """Evict the least recently used objects, until the cache is back to 90% of its size."""
+        import os
+
+        entries = sorted(self.__get_entries(), key=lambda x: x[2])
+        size = sum(x[1] for x in entries)
+
+        for path, entry_size, _ in entries:
+            if size <= 0.9 * self.__max_size:
+                break
+
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+
+            size -= entry_size
+
+        self.__update_stats({}, size)
+
+    def __update_stats(self, increments, size=None):
+        """
+        Add increments to the statistics file under an exclusive lock ("None" to reset it), and
+        return the updated statistics. The size, only estimated by increments, can also be set.
+        """
+        import fcntl
+        import json
+        import os
+
+        os.makedirs(self.__directory, exist_ok=True)
+
+        with open(os.path.join(self.__directory, _STATS_FILE), 'a+') as stream:
+            fcntl.flock(stream, fcntl.LOCK_EX)
+
+            stream.seek(0)
+
+            try:
+                stats = json.loads(stream.read())
+            except ValueError:
+                stats = {}
+
+            stats = {x: stats.get(x, 0) for x in (_HITS, _MISSES, _SIZE)}
+
+            if increments is None:
+                stats = {x: 0 for x in stats}
+            else:
+                for stat, value in increments.items():
+                    stats[stat] += value
+
+            if size is not None:
+                stats[_SIZE] = size
+
+            stream.seek(0)
+            stream.truncate()
+            stream.write(json.dumps(stats))
+
+        return stats
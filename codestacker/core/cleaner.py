@@ -7,51 +7,107 @@ Erase compilation results.
 
 ####################################################################################################
 
-def clean(config):
+def clean(config, part=None):
     """
-    Clean any compilation results.
+    Clean any compilation results, or only the ones of a target or of a folder of sources. They're
+    moved out of the way at once, then deleted in the background.
+
+    :param config: The configuration to operate on.
+    :param part: The optional name of the target, or path of the folder, to clean.
     """
-    from codestacker.constants import keys
-    from codestacker.logger    import Logger
+    import os
+
+    from codestacker.constants    import keys
+    from codestacker.logger       import Logger
+    from codestacker.system.trash import empty_trash_later, move_to_trash
 
     Logger.begin('Cleaning-up...')
 
-    # Dereferenced for performance.
-    root = config[keys.ROOT]
+    if part is None:
+        folders = [config[keys.BUILD], config[keys.BINARY]]
+        files = []
+    else:
+        folders, files = _get_part(config, part)
 
-    # Clean-up "build" directory.
-    _remove_files(config[keys.BUILD], root)
+    for folder in folders:
+        Logger.info('Cleaning-up {}...'.format(os.path.relpath(folder, config[keys.ROOT])))
 
-    # Clean-up "bin" directory.
-    _remove_files(config[keys.BINARY], root)
+    if files:
+        Logger.info('Cleaning-up {} file(s)...'.format(len(files)))
+
+    empty_trash_later(move_to_trash([*folders, *files]))
+
+    # Folders emptied, rather than removed.
+    for folder in folders:
+        os.makedirs(folder, exist_ok=True)
 
     Logger.end('Clean-up successful')
 
 ####################################################################################################
 
-def _remove_files(directory, root):
+def _get_part(config, part):
     """
-    Remove all files within "directory".
+    Return the compilation results of a target (its folder in the "build" one, and its output), or
+    of a folder of sources (object, dependency and debug information files, including the ones of
+    the unity build's batches they're compiled in).
+
+    :param config: The configuration to operate on.
+    :param part: The name of the target, or path of the folder.
+
+    :returns: The folders and the files to clean.
+
+    :raises FunctionalError: the part is neither a target nor a folder.
     """
     import os
-    import shutil
-
-    from codestacker.errors            import errors
-    from codestacker.errors.exceptions import TechnicalError
-    from codestacker.logger            import Logger
-
-    with os.scandir(directory) as entries:
-        for entry in entries:
-            abs_entry = os.path.join(directory, entry)
-
-            Logger.info('Cleaning-up {}...'.format(os.path.relpath(abs_entry, root)))
-
-            try:
-                if os.path.isfile(abs_entry):
-                    os.unlink(abs_entry)
-                elif os.path.isdir(abs_entry):
-                    shutil.rmtree(abs_entry)
-                else:
-                    Logger.warning('"{}" neither file nor directory: skipped'.format(abs_entry))
-            except Exception as error:
-                raise TechnicalError(errors.REMOVAL_FAILED, abs_entry, error)
+
+    from .helpers                          import get_depfile, get_dwo_file, get_object_file
+    from .helpers                          import get_output_file, get_targets
+    from .state                            import load_state
+    from .unity                            import get_batches
+    from codestacker.constants             import keys, extensions
+    from codestacker.errors                import errors
+    from codestacker.errors.exceptions     import FunctionalError
+    from codestacker.system.file_utilities import get_files
+
+    targets = get_targets(config)
+
+    for target in targets:
+        if part == target.get(keys.TARGET, target[keys.OUTPUT]):
+            output = get_output_file(target)
+
+            return [target[keys.BUILD]], [output] if os.path.exists(output) else []
+
+    if not os.path.isdir(part):
+        raise FunctionalError(errors.UNKNOWN_PART, part)
+
+    folder = os.path.realpath(part)
+    files = []
+
+    for target in targets:
+        sources = os.path.realpath(target[keys.SOURCES])
+
+        # The folder within the target's sources, or the other way around.
+        if folder.startswith(os.path.join(sources, '')):
+            directory = os.path.join(target[keys.SOURCES], os.path.relpath(folder, sources))
+        elif (folder == sources) or sources.startswith(os.path.join(folder, '')):
+            directory = target[keys.SOURCES]
+        else:
+            continue
+
+        sources = set(get_files(directory, extensions.SOURCES))
+
+        if target.get(keys.STATE) is None:
+            load_state(target)
+
+        # The batches including any of the sources (they're all recompiled).
+        sources.update(
+            x for x, members in get_batches(target).items() if not sources.isdisjoint(members))
+
+        for source in sorted(sources):
+            object_file = get_object_file(target, source)
+
+            files.extend(
+                x for x in (object_file, get_depfile(object_file), get_dwo_file(object_file))
+                if os.path.exists(x))
+
+    return [], files
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Critical path of a build: all its compilations run first (as many at once as the jobs allow), then
+its targets are linked level by level, each level waiting for the previous one. It's estimated from
+the durations recorded by the previous builds.
+"""
+
+####################################################################################################
+
+def sort_by_priority(config, files_to_compile):
+    """
+    Order the compilations: the source files edited since their last compilation first (for their
+    errors to show up early), then the longest ones first (nothing being linked before they're all
+    done, the longest ones started last would lengthen the compilation phase).
+
+    :param config: The configuration to operate on.
+    :param files_to_compile: The (target, compilation command, source file) triplets to compile.
+
+    :returns: The sorted triplets, and the estimated critical path (as "get_critical_path" does).
+    """
+    from .helpers              import get_duration, get_link_duration, get_object_file
+    from .helpers              import get_output_file, is_modified
+    from codestacker.constants import keys
+
+    durations = {}
+
+    for target, _, file in files_to_compile:
+        durations[(target.get(keys.TARGET), file)] = get_duration(target, file)
+
+    # Unknown durations (e.g. of new source files) taken as the average one.
+    known = [x for x in durations.values() if x is not None]
+    default = (sum(known) / len(known)) if known else 0
+
+    durations = {x: default if y is None else y for x, y in durations.items()}
+
+    # The targets of the compiled files are relinked, along with the ones depending on them.
+    targets = _get_targets(config)
+    link_durations = {
+        x: get_link_duration(targets[x], get_output_file(targets[x])) or 0
+        for x in _get_downstream(config, set(x for x, _ in durations))}
+
+    def get_key(item):
+        """Return the sort key of a compilation."""
+        target, _, file = item
+        edited = is_modified(target, get_object_file(target, file), file)
+
+        return (not edited, -durations[(target.get(keys.TARGET), file)], file)
+
+    return sorted(files_to_compile, key=get_key), get_critical_path(
+        config, durations, link_durations)
+
+####################################################################################################
+
+def get_critical_path(config, durations, link_durations, phases=None):
+    """
+    Return the duration of a build, and its steps: the compilation phase (lasting as long as the
+    longest compilation, or as the total compilation time shared among the jobs), then each level of
+    linkings (lasting as long as its longest linking).
+
+    :param config: The configuration to operate on.
+    :param durations: The compilations' durations (key = (target name, source file)).
+    :param link_durations: The linkings' durations (key = target name).
+    :param phases: The optional measured durations of the steps (estimated otherwise).
+
+    :returns: The build's duration in seconds, and its steps (as a list of labels).
+    """
+    import os
+
+    from .helpers              import get_output_file, get_target_levels
+    from codestacker.constants import keys
+
+    steps = []
+
+    if durations:
+        (_, file), longest = max(durations.items(), key=lambda x: x[1])
+        shared = sum(durations.values()) / config[keys.JOBS]
+
+        if longest >= shared:
+            steps.append((os.path.relpath(file, config[keys.ROOT]), longest))
+        else:
+            steps.append((
+                '{} compilations on {} job(s)'.format(len(durations), config[keys.JOBS]), shared))
+
+    for level in get_target_levels(config):
+        linked = [x for x in level if x.get(keys.TARGET) in link_durations]
+
+        if linked:
+            target = max(linked, key=lambda x: link_durations[x.get(keys.TARGET)])
+
+            steps.append((
+                'linking ' + os.path.basename(get_output_file(target)),
+                link_durations[target.get(keys.TARGET)]))
+
+    if phases is not None:
+        steps = [(label, x) for (label, _), x in zip(steps, phases)]
+
+    return sum(x for _, x in steps), [label for label, _ in steps]
+
+####################################################################################################
+
+def _get_targets(config):
+    """Return the targets' configurations, by name ("None" for a single target)."""
+    from .helpers              import get_targets
+    from codestacker.constants import keys
+
+    return {x.get(keys.TARGET): x for x in get_targets(config)}
+
+####################################################################################################
+
+def _get_dependents(config):
+    """Return the names of the targets depending directly on each target."""
+    from codestacker.constants import keys
+
+    dependents = {}
+
+    for name, target in _get_targets(config).items():
+        for dependency in target[keys.DEPENDS]:
+            dependents.setdefault(dependency, []).append(name)
+
+    return dependents
+
+####################################################################################################
+
+def _get_downstream(config, names):
+    """Return the names of some targets, and of the ones depending on them (directly or not)."""
+    dependents = _get_dependents(config)
+    downstream = set()
+    to_visit = list(names)
+
+    while to_visit:
+        name = to_visit.pop()
+
+        if name not in downstream:
+            downstream.add(name)
+            to_visit.extend(dependents.get(name, ()))
+
+    return downstream
@@ -7,71 +7,843 @@ Core helper functions.
 
 ####################################################################################################
 
-def get_files_to_recompile(config):
+def get_target_levels(config):
+    """
+    Return the configurations of the targets to build, grouped by levels: each target comes after
+    the ones it depends on, and the targets of a same level don't depend on one another.
+
+    :param config: The configuration to operate on.
+
+    :returns: A list of lists of configurations (the configuration itself, for a single target).
+    """
+    from codestacker.constants   import keys
+    from codestacker.graph_tools import get_ready_sets
+
+    targets = config.get(keys.TARGETS)
+
+    if targets is None:
+        return [[config]]
+
+    graph = {name: set(target[keys.DEPENDS]) for name, target in targets.items()}
+
+    return [[targets[x] for x in sorted(level)] for level in get_ready_sets(graph)]
+
+####################################################################################################
+
+def get_targets(config):
+    """
+    Return the configurations of the targets to build, each one after the ones it depends on.
+
+    :param config: The configuration to operate on.
+
+    :returns: A list of configurations (the configuration itself, for a single target).
+    """
+    return [x for level in get_target_levels(config) for x in level]
+
+####################################################################################################
+
+def get_label(config, name, label):
+    """
+    Prefix a label (e.g. of a compilation) with its target's name, when several configurations are
+    built together: their targets share their source files.
+
+    :param config: The configuration to operate on.
+    :param name: The target's name.
+    :param label: The label.
+
+    :returns: The label, prefixed or not.
+    """
+    from codestacker.constants import keys
+
+    return label if config.get(keys.CONFIGS) is None else '[{}] {}'.format(name, label)
+
+####################################################################################################
+
+def get_dependencies(config, target):
+    """
+    Return the targets a target depends on, directly or not, each one before the ones it depends on
+    (i.e. in linking order).
+
+    :param config: The configuration to operate on.
+    :param target: The target's configuration.
+
+    :returns: A list of configurations.
+    """
+    from codestacker.constants import keys
+
+    dependencies = set()
+    to_visit = list(target[keys.DEPENDS])
+
+    while to_visit:
+        name = to_visit.pop()
+
+        if name not in dependencies:
+            dependencies.add(name)
+            to_visit.extend(config[keys.TARGETS][name][keys.DEPENDS])
+
+    return [x for x in reversed(get_targets(config)) if x.get(keys.TARGET) in dependencies]
+
+####################################################################################################
+
+def get_files_to_recompile(config, candidates=None):
     """
     Return a list of source files that, given the existing object files in the "build" folder, need
-    to be (re)compiled.
+    to be (re)compiled. Dependencies are read from the dependency files written by the previous
+    compilation; only the sources without an up-to-date dependency file are scanned. Object files
+    compiled with another command (e.g. other flags) are recompiled too.
+
+    Changes are detected either by timestamps, or by contents: in the latter case, a source file is
+    recompiled only if the content of one of its prerequisites differs from the last compilation.
 
     :param config: The configuration to operate on.
+    :param candidates: The optional set of translation units to check, as (target name, unit) pairs
+                       (by default, all of them).
 
     :returns: A list of files to recompile.
     """
     import os
 
+    from .index                import index_prerequisites, is_indexed
+    from .state                import OBJECTS, get_section
+    from codestacker.constants import keys
+
+    by_content = config[keys.DETECTION] == keys.DETECTION_CONTENT
+    records = get_section(config, OBJECTS)
+    signature = get_signature(get_compile_command(config))
+
+    to_compile = set()
+    to_scan = []
+    recipes = {}
+    targets = {}
+    digests = {}
+
+    # Dereferenced for performance.
+    snapshot = config[keys.SNAPSHOT]
+
+    units = get_units(config)
+
+    if candidates is not None:
+        units = [x for x in units if (config.get(keys.TARGET), x) in candidates]
+
+    for source in units:
+        target = targets[source] = get_object_file(config, source)
+        depfile = get_depfile(target)
+
+        if by_content:
+            digests[target] = _get_digests(config, target)
+
+        # Case 1: new targets, or targets compiled with another command.
+        if (not os.path.exists(target)) or (not _has_signature(records, target, signature)):
+            to_compile.add(source)
+        # Case 2: dependencies known since the last compilation.
+        elif digests.get(target) is not None:
+            recipes[source] = list(digests[target])
+        elif is_up_to_date(depfile, [source], snapshot):
+            prerequisites = _get_prerequisites(config, read_depfile(depfile))
+
+            # Indexed by the builds preceding the index (once).
+            if not is_indexed(config, target):
+                index_prerequisites(config, target, prerequisites)
+
+            recipes[source] = prerequisites
+        # Case 3: unknown dependencies.
+        else:
+            to_scan.append(source)
+
+    scanned = _get_recipes(config, to_scan)
+
+    for source, prerequisites in scanned.items():
+        recipes[source] = _get_prerequisites(config, prerequisites)
+
+    # Modified source files (or any of their headers).
+    for source, prerequisites in recipes.items():
+        target = targets[source]
+
+        if digests.get(target) is not None:
+            up_to_date = _is_unchanged(config, digests[target])
+        else:
+            up_to_date = is_up_to_date(target, prerequisites, snapshot)
+
+            # No digests yet (e.g. first build by content): trust the timestamps, this once.
+            if by_content and up_to_date:
+                index_prerequisites(config, target, prerequisites)
+                _record_digests(config, target)
+
+        if not up_to_date:
+            to_compile.add(source)
+
+    return to_compile
+
+####################################################################################################
+
+def get_units(config):
+    """
+    Return the translation units to compile: the source files, or in a unity build, the batches
+    and the source files compiled on their own.
+
+    :param config: The configuration to operate on.
+
+    :returns: A list of files to compile.
+    """
+    from codestacker.constants             import keys, extensions
+    from codestacker.system.file_utilities import get_files
+
+    if config.get(keys.UNITS) is not None:
+        return config[keys.UNITS]
+
+    return get_files(config[keys.SOURCES], extensions.SOURCES, config[keys.SNAPSHOT])
+
+####################################################################################################
+
+def get_recipes(config):
+    """
+    Return the recipes of all the source files: read from their dependency files when up to date,
+    scanned otherwise.
+
+    :param config: The configuration to operate on.
+
+    :returns: A dictionary of recipes (key = source file, value = prerequisites).
+    """
     from codestacker.constants             import keys, extensions
     from codestacker.system.file_utilities import get_files
 
     # Dereferenced for performance.
-    build_dir = config[keys.BUILD]
-    to_compile = set()
+    snapshot = config[keys.SNAPSHOT]
+
+    recipes = {}
+    to_scan = []
+
+    for source in get_files(config[keys.SOURCES], extensions.SOURCES, snapshot):
+        depfile = get_depfile(get_object_file(config, source))
 
-    for target, prerequisites in _get_recipes(config[keys.SOURCES], config[keys.INCLUDE]).items():
-        # Case 1: new targets.
-        if target not in [os.path.basename(x) for x in get_files(build_dir, '.o')]:
-            to_compile.update(prerequisites)
-        # Case 2: modified source files.
+        if is_up_to_date(depfile, [source], snapshot):
+            recipes[source] = read_depfile(depfile)
         else:
-            for file in prerequisites:
-                if os.path.getmtime(file) > os.path.getmtime(os.path.join(build_dir, target)):
-                    to_compile.add(file)
+            to_scan.append(source)
 
-    to_compile = set(x for x in to_compile if x.endswith(extensions.SOURCES))
+    recipes.update(_get_recipes(config, to_scan))
 
-    return to_compile
+    return recipes
 
 ####################################################################################################
 
-def _get_recipes(sources_dir, include_dir):
+def share_scans(targets):
     """
-    Get a list of recipes needed to (re)compute the dependencies.
+    Have the targets with the same include settings (e.g. of several configurations) share their
+    dependency scans, for one build: a source file is then scanned once for all of them.
 
-    :param sources_dir: The sources directory to look in.
-    :param include_dir: The include directory to look in.
+    :param targets: The targets' configurations.
+    """
+    from codestacker.constants import keys
+
+    scans = {}
+
+    for target in targets:
+        target[keys.SCANS] = scans.setdefault((target[keys.INCLUDE], target[keys.SCANNER]), {})
+
+####################################################################################################
+
+_SPECIAL_FLAG = '-fdiagnostics-color=always'
+
+def get_compile_command(config, with_pch=True):
+    """
+    Return the compilation command shared by all the source files (compiler, flags and include
+    directory).
+
+    :param config: The configuration to operate on.
+    :param with_pch: An optional boolean about whether to include the precompiled header (if any).
+
+    :returns: The command, as a list of arguments.
+    """
+    from codestacker.constants import keys
+
+    # Step 1: compiler.
+    compile_command = ['g++']
+
+    # Step 2: compilation flags (sorted, for the command to be the same from one build to the next).
+    compile_command.extend(sorted(config[keys.FLAGS]))
+
+    # Add this special flag to force the compiler to print its output in colors.
+    if _SPECIAL_FLAG not in compile_command:
+        compile_command.append(_SPECIAL_FLAG)
+
+    # Step 3: include directory.
+    compile_command.extend(['-I', config[keys.INCLUDE]])
+
+    # Step 3 bis: precompiled header.
+    if with_pch and (config.get(keys.PCH) is not None):
+        compile_command.extend(['-include', get_pch_header(config)])
+
+    return compile_command
+
+####################################################################################################
+
+def get_signature(command):
+    """
+    Compute the signature of a command.
+
+    :param command: The command, as a list of arguments.
+
+    :returns: The signature, as a hexadecimal string.
+    """
+    import hashlib
+
+    return hashlib.blake2b('\0'.join(command).encode(), digest_size=16).hexdigest()
+
+####################################################################################################
+
+# Per object file records of the compilation command's signature, and of the compilation time.
+_DURATION = 'duration'
+_SIGNATURE = 'signature'
+
+def record_compilation(config, source, duration=None):
+    """
+    Remember what an object file was just compiled from, for the next builds to detect changes.
+
+    :param config: The configuration to operate on.
+    :param source: The source file that was compiled.
+    :param duration: The optional compilation time, in seconds.
+    """
+    from .index                import index_prerequisites
+    from .state                import OBJECTS, get_section
+    from codestacker.constants import keys
+
+    target = get_object_file(config, source)
+    record = get_section(config, OBJECTS).setdefault(target, {})
+
+    record[_SIGNATURE] = get_signature(get_compile_command(config))
+
+    if duration is not None:
+        record[_DURATION] = round(duration, 3)
+
+    prerequisites = read_depfile(get_depfile(target))
+
+    index_prerequisites(config, target, _get_prerequisites(config, prerequisites))
+
+    if config[keys.DETECTION] == keys.DETECTION_CONTENT:
+        _record_digests(config, target)
+    else:
+        # Recorded by a build by content: they no longer match the prerequisites.
+        record.pop(_DIGESTS, None)
+
+####################################################################################################
+
+def prune_objects(config):
+    """
+    Delete the object files (and their dependency and debug information files) recorded by the
+    previous builds that no longer match a translation unit (e.g. of deleted or renamed sources).
+
+    :param config: The configuration to operate on.
+
+    :returns: The number of deleted object files.
+    """
+    import os
+
+    from .index import unindex
+    from .state import OBJECTS, get_section
+
+    records = get_section(config, OBJECTS)
+    expected = set(get_object_file(config, x) for x in get_units(config))
+    orphans = [x for x in records if x not in expected]
+
+    for target in orphans:
+        for file in (target, get_depfile(target), get_dwo_file(target)):
+            try:
+                os.remove(file)
+            except FileNotFoundError:
+                pass
+
+        unindex(config, target)
+        records.pop(target)
+
+    return len(orphans)
+
+####################################################################################################
+
+def get_duration(config, source):
+    """
+    Return how long a source file took to compile, the last time.
+
+    :param config: The configuration to operate on.
+    :param source: The source file.
+
+    :returns: The compilation time in seconds, or "None" if unknown.
+    """
+    from .state import OBJECTS, get_section
+
+    return get_section(config, OBJECTS).get(get_object_file(config, source), {}).get(_DURATION)
+
+####################################################################################################
+
+def is_modified(config, target, file):
+    """
+    Check whether a prerequisite of an object file was modified since its compilation.
+
+    :param config: The configuration to operate on.
+    :param target: The object file.
+    :param file: The prerequisite to check.
+
+    :returns: "True" if modified (or missing).
+    """
+    import os
+
+    from codestacker.constants import keys
+
+    digests = _get_digests(config, target)
+
+    if (config[keys.DETECTION] == keys.DETECTION_CONTENT) and (digests is not None):
+        return not _is_unchanged(config, {file: digests.get(os.path.normpath(file))})
+
+    return not is_up_to_date(target, [file], config[keys.SNAPSHOT])
+
+####################################################################################################
+
+def get_relink_reason(config, binary, inputs, command):
+    """
+    Tell why an executable (or a library) needs to be (re)linked.
+
+    :param config: The configuration to operate on.
+    :param binary: The executable.
+    :param inputs: The object files (and libraries) it's linked from.
+    :param command: The linking command.
+
+    :returns: The reason, or "None" if the executable is up to date.
+    """
+    import os
+
+    from .state import BINARIES, get_section
+
+    if not os.path.exists(binary):
+        return 'not built yet'
+
+    record = get_section(config, BINARIES).get(binary, {})
+
+    if record.get(_SIGNATURE) != get_signature(command):
+        return 'linking command changed'
+
+    newer_inputs = [x for x in inputs if not is_up_to_date(binary, [x])]
+
+    if newer_inputs:
+        return '{} input file(s) newer than the output'.format(len(newer_inputs))
+
+    return None
+
+####################################################################################################
+
+def record_link(config, binary, command, duration=None):
+    """
+    Remember how an executable was just linked, for the next builds to detect changes.
+
+    :param config: The configuration to operate on.
+    :param binary: The executable.
+    :param command: The linking command.
+    :param duration: The optional linking time, in seconds.
+    """
+    from .state import BINARIES, get_section
+
+    record = get_section(config, BINARIES)[binary] = {_SIGNATURE: get_signature(command)}
 
-    :returns: A list of recipes.
+    if duration is not None:
+        record[_DURATION] = round(duration, 3)
+
+####################################################################################################
+
+def get_link_duration(config, binary):
+    """
+    Return how long an executable took to link, the last time.
+
+    :param config: The configuration to operate on.
+    :param binary: The executable.
+
+    :returns: The linking time in seconds, or "None" if unknown.
+    """
+    from .state import BINARIES, get_section
+
+    return get_section(config, BINARIES).get(binary, {}).get(_DURATION)
+
+####################################################################################################
+
+def get_output_file(config):
+    """
+    Return the file a target links into.
+
+    :param config: The target's configuration.
+
+    :returns: The executable or library path, in the "binary" folder.
+    """
+    import os
+
+    from codestacker.constants import keys
+
+    names = {
+        keys.TYPE_EXECUTABLE: '{}',
+        keys.TYPE_SHARED: 'lib{}.so',
+        keys.TYPE_STATIC: 'lib{}.a'}
+
+    return os.path.join(config[keys.BINARY], names[config[keys.TYPE]].format(config[keys.OUTPUT]))
+
+####################################################################################################
+
+def get_object_file(config, source):
+    """
+    Return the object file a source file compiles into. The "build" folder mirrors the "sources"
+    one, so that homonymous source files don't clash; with "shards", the object files are spread
+    over that number of sub-folders instead (named after the source file and a hash of its path).
+
+    :param config: The configuration to operate on.
+    :param source: The source file.
+
+    :returns: The object file path, in the "build" folder.
+    """
+    import hashlib
+    import os
+
+    from codestacker.constants import keys
+
+    # Generated units (e.g. the batches of a unity build) are in the "build" folder already.
+    for folder in (config[keys.BUILD], config[keys.SOURCES]):
+        prefix = os.path.join(folder, '')
+
+        if source.startswith(prefix):
+            relative = source[len(prefix):]
+            break
+    else:
+        relative = os.path.basename(source)
+
+    name = os.path.splitext(relative)[0]
+
+    if config.get(keys.SHARDS) is None:
+        return os.path.join(config[keys.BUILD], name + '.o')
+
+    digest = hashlib.blake2b(relative.encode(), digest_size=4).hexdigest()
+    shard = str(int(digest, 16) % config[keys.SHARDS])
+
+    return os.path.join(
+        config[keys.BUILD], shard, '{}-{}.o'.format(os.path.basename(name), digest))
+
+####################################################################################################
+
+def get_depfile(target):
+    """
+    Return the dependency file written alongside an object file.
+
+    :param target: The object file.
+
+    :returns: The dependency file path.
+    """
+    import os
+
+    return os.path.splitext(target)[0] + '.d'
+
+####################################################################################################
+
+def get_dwo_file(target):
+    """
+    Return the debug information file written alongside an object file, in developer mode (split
+    DWARF).
+
+    :param target: The object file.
+
+    :returns: The debug information file path.
+    """
+    import os
+
+    return os.path.splitext(target)[0] + '.dwo'
+
+####################################################################################################
+
+_PCH_HEADER = 'codestacker_pch.hpp'
+
+def get_pch_header(config):
+    """
+    Return the header including all the headers to precompile (its precompiled version has the same
+    name, with a ".gch" suffix).
+
+    :param config: The configuration to operate on.
+
+    :returns: The header's path, in the "build" folder.
+    """
+    import os
+
+    from codestacker.constants import keys
+
+    return os.path.join(config[keys.BUILD], _PCH_HEADER)
+
+####################################################################################################
+
+def read_depfile(depfile):
+    """
+    Read the prerequisites listed in a dependency file.
+
+    :param depfile: The dependency file to read.
+
+    :returns: A list of prerequisites.
+    """
+    with open(depfile, 'r') as stream:
+        recipes = _parse_recipes(stream.read())
+
+    return [x for prerequisites in recipes for x in prerequisites]
+
+####################################################################################################
+
+def is_up_to_date(target, prerequisites, snapshot=None):
+    """
+    Check whether a file is newer than all its prerequisites.
+
+    :param target: The file to check.
+    :param prerequisites: The files it was produced from.
+    :param snapshot: An optional snapshot to get the prerequisites' modification times from.
+
+    :returns: "False" if the file or one of its prerequisites is missing, or if it is outdated.
+    """
+    import os
+
+    get_mtime = os.path.getmtime if snapshot is None else snapshot.get_mtime
+
+    try:
+        target_mtime = os.path.getmtime(target)
+
+        return all(get_mtime(x) <= target_mtime for x in prerequisites)
+    except OSError:
+        return False
+
+####################################################################################################
+
+def _get_recipes(config, files):
+    """
+    Get a list of recipes needed to (re)compute the dependencies, unless already scanned during this
+    build for another target with the same include settings (see "share_scans").
+
+    :param config: The configuration to operate on.
+    :param files: The source files to scan.
+
+    :returns: A dictionary of recipes (key = source file, value = prerequisites).
 
     :raises TechnicalError: a recipe failed to compute.
     """
-    import subprocess
+    from codestacker.constants import keys
 
-    from codestacker.constants             import extensions
-    from codestacker.errors                import errors
-    from codestacker.errors.exceptions     import TechnicalError
-    from codestacker.system.file_utilities import get_files
+    scans = config.get(keys.SCANS)
+
+    if scans is None:
+        scans = {}
+
+    recipes = {x: scans[x] for x in files if x in scans}
+    scanned = _scan(config, [x for x in files if x not in scans])
+
+    scans.update(scanned)
+    recipes.update(scanned)
+
+    return recipes
+
+####################################################################################################
+
+def _scan(config, files):
+    """
+    Scan source files for their recipes: by the preprocessor, or by the built-in include scanner
+    (the preprocessor scanning the files it can't). In verification mode, both are run, and their
+    differences reported (the preprocessor's recipes being used).
+
+    :param config: The configuration to operate on.
+    :param files: The source files to scan.
+
+    :returns: A dictionary of recipes (key = source file, value = prerequisites).
+
+    :raises TechnicalError: a recipe failed to compute.
+    """
+    import os
+
+    from .scanner              import get_differences, scan_includes
+    from codestacker.constants import keys
+    from codestacker.logger    import Logger
+
+    include_dir = config[keys.INCLUDE]
+    jobs = config[keys.JOBS]
+
+    if (config[keys.SCANNER] == keys.SCANNER_PREPROCESSOR) or (not files):
+        return _preprocess(files, include_dir, jobs)
+
+    recipes, to_preprocess = scan_includes(files, include_dir)
+
+    if config[keys.SCANNER] == keys.SCANNER_VERIFY:
+        reference = _preprocess(files, include_dir, jobs)
+        differences = get_differences(recipes, reference)
+
+        for source, (missing, extra) in sorted(differences.items()):
+            Logger.warning('Scanner mismatch for "{}": missing [{}], extra [{}]'.format(
+                os.path.relpath(source, config[keys.ROOT]), ', '.join(missing), ', '.join(extra)))
+
+        Logger.info('Scanner verified on {} file(s): {} mismatch(es)'.format(
+            len(reference), len(differences)))
+
+        return reference
+
+    recipes.update(_preprocess(to_preprocess, include_dir, jobs))
+
+    return recipes
+
+####################################################################################################
+
+# Beyond that size, batches get too coarse to balance the load between jobs.
+_MAX_BATCH_SIZE = 32
+
+def _preprocess(files, include_dir, jobs):
+    """
+    Get the recipes of source files from the preprocessor ("g++ -MM"). Source files are scanned by
+    batches, several preprocessors running at once.
+
+    :param files: The source files to scan.
+    :param include_dir: The include directory to look in.
+    :param jobs: The maximum number of preprocessors running at once.
+
+    :returns: A dictionary of recipes (key = source file, value = prerequisites).
+
+    :raises TechnicalError: a recipe failed to compute.
+    """
+    from .scheduler                    import run_jobs
+    from codestacker.errors            import errors
 
     preproc_command = ['g++', '-I', include_dir, '-MM']
     recipes = {}
 
-    for file in get_files(sources_dir, extensions.SOURCES):
-        try:
-            output = subprocess.run(
-                [*preproc_command, file],
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, encoding='UTF-8')
-        except subprocess.CalledProcessError as error:
-            raise TechnicalError(errors.RECIPE_FAILED, error=error.stderr)
+    if not files:
+        return recipes
+
+    # Spread the files over all the jobs, without making batches too big to balance.
+    batch_size = min(_MAX_BATCH_SIZE, -(-len(files) // jobs))
+    batches = [
+        ('Scanning {} file(s)'.format(len(files[i:i + batch_size])),
+         [*preproc_command, *files[i:i + batch_size]])
+        for i in range(0, len(files), batch_size)]
 
-        target, prerequisites = output.stdout.split(':', 1)
+    for output in run_jobs(batches, jobs, errors.RECIPE_FAILED, category='scan', quiet=True):
+        for prerequisites in _parse_recipes(output.stdout):
+            # The source file always comes first.
+            recipes[prerequisites[0]] = prerequisites
 
-        recipes[target] = prerequisites.replace('\\', '').split()
+    return recipes
+
+####################################################################################################
+
+def _parse_recipes(output):
+    """
+    Split the preprocessor's output into one recipe per source file. Recipes are kept apart rather
+    than keyed by target: source files of the same name (e.g. "a/util.cpp" and "b/util.cpp") all
+    have the same target ("util.o").
+
+    :param output: The output of a "g++ -MM" command, possibly covering several source files.
+
+    :returns: A list of recipes (prerequisites, the source file first).
+    """
+    recipes = []
+
+    # Join the continued lines: each remaining line is then a whole recipe.
+    for line in output.replace('\\\n', ' ').splitlines():
+        if not line.strip():
+            continue
+
+        _, prerequisites = line.split(':', 1)
+
+        recipes.append(prerequisites.replace('\\', '').split())
 
     return recipes
+
+####################################################################################################
+
+def _get_prerequisites(config, prerequisites):
+    """
+    Complete a source file's prerequisites with the precompiled header (if any): once precompiled,
+    its headers don't appear in the dependency files anymore.
+
+    :param config: The configuration to operate on.
+    :param prerequisites: The prerequisites, as read from a dependency file or scanned.
+
+    :returns: The completed prerequisites.
+    """
+    from codestacker.constants import keys
+
+    if config.get(keys.PCH) is None:
+        return prerequisites
+
+    return [*prerequisites, get_pch_header(config) + '.gch']
+
+####################################################################################################
+
+# Per object file record of the prerequisites' digests, in the order of the recorded prerequisites.
+_DIGESTS = 'digests'
+
+def _record_digests(config, target):
+    """
+    Record the digests of an object file's (recorded) prerequisites.
+
+    :param config: The configuration to operate on.
+    :param target: The object file.
+    """
+    from .index                            import get_prerequisites
+    from .state                            import FILES, OBJECTS, get_section
+    from codestacker.system.file_utilities import get_digest
+
+    cache = get_section(config, FILES)
+    record = get_section(config, OBJECTS).setdefault(target, {})
+
+    try:
+        record[_DIGESTS] = [get_digest(x, cache) for x in get_prerequisites(config, target)]
+    except OSError:
+        record.pop(_DIGESTS, None)
+
+####################################################################################################
+
+def _get_digests(config, target):
+    """
+    Return the recorded digests of an object file's prerequisites.
+
+    :param config: The configuration to operate on.
+    :param target: The object file.
+
+    :returns: A dictionary (key = prerequisite, value = digest), or "None" if not recorded.
+    """
+    from .index import get_prerequisites
+    from .state import OBJECTS, get_section
+
+    digests = get_section(config, OBJECTS).get(target, {}).get(_DIGESTS)
+
+    if digests is None:
+        return None
+
+    return dict(zip(get_prerequisites(config, target), digests))
+
+####################################################################################################
+
+def _is_unchanged(config, digests):
+    """
+    Check whether files still have the recorded contents.
+
+    :param config: The configuration to operate on.
+    :param digests: The recorded digests (key = file, value = digest).
+
+    :returns: "False" if one of the files is missing, or if its content changed.
+    """
+    from .state                            import FILES, get_section
+    from codestacker.system.file_utilities import get_digest
+
+    cache = get_section(config, FILES)
+
+    try:
+        return all(get_digest(x, cache) == digest for x, digest in digests.items())
+    except OSError:
+        return False
+
+####################################################################################################
+
+def _has_signature(records, target, signature):
+    """
+    Check whether an object file was compiled with the command of the given signature.
+
+    :param records: The object files' records.
+    :param target: The object file.
+    :param signature: The expected signature.
+
+    :returns: "True" if the signature matches, "False" if it doesn't or if none is recorded (e.g.
+              after the build state was lost: the command is then unknown).
+    """
+    return records.get(target, {}).get(_SIGNATURE) == signature
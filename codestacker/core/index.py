@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Reverse index of the prerequisites: the object files depending on each file (header or source), as
+recorded at their compilation, to know at once what a change affects without scanning anything.
+Only the object files' records are saved: the index is rebuilt from them when first needed.
+"""
+
+####################################################################################################
+
+# Per object file record of its prerequisites.
+_PREREQUISITES = 'prerequisites'
+
+def index_prerequisites(config, target, prerequisites):
+    """
+    Record the prerequisites of an object file, in place of the previous ones.
+
+    :param config: The configuration to operate on.
+    :param target: The object file.
+    :param prerequisites: The files it was produced from.
+    """
+    import os
+
+    from .state                import INDEX, OBJECTS, get_section
+    from codestacker.constants import keys
+
+    record = get_section(config, OBJECTS).setdefault(target, {})
+
+    unindex(config, target)
+
+    # Normalized, as the files to look up are (e.g. "#include "../Foo.hpp"").
+    record[_PREREQUISITES] = sorted(set(os.path.normpath(x) for x in prerequisites))
+
+    # Kept up to date once built.
+    index = config[keys.STATE].get(INDEX)
+
+    if index is not None:
+        for file in record[_PREREQUISITES]:
+            index.setdefault(file, []).append(target)
+
+####################################################################################################
+
+def get_prerequisites(config, target):
+    """
+    Return the recorded prerequisites of an object file.
+
+    :param config: The configuration to operate on.
+    :param target: The object file.
+
+    :returns: The sorted list of normalized prerequisites, or "None" if not indexed.
+    """
+    from .state import OBJECTS, get_section
+
+    return get_section(config, OBJECTS).get(target, {}).get(_PREREQUISITES)
+
+####################################################################################################
+
+def is_indexed(config, target):
+    """
+    Tell whether the prerequisites of an object file are indexed.
+
+    :param config: The configuration to operate on.
+    :param target: The object file.
+
+    :returns: The boolean answer.
+    """
+    return get_prerequisites(config, target) is not None
+
+####################################################################################################
+
+def unindex(config, target):
+    """
+    Forget the prerequisites of an object file.
+
+    :param config: The configuration to operate on.
+    :param target: The object file.
+    """
+    from .state                import INDEX, OBJECTS, get_section
+    from codestacker.constants import keys
+
+    prerequisites = get_section(config, OBJECTS).get(target, {}).pop(_PREREQUISITES, ())
+    index = config[keys.STATE].get(INDEX)
+
+    if index is None:
+        return
+
+    for file in prerequisites:
+        targets = index.get(file, [])
+
+        if target in targets:
+            targets.remove(target)
+
+        if not targets:
+            index.pop(file, None)
+
+####################################################################################################
+
+def get_index(config):
+    """
+    Return the reverse index of the prerequisites, built from the object files' records on first
+    use (it isn't saved with the build state).
+
+    :param config: The configuration to operate on.
+
+    :returns: A dictionary (key = file, value = object files depending on it).
+    """
+    from .state import INDEX, OBJECTS, get_section
+
+    index = get_section(config, INDEX)
+
+    if not index:
+        for target, record in get_section(config, OBJECTS).items():
+            for file in record.get(_PREREQUISITES, ()):
+                index.setdefault(file, []).append(target)
+
+    return index
+
+####################################################################################################
+
+def get_affected_units(config, files):
+    """
+    Return the translation units affected by changed files, from the index: the ones depending on
+    them (all the units of a target, for the headers of its precompiled header), the changed units
+    themselves, and the units never compiled. The build states are loaded if needed. In a unity
+    build, the batches must be made beforehand (see "prepare_unity"), for the units to be theirs.
+
+    :param config: The configuration to operate on.
+    :param files: The changed files.
+
+    :returns: A dictionary of units (key = (target name, unit), value = its target's configuration).
+    """
+    import os
+
+    from .helpers              import get_depfile, get_object_file, get_pch_header, get_targets
+    from .helpers              import get_units, read_depfile
+    from .state                import OBJECTS, get_section, load_states
+    from codestacker.constants import keys
+
+    files = set(os.path.normpath(os.path.abspath(x)) for x in files)
+    affected = {}
+
+    targets = get_targets(config)
+
+    load_states(targets)
+
+    for target in targets:
+        index = get_index(target)
+        records = get_section(target, OBJECTS)
+        objects = set(x for file in files for x in index.get(file, ()))
+
+        # The precompiled header affects all the units.
+        if target.get(keys.PCH) is not None:
+            try:
+                depfile = get_depfile(get_pch_header(target) + '.gch')
+                prerequisites = set(os.path.normpath(x) for x in read_depfile(depfile))
+            except OSError:
+                prerequisites = None
+
+            if (prerequisites is None) or (not files.isdisjoint(prerequisites)):
+                objects = None
+
+        for unit in get_units(target):
+            target_file = get_object_file(target, unit)
+
+            if (objects is None) or (target_file in objects) or (target_file not in records):
+                affected[(target.get(keys.TARGET), unit)] = target
+            elif os.path.normpath(unit) in files:
+                affected[(target.get(keys.TARGET), unit)] = target
+
+    return affected
+
+####################################################################################################
+
+def show_impact(config, files):
+    """
+    Show the translation units that changed files would get recompiled, and how long it would take
+    (from the durations of their last compilations).
+
+    :param config: The configuration to operate on.
+    :param files: The changed files.
+    """
+    import os
+
+    from .helpers              import get_duration, get_label, get_targets
+    from .state                import load_states
+    from .unity                import prepare_unity
+    from codestacker.constants import keys
+    from codestacker.logger    import Logger
+
+    Logger.begin('Impact of {} file(s)...'.format(len(files)))
+
+    targets = get_targets(config)
+
+    load_states(targets)
+
+    # The units the next build would compile (e.g. the batches of a unity build).
+    for target in targets:
+        prepare_unity(target)
+
+    durations = {
+        x: get_duration(y, x[1]) for x, y in get_affected_units(config, files).items()}
+
+    def get_key(item):
+        """Return the sort key of a unit: longest compilations first, unknown ones last."""
+        duration = durations[item]
+
+        return (duration is None, -(duration or 0), item[1], item[0] or '')
+
+    for name, unit in sorted(durations, key=get_key):
+        duration = durations[(name, unit)]
+
+        Logger.info('{} ({})'.format(
+            get_label(config, name, os.path.relpath(unit, config[keys.ROOT])),
+            'unknown' if duration is None else '{:.2f}s'.format(duration)))
+
+    known = [x for x in durations.values() if x is not None]
+    total = sum(known)
+
+    # No faster than the longest compilation.
+    estimate = max(total / config[keys.JOBS], max(known, default=0))
+
+    Logger.end('{} translation unit(s): {:.2f}s of compilation, about {:.2f}s with {} job(s)'
+               .format(len(durations), total, estimate, config[keys.JOBS]))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Precompiled header.
+"""
+
+####################################################################################################
+
+# Records of the precompiled header.
+_AUTO_INCLUDES = 'auto_includes'
+_SIGNATURE = 'signature'
+
+def prepare_pch(config, verbose):
+    """
+    Write the header including all the headers to precompile, and (re)compile it if needed. In
+    "auto" mode, the headers are the ones included by most of the source files; they are selected
+    once, then kept until the next clean-up.
+
+    :param config: The configuration to operate on.
+    :param verbose: The boolean flag to output the precompilation command.
+
+    :raises TechnicalError: the header precompilation failed.
+    """
+    import os
+
+    from .helpers                          import get_compile_command, get_depfile, get_pch_header
+    from .helpers                          import get_recipes, get_signature
+    from .scheduler                        import run_jobs
+    from .state                            import PCH, get_section
+    from codestacker.constants             import keys
+    from codestacker.errors                import errors
+    from codestacker.logger                import Logger
+    from codestacker.system.file_utilities import write_if_changed
+
+    if config.get(keys.PCH) is None:
+        return
+
+    header = get_pch_header(config)
+    record = get_section(config, PCH)
+
+    if config[keys.PCH] != keys.PCH_AUTO:
+        includes = ['<{}>'.format(x) for x in config[keys.PCH]]
+
+        record.pop(_AUTO_INCLUDES, None)
+    elif _AUTO_INCLUDES in record:
+        includes = record[_AUTO_INCLUDES]
+    else:
+        includes = ['"{}"'.format(x) for x in _select_headers(get_recipes(config))]
+
+        Logger.info('Headers to precompile: {}'.format(len(includes)))
+
+        record[_AUTO_INCLUDES] = includes
+
+    write_if_changed(header, ''.join('#include {}\n'.format(x) for x in includes))
+
+    precompiled = header + '.gch'
+    depfile = get_depfile(precompiled)
+
+    command = [*get_compile_command(config, with_pch=False), '-x', 'c++-header', header]
+    command.extend(['-o', precompiled, '-MMD', '-MF', depfile])
+
+    signature = get_signature(command)
+
+    if (record.get(_SIGNATURE) == signature) and _is_precompiled(precompiled, depfile):
+        return
+
+    # Not to be used if ever the precompilation fails.
+    if os.path.exists(precompiled):
+        os.unlink(precompiled)
+
+    run_jobs(
+        [('Precompiling {}'.format(os.path.basename(header)), command)],
+        1, errors.PRECOMPILATION_FAILED, verbose, 'precompile')
+
+    record[_SIGNATURE] = signature
+
+####################################################################################################
+
+# Headers included by no more than this share of the source files are not worth precompiling.
+_MIN_SHARE = 0.5
+_MAX_HEADERS = 16
+
+def _select_headers(recipes):
+    """
+    Select the headers included by most of the source files.
+
+    :param recipes: The recipes of all the source files.
+
+    :returns: A list of headers, in inclusion order.
+    """
+    import collections
+
+    from codestacker.constants import extensions
+
+    counts = collections.Counter()
+    first_seen = {}
+
+    for prerequisites in recipes.values():
+        for index, file in enumerate(prerequisites):
+            if file.endswith(extensions.HEADERS):
+                counts[file] += 1
+                first_seen.setdefault(file, (index, len(first_seen)))
+
+    candidates = [x for x, count in counts.items() if count > _MIN_SHARE * len(recipes)]
+    candidates = sorted(candidates, key=lambda x: (-counts[x], x))[:_MAX_HEADERS]
+
+    return sorted(candidates, key=lambda x: first_seen[x])
+
+####################################################################################################
+
+def _is_precompiled(precompiled, depfile):
+    """
+    Check whether the precompiled header is newer than all its prerequisites.
+
+    :param precompiled: The precompiled header.
+    :param depfile: Its dependency file.
+
+    :returns: "False" if a file is missing, or if the precompiled header is outdated.
+    """
+    from .helpers import is_up_to_date, read_depfile
+
+    try:
+        return is_up_to_date(precompiled, read_depfile(depfile))
+    except OSError:
+        return False
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Built-in include scanner: the prerequisites of source files found by following their "#include"
+directives, without running the preprocessor ("g++ -MM").
+
+Conditional directives aren't evaluated: the headers included by every branch (even "#if 0" ones)
+are taken, over-approximating the dependencies rather than missing one. As with "g++ -MM", the
+headers found in neither the including file's folder nor the include folder (system headers) are
+left out.
+"""
+
+####################################################################################################
+
+# Parsed includes of each file scanned so far (key = file, value = (stat, includes)), kept from
+# one build to the next (in watch mode, or by the daemon).
+_PARSED = {}
+
+def scan_includes(files, include_dir):
+    """
+    List the prerequisites of source files: each one, then the headers it includes (directly or
+    not), in inclusion order.
+
+    :param files: The source files to scan.
+    :param include_dir: The include directory to look in.
+
+    :returns: A dictionary of recipes (key = source file, value = prerequisites), and the list of
+              source files left to the preprocessor (including computed includes).
+    """
+    from codestacker.tracer import Tracer
+
+    recipes = {}
+    to_preprocess = []
+
+    # Resolved includes (key = (including folder, name, quoted)), for this scan.
+    resolved = {}
+
+    with Tracer.span('Scan includes of {} file(s)'.format(len(files)), 'includes'):
+        for file in files:
+            prerequisites = _scan(file, include_dir, resolved)
+
+            if prerequisites is None:
+                to_preprocess.append(file)
+            else:
+                recipes[file] = prerequisites
+
+    return recipes, to_preprocess
+
+####################################################################################################
+
+def get_differences(recipes, reference):
+    """
+    Compare the recipes of the scanner with the preprocessor's ones.
+
+    :param recipes: The recipes of the scanner.
+    :param reference: The recipes of the preprocessor.
+
+    :returns: The differences (key = source file, value = (missing prerequisites, extra ones)).
+    """
+    import os
+
+    differences = {}
+
+    for source, prerequisites in reference.items():
+        expected = set(os.path.normpath(x) for x in prerequisites)
+        found = set(os.path.normpath(x) for x in recipes.get(source, ()))
+
+        if expected != found:
+            differences[source] = (sorted(expected - found), sorted(found - expected))
+
+    return differences
+
+####################################################################################################
+
+def _scan(source, include_dir, resolved):
+    """
+    List the prerequisites of a source file, depth first.
+
+    :param source: The source file.
+    :param include_dir: The include directory to look in.
+    :param resolved: The includes resolved so far.
+
+    :returns: The prerequisites, or "None" if a computed include was met.
+    """
+    import os
+
+    prerequisites = [source]
+    seen = set([os.path.normpath(source)])
+
+    # The including files' folders, and their includes left to visit.
+    to_visit = [(os.path.dirname(source), iter(_get_includes(source)))]
+
+    while to_visit:
+        directory, includes = to_visit[-1]
+
+        for name, quoted in includes:
+            if name is None:
+                return None
+
+            key = (directory, name, quoted)
+
+            if key not in resolved:
+                resolved[key] = _resolve(directory, name, quoted, include_dir)
+
+            header = resolved[key]
+
+            if (header is None) or (header in seen):
+                continue
+
+            seen.add(header)
+            prerequisites.append(header)
+
+            to_visit.append((os.path.dirname(header), iter(_get_includes(header))))
+            break
+        else:
+            to_visit.pop()
+
+    return prerequisites
+
+####################################################################################################
+
+def _resolve(directory, name, quoted, include_dir):
+    """
+    Find an included file: in the including file's folder (for quoted includes), then in the
+    include folder.
+
+    :param directory: The including file's folder.
+    :param name: The included file's name.
+    :param quoted: The boolean telling whether the name was quoted, or between angle brackets.
+    :param include_dir: The include directory to look in.
+
+    :returns: The file's normalized path, or "None" if not found (e.g. a system header).
+    """
+    import os
+
+    for folder in ([directory, include_dir] if quoted else [include_dir]):
+        path = os.path.join(folder, name)
+
+        if os.path.isfile(path):
+            return os.path.normpath(path)
+
+    return None
+
+####################################################################################################
+
+# "#include "file"", "#include <file>", or a computed include (e.g. "#include HEADER").
+_INCLUDE = rb'(?m)^[ \t]*#[ \t]*include[ \t]*(?:"([^"\n]+)"|<([^>\n]+)>|([^\s/].*))'
+
+def _get_includes(file):
+    """
+    Return the includes of a file, parsed once per version of the file (told by its size and
+    modification time).
+
+    :param file: The file to parse.
+
+    :returns: A list of (name, quoted) pairs, in order ("None" as name, for a computed include).
+    """
+    import os
+    import re
+
+    try:
+        status = os.stat(file)
+    except OSError:
+        return []
+
+    stamp = (status.st_mtime_ns, status.st_size)
+    parsed = _PARSED.get(file)
+
+    if (parsed is not None) and (parsed[0] == stamp):
+        return parsed[1]
+
+    try:
+        with open(file, 'rb') as stream:
+            content = stream.read()
+    except OSError:
+        return []
+
+    includes = []
+
+    for quoted, angled, computed in re.findall(_INCLUDE, content):
+        if computed:
+            includes.append((None, False))
+        else:
+            includes.append((os.fsdecode(quoted or angled), bool(quoted)))
+
+    _PARSED[file] = (stamp, includes)
+
+    return includes
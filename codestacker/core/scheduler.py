@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Concurrent execution of external commands.
+"""
+
+####################################################################################################
+
+def run_jobs(jobs, max_jobs, error_message, verbose=False, category='compile', quiet=False):
+    """
+    Run a list of commands, keeping at most "max_jobs" of them running at once. On the first
+    failure, no new command is started; the ones already running are waited for.
+
+    Each command is traced (if tracing) in the slot it ran in, along with its process' id, CPU time
+    and peak memory usage.
+
+    :param jobs: A list of (label, command) pairs; the label is logged when the command starts. A
+                 command is either a list of arguments, or a function returning a completed
+                 process.
+    :param max_jobs: The maximum number of commands running at once.
+    :param error_message: The error message to raise with, if a command fails.
+    :param verbose: The boolean flag to output the commands.
+    :param category: The commands' category, for tracing.
+    :param quiet: The boolean flag not to log the labels (they're still traced).
+
+    :returns: The list of completed processes, in the same order as "jobs" (each one with its
+              "duration", in seconds).
+
+    :raises TechnicalError: one or several commands failed.
+    """
+    from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+    from codestacker.errors.exceptions import TechnicalError
+    from codestacker.logger            import Logger
+    from codestacker.tracer            import Tracer
+
+    results = [None] * len(jobs)
+    pending = iter(enumerate(jobs))
+    running = {}
+    failures = []
+
+    # Job slots, numbered from 1 (0 being the main thread's).
+    free_slots = list(range(max_jobs, 0, -1))
+
+    with ThreadPoolExecutor(max_workers=max_jobs) as executor:
+        while True:
+            # Fill the free slots, unless a command already failed.
+            while (not failures) and (len(running) < max_jobs):
+                try:
+                    index, (label, command) = next(pending)
+                except StopIteration:
+                    break
+
+                if not quiet:
+                    Logger.info(label)
+
+                if verbose and (not callable(command)):
+                    Logger.info('Execute:\n{}'.format(' '.join(command)))
+
+                running[executor.submit(_run, command)] = (index, free_slots.pop())
+
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                result = future.result()
+                index, slot = running.pop(future)
+                results[index] = result
+
+                free_slots.append(slot)
+
+                if Tracer.is_started():
+                    _trace(jobs[index][0], category, slot, result)
+
+                if result.returncode != 0:
+                    failures.append(index)
+
+    # The failed jobs' labels tell which ones (e.g. which configuration's, when several are built).
+    if failures:
+        raise TechnicalError(
+            error_message, ', '.join(jobs[x][0] for x in sorted(failures)),
+            ''.join(results[x].stderr for x in sorted(failures)))
+
+    return results
+
+####################################################################################################
+
+def _run(command):
+    """
+    Run a single command.
+
+    :param command: The command to run (or the function to call).
+
+    :returns: The completed process, along with its start and duration.
+    """
+    import time
+
+    start = time.perf_counter()
+    result = command() if callable(command) else run_process(command)
+
+    result.start = start
+    result.duration = time.perf_counter() - start
+
+    return result
+
+####################################################################################################
+
+def run_process(command, encoding='UTF-8'):
+    """
+    Run a command, capturing its outputs, like "subprocess.run" does; its resources usage is
+    captured as well.
+
+    :param command: The command to run, as a list of arguments.
+    :param encoding: The encoding of the outputs ("None" to keep them as bytes).
+
+    :returns: The completed process, along with its "pid" and "rusage".
+    """
+    import os
+    import selectors
+    import subprocess
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    outputs = {process.stdout: [], process.stderr: []}
+
+    # Both outputs read at once, not to block the command on a full pipe.
+    with selectors.DefaultSelector() as selector:
+        for stream in outputs:
+            selector.register(stream, selectors.EVENT_READ)
+
+        while selector.get_map():
+            for key, _ in selector.select():
+                data = os.read(key.fd, 1 << 16)
+
+                if data:
+                    outputs[key.fileobj].append(data)
+                else:
+                    selector.unregister(key.fileobj)
+                    key.fileobj.close()
+
+    # Waited for by hand, to get its resources usage.
+    _, status, rusage = os.wait4(process.pid, 0)
+
+    # As "subprocess" does: the exit code, or the negated number of the signal that killed it.
+    if os.WIFSIGNALED(status):
+        process.returncode = -os.WTERMSIG(status)
+    else:
+        process.returncode = os.WEXITSTATUS(status)
+
+    stdout, stderr = (b''.join(outputs[x]) for x in (process.stdout, process.stderr))
+
+    if encoding is not None:
+        stdout, stderr = stdout.decode(encoding), stderr.decode(encoding)
+
+    result = subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
+    result.pid = process.pid
+    result.rusage = rusage
+
+    return result
+
+####################################################################################################
+
+def _trace(label, category, slot, result):
+    """
+    Trace a completed job.
+
+    :param label: The job's label.
+    :param category: The job's category.
+    :param slot: The slot it ran in.
+    :param result: Its completed process.
+    """
+    from codestacker.tracer import Tracer
+
+    args = {'slot': slot, 'returncode': result.returncode}
+    rusage = getattr(result, 'rusage', None)
+
+    if rusage is not None:
+        args['pid'] = result.pid
+        args['cpu_time'] = round(rusage.ru_utime + rusage.ru_stime, 3)
+        # In KiB.
+        args['max_rss'] = rusage.ru_maxrss
+
+    Tracer.add(label, category, result.start, result.start + result.duration, slot, args)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Build state, persisted in the "build" folder from one build to the next.
+"""
+
+####################################################################################################
+
+# State sections.
+BINARIES = 'binaries'
+DIRECTORIES = 'directories'
+FILES = 'files'
+INDEX = 'index'  # In memory only (rebuilt from the objects' records).
+OBJECTS = 'objects'
+PCH = 'pch'
+UNITY = 'unity'
+
+_STATE_FILE = '.codestacker.json'
+
+def load_state(config, snapshot=None):
+    """
+    Load the state left by the previous build into the configuration (an unreadable state is
+    ignored, as if there were none), along with a file system snapshot for this build.
+
+    :param config: The configuration to operate on.
+    :param snapshot: An optional snapshot to share with other configurations (a new one otherwise).
+    """
+    import os
+
+    from codestacker.constants             import keys
+    from codestacker.errors.exceptions     import Error
+    from codestacker.logger                import Logger
+    from codestacker.system.file_utilities import Snapshot
+    from codestacker.system.json_handler   import load_json
+    from codestacker.tracer                import Tracer
+
+    state_file = os.path.join(config[keys.BUILD], _STATE_FILE)
+    state = {}
+
+    if os.path.isfile(state_file):
+        try:
+            with Tracer.span('Load state', 'state'):
+                state = load_json(state_file)
+        except Error:
+            Logger.warning('Build state "{}" unreadable: ignored'.format(state_file))
+
+    config[keys.STATE] = state
+
+    if snapshot is None:
+        config[keys.SNAPSHOT] = Snapshot(state.pop(DIRECTORIES, None))
+    else:
+        snapshot.extend(state.pop(DIRECTORIES, None))
+
+        config[keys.SNAPSHOT] = snapshot
+
+####################################################################################################
+
+def load_states(targets):
+    """
+    Load the states of targets, unless already loaded (e.g. by the previous build, in watch mode).
+    The targets with the same "include" and "sources" folders (e.g. of several configurations)
+    share a file system snapshot: each folder is walked once for all.
+
+    :param targets: The targets' configurations.
+    """
+    from codestacker.constants import keys
+
+    snapshots = {}
+
+    for target in targets:
+        if target.get(keys.STATE) is not None:
+            continue
+
+        key = (target[keys.INCLUDE], target[keys.SOURCES])
+
+        load_state(target, snapshots.get(key))
+
+        snapshots[key] = target[keys.SNAPSHOT]
+
+####################################################################################################
+
+def save_state(config):
+    """
+    Save the build state held by the configuration, for the next build.
+
+    :param config: The configuration to operate on.
+    """
+    import os
+
+    from codestacker.constants           import keys
+    from codestacker.system.json_handler import dump_json
+    from codestacker.tracer              import Tracer
+
+    state = dict(config[keys.STATE])
+    state.pop(INDEX, None)
+    state[DIRECTORIES] = config[keys.SNAPSHOT].listings
+
+    with Tracer.span('Save state', 'state'):
+        dump_json(state, os.path.join(config[keys.BUILD], _STATE_FILE))
+
+####################################################################################################
+
+def get_section(config, section):
+    """
+    Return one section of the build state, creating it if needed.
+
+    :param config: The configuration to operate on.
+    :param section: The section's name.
+
+    :returns: The section, as a dictionary.
+    """
+    from codestacker.constants import keys
+
+    return config[keys.STATE].setdefault(section, {})
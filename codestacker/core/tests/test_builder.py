@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for builder.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestBuilder(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        files = {
+            'include/core.hpp': 'int core();\n',
+            'include/plugin.hpp': 'int plugin();\n',
+            'src/core/core.cpp': '#include "core.hpp"\nint core() { return 1; }\n',
+            'src/plugin/plugin.cpp': '#include "plugin.hpp"\nint plugin() { return 2; }\n',
+            'src/app/main.cpp':
+                '#include "core.hpp"\n#include "plugin.hpp"\n'
+                'int main() { return plugin() - core() - 1; }\n',
+            'src/tool/main.cpp': '#include "core.hpp"\nint main() { return core() - 1; }\n'}
+
+        for name, content in files.items():
+            os.makedirs(os.path.dirname(os.path.join(root, name)), exist_ok=True)
+
+            with open(os.path.join(root, name), 'w') as stream:
+                stream.write(content)
+
+        self.config = {
+            '_root': root,
+            'binary': 'bin',
+            'build': 'build',
+            'include': 'include',
+            'jobs': 2,
+            'targets': {
+                'core': {'sources': 'src/core', 'type': 'static', 'flags': ['-fPIC']},
+                'plugin': {'sources': 'src/plugin', 'type': 'shared'},
+                'app': {'sources': 'src/app', 'output': 'App', 'depends': ['core', 'plugin']},
+                'tool': {'sources': 'src/tool', 'depends': ['core']}}}
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def _build(self, changed=None):
+        """Build the project from scratch (state reloaded), and return the modified outputs."""
+        import copy
+
+        from codestacker.config_inspector.adaptor   import adapt_config
+        from codestacker.config_inspector.validator import validate_config
+        from codestacker.core.builder               import build
+
+        config = copy.deepcopy(self.config)
+
+        validate_config(config)
+        adapt_config(config)
+
+        before = self._get_times()
+
+        build(config, False, changed)
+
+        after = self._get_times()
+
+        return set(x for x in after if before.get(x) != after[x])
+
+    def _get_times(self):
+        """Return the modification times of the outputs."""
+        import os
+
+        bin_dir = os.path.join(self.temp_dir.name, 'bin')
+
+        if not os.path.isdir(bin_dir):
+            return {}
+
+        return {x: os.stat(os.path.join(bin_dir, x)).st_mtime_ns for x in os.listdir(bin_dir)}
+
+    def test_build_targets(self):
+        """Test building several targets, then rebuilding the ones downstream of a change."""
+        import os
+        import subprocess
+        import time
+
+        root = self.temp_dir.name
+
+        self.assertEqual(set(['libcore.a', 'libplugin.so', 'App', 'tool']), self._build())
+        self.assertEqual(0, subprocess.run([os.path.join(root, 'bin', 'App')]).returncode)
+
+        # Nothing to do.
+        self.assertEqual(set(), self._build())
+
+        # Only the application depends on the plugin.
+        future = time.time() + 10
+
+        os.utime(os.path.join(root, 'src', 'plugin', 'plugin.cpp'), (future, future))
+
+        self.assertEqual(set(['libplugin.so', 'App']), self._build())
+
+    def test_build_dev_mode(self):
+        """Test building in developer mode, with the object files in response files."""
+        import glob
+        import os
+        import subprocess
+
+        from unittest import mock
+
+        root = self.temp_dir.name
+
+        self.config['dev'] = True
+
+        with mock.patch('codestacker.core.builder._MAX_OBJECTS_LENGTH', 0):
+            self.assertEqual(set(['libcore.a', 'libplugin.so', 'App', 'tool']), self._build())
+
+        self.assertEqual(0, subprocess.run([os.path.join(root, 'bin', 'App')]).returncode)
+
+        # Split debug information, and response files.
+        self.assertTrue(glob.glob(os.path.join(root, 'build', '**', '*.dwo'), recursive=True))
+        self.assertTrue(os.path.isfile(os.path.join(root, 'build', 'app', 'App.rsp')))
+
+        # Linked in the same way, with or without response files.
+        self.assertEqual(set(), self._build())
+
+    def test_build_unity_changed(self):
+        """Test rebuilding the batches of a unity build affected by changed files."""
+        import os
+        import subprocess
+        import time
+
+        root = self.temp_dir.name
+        header = os.path.join(root, 'include', 'core.hpp')
+        source = os.path.join(root, 'src', 'tool', 'extra.cpp')
+
+        with open(source, 'w') as stream:
+            stream.write('int extra() { return 0; }\n')
+
+        self.config['jobs'] = 1
+        self.config['unity'] = True
+
+        self.assertEqual(set(['libcore.a', 'libplugin.so', 'App', 'tool']), self._build())
+
+        # A header included by the batches.
+        future = time.time() + 10
+
+        os.utime(header, (future, future))
+
+        self.assertEqual(set(['libcore.a', 'App', 'tool']), self._build([header]))
+
+        # An edited source file leaves its batch, recompiled without it.
+        with open(source, 'a') as stream:
+            stream.write('int other() { return 1; }\n')
+
+        os.utime(source, (future + 10, future + 10))
+
+        self.assertEqual(set(['tool']), self._build([source]))
+        self.assertEqual(0, subprocess.run([os.path.join(root, 'bin', 'tool')]).returncode)
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
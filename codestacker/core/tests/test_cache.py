@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for cache.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestCache(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        self.source = os.path.join(root, 'Foo.cpp')
+        self.target = os.path.join(root, 'Foo.o')
+        self.depfile = os.path.join(root, 'Foo.d')
+
+        with open(self.source, 'w') as stream:
+            stream.write('int foo() { return 0; }\n')
+
+        self.config = {'_root': root, 'cache': os.path.join(root, 'cache'), 'cache_size': 1}
+        self.command = ['g++', '-I', root]
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def _compile(self):
+        """Compile the source file through a new cache instance, as a new build would."""
+        from codestacker.core.cache import Cache
+
+        cache = Cache(self.config)
+        result = cache.compile(self.command, self.source, self.target, self.depfile)
+
+        cache.close()
+
+        self.assertEqual(0, result.returncode)
+
+        return cache.get_stats()
+
+    def test_cache(self):
+        """Test the compilation cache."""
+        import os
+
+        from codestacker.core.cache import Cache
+
+        # Cache miss.
+        stats = self._compile()
+
+        self.assertEqual((0, 1), (stats['hits'], stats['misses']))
+        self.assertTrue(os.path.isfile(self.depfile))
+
+        # Cache hit.
+        os.unlink(self.target)
+
+        stats = self._compile()
+
+        self.assertEqual((1, 1), (stats['hits'], stats['misses']))
+        self.assertTrue(os.path.isfile(self.target))
+
+        # Another compilation command.
+        self.command.append('-O2')
+
+        stats = self._compile()
+
+        self.assertEqual((1, 2), (stats['hits'], stats['misses']))
+        self.assertEqual(2, Cache(self.config).get_usage()[0])
+
+        # Clear-up.
+        Cache(self.config).clear()
+
+        self.assertEqual((0, 0), Cache(self.config).get_usage())
+
+    def test_cache_copies(self):
+        """Test the cache shared by two copies of a project, at different roots."""
+        import os
+
+        from codestacker.core.cache import Cache
+
+        cache_dir = os.path.join(self.temp_dir.name, 'cache')
+        results = []
+
+        for copy in ('first', 'second'):
+            root = os.path.join(self.temp_dir.name, copy)
+
+            os.makedirs(os.path.join(root, 'include'))
+            os.makedirs(os.path.join(root, 'src'))
+
+            with open(os.path.join(root, 'include', 'Foo.hpp'), 'w') as stream:
+                stream.write('int foo();\n')
+
+            with open(os.path.join(root, 'src', 'Foo.cpp'), 'w') as stream:
+                stream.write('#include "Foo.hpp"\nconst char* file() { return __FILE__; }\n')
+
+            cache = Cache({'_root': root, 'cache': cache_dir, 'cache_size': 1})
+            result = cache.compile(
+                ['g++', '-g', '-I', os.path.join(root, 'include')],
+                os.path.join(root, 'src', 'Foo.cpp'), os.path.join(root, 'Foo.o'),
+                os.path.join(root, 'Foo.d'))
+
+            cache.close()
+
+            self.assertEqual(0, result.returncode)
+
+            results.append(cache.get_stats())
+
+        # Compiled by the first copy, restored by the second one.
+        self.assertEqual((0, 1), (results[0]['hits'], results[0]['misses']))
+        self.assertEqual((1, 1), (results[1]['hits'], results[1]['misses']))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
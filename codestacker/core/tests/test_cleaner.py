@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for cleaner.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestCleaner(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        self.src_dir = os.path.join(root, 'src')
+        self.build_dir = os.path.join(root, 'build')
+        self.bin_dir = os.path.join(root, 'bin')
+
+        # Sources, and their compilation results (the first two in a batch of a unity build).
+        for name in (
+                'src/net/socket.cpp', 'src/core/types.cpp', 'src/core/main.cpp',
+                'build/net/socket.o', 'build/net/socket.d', 'build/core/types.o',
+                'build/core/main.o', 'build/codestacker_unity_0.o', 'build/codestacker_unity_0.d',
+                'build/codestacker_unity_1.o', 'bin/Test'):
+            os.makedirs(os.path.dirname(os.path.join(root, name)), exist_ok=True)
+
+            with open(os.path.join(root, name), 'w'):
+                pass
+
+        self.config = {
+            '_root': root,
+            '_state': {
+                'unity': {
+                    'batches': {
+                        os.path.join(self.build_dir, 'codestacker_unity_0.cpp'): [
+                            os.path.join(self.src_dir, 'core', 'types.cpp'),
+                            os.path.join(self.src_dir, 'net', 'socket.cpp')],
+                        os.path.join(self.build_dir, 'codestacker_unity_1.cpp'): [
+                            os.path.join(self.src_dir, 'core', 'main.cpp')]}}},
+            'binary': self.bin_dir,
+            'build': self.build_dir,
+            'output': 'Test',
+            'sources': self.src_dir,
+            'type': 'executable'}
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def test_get_part(self):
+        """Test the compilation results of a target, or of a folder of sources."""
+        import os
+
+        from codestacker.core.cleaner      import _get_part
+        from codestacker.errors            import errors
+        from codestacker.errors.exceptions import FunctionalError
+
+        # A target: its folder and its output.
+        self.assertEqual(
+            ([self.build_dir], [os.path.join(self.bin_dir, 'Test')]),
+            _get_part(self.config, 'Test'))
+
+        # A folder: its sources' files, and the ones of the batch including them.
+        folders, files = _get_part(self.config, os.path.join(self.src_dir, 'net'))
+
+        self.assertEqual([], folders)
+        self.assertEqual(
+            sorted(os.path.join(self.build_dir, x) for x in (
+                'net/socket.o', 'net/socket.d', 'codestacker_unity_0.o',
+                'codestacker_unity_0.d')),
+            sorted(files))
+
+        # Neither a target nor a folder.
+        with self.assertRaises(FunctionalError) as context:
+            _get_part(self.config, '#dummy#')
+
+        context.exception.print()
+        self.assertEqual(context.exception.args[0], errors.UNKNOWN_PART)
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
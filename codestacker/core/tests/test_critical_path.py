@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for critical_path.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestCriticalPath(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        common = {'_root': '/project', 'binary': '/project/bin'}
+
+        self.config = {
+            '_root': '/project',
+            'jobs': 2,
+            'targets': {
+                'core': dict(common, _target='core', output='core', type='static', depends=[]),
+                'app': dict(common, _target='app', output='App', type='executable',
+                            depends=['core']),
+                'tool': dict(common, _target='tool', output='tool', type='executable',
+                             depends=['core'])}}
+
+    def test_get_critical_path(self):
+        """Test the duration of the compilation phase and of the levels of linkings."""
+        from codestacker.core.critical_path import get_critical_path
+
+        durations = {
+            ('core', '/project/src/core/a.cpp'): 1.0,
+            ('app', '/project/src/app/main.cpp'): 3.0,
+            ('tool', '/project/src/tool/main.cpp'): 0.5}
+
+        # Bounded by the longest compilation, then by the longest linking of each level.
+        self.assertEqual(
+            (4.1, ['src/app/main.cpp', 'linking libcore.a', 'linking App']),
+            get_critical_path(self.config, durations, {'app': 0.5, 'core': 0.6, 'tool': 0.4}))
+
+        # Bounded by the compilation time shared among the jobs.
+        durations[('tool', '/project/src/tool/main.cpp')] = 3.0
+
+        self.assertEqual(
+            (3.5, ['3 compilations on 2 job(s)']), get_critical_path(self.config, durations, {}))
+
+        # Measured durations of the steps.
+        self.assertEqual(
+            (4.0, ['3 compilations on 2 job(s)', 'linking App']),
+            get_critical_path(self.config, durations, {'app': 0.5}, [3.2, 0.8]))
+
+    def test_sort_by_priority(self):
+        """Test the order of the compilations."""
+        import os
+        import tempfile
+
+        from codestacker.constants             import keys
+        from codestacker.core.critical_path    import sort_by_priority
+        from codestacker.system.file_utilities import Snapshot
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src_dir = os.path.join(temp_dir, 'src')
+            build_dir = os.path.join(temp_dir, 'build')
+
+            os.makedirs(src_dir)
+            os.makedirs(build_dir)
+
+            objects = {}
+
+            # Compiled at 10 (modified at 20 for "edited.cpp"), with their last durations.
+            for name, duration in (('short', 1), ('long', 3), ('edited', 0.5), ('new', None)):
+                source = os.path.join(src_dir, name + '.cpp')
+                object_file = os.path.join(build_dir, name + '.o')
+
+                for file, mtime in ((source, 20 if name == 'edited' else 0), (object_file, 10)):
+                    open(file, 'w').close()
+                    os.utime(file, (mtime, mtime))
+
+                if duration is not None:
+                    objects[object_file] = {'duration': duration}
+
+            config = {
+                keys.ROOT: temp_dir,
+                keys.SNAPSHOT: Snapshot(),
+                keys.STATE: {'objects': objects},
+                'binary': os.path.join(temp_dir, 'bin'),
+                'build': build_dir,
+                'depends': [],
+                'detection': 'timestamp',
+                'jobs': 2,
+                'output': 'Test',
+                'sources': src_dir,
+                'type': 'executable'}
+
+            files = [(config, [], os.path.join(src_dir, x + '.cpp'))
+                     for x in ('short', 'new', 'edited', 'long')]
+
+            files, (length, path) = sort_by_priority(config, files)
+
+            # Edited first, then the longest first (the unknown duration being the average one).
+            self.assertEqual(
+                ['edited', 'long', 'new', 'short'],
+                [os.path.splitext(os.path.basename(x))[0] for _, _, x in files])
+            self.assertEqual((3, ['src/long.cpp', 'linking Test']), (length, path))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for helpers.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestHelpers(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        self.src_dir = os.path.join(root, 'src')
+        self.build_dir = os.path.join(root, 'build')
+
+        os.makedirs(self.src_dir)
+        os.makedirs(self.build_dir)
+
+        self.files = {
+            'Foo.hpp': 'int foo();\n',
+            'Foo.cpp': '#include "Foo.hpp"\nint foo() { return 0; }\n',
+            'main.cpp': '#include "Foo.hpp"\nint main() { return foo(); }\n',
+            'Bar.cpp': 'int bar() { return 1; }\n'}
+
+        for name, content in self.files.items():
+            with open(os.path.join(self.src_dir, name), 'w') as stream:
+                stream.write(content)
+
+        self.config = {
+            '_root': root,
+            'build': self.build_dir,
+            'detection': 'timestamp',
+            'flags': set(['-Wall']),
+            'include': self.src_dir,
+            'jobs': 2,
+            'scanner': 'preprocessor',
+            'sources': self.src_dir}
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def _touch(self, path, offset):
+        """Create a file if needed, and shift its modification time."""
+        import os
+        import time
+
+        with open(path, 'a'):
+            pass
+
+        os.utime(path, (time.time() + offset, time.time() + offset))
+
+    def _compile(self, source, offset):
+        """Create the object file of a source file, as compiled with the current command."""
+        import os
+
+        from codestacker.core.helpers import get_compile_command, get_signature
+        from codestacker.core.state   import OBJECTS, get_section, load_state
+
+        target = os.path.join(self.build_dir, os.path.basename(source)[:-4] + '.o')
+
+        if '_state' not in self.config:
+            load_state(self.config)
+
+        self._touch(target, offset)
+
+        get_section(self.config, OBJECTS).setdefault(target, {})['signature'] = get_signature(
+            get_compile_command(self.config))
+
+    def _get_files_to_recompile(self):
+        """Get the files to recompile, as a new build would."""
+        from codestacker.core.helpers import get_files_to_recompile
+        from codestacker.core.state   import load_state, save_state
+
+        if '_state' in self.config:
+            save_state(self.config)
+
+        load_state(self.config)
+
+        return get_files_to_recompile(self.config)
+
+    def test_get_files_to_recompile(self):
+        """Test the detection of the files to recompile."""
+        import os
+
+        sources = set(os.path.join(self.src_dir, x) for x in self.files if x.endswith('.cpp'))
+
+        # No object file at all.
+        self.assertEqual(sources, self._get_files_to_recompile())
+
+        # Object files of an unknown command (e.g. the build state was lost).
+        for source in sources:
+            self._touch(os.path.join(self.build_dir, os.path.basename(source)[:-4] + '.o'), 10)
+
+        self.assertEqual(sources, self._get_files_to_recompile())
+
+        # Up-to-date object files.
+        for source in sources:
+            self._compile(source, 10)
+
+        self.assertEqual(set(), self._get_files_to_recompile())
+
+        # Modified header.
+        self._touch(os.path.join(self.src_dir, 'Foo.hpp'), 20)
+
+        self.assertEqual(
+            set(os.path.join(self.src_dir, x) for x in ('Foo.cpp', 'main.cpp')),
+            self._get_files_to_recompile())
+
+        # Dependencies read from an up-to-date dependency file, rather than scanned.
+        depfile = os.path.join(self.build_dir, 'Bar.d')
+
+        with open(depfile, 'w') as stream:
+            stream.write('Bar.o: {} \\\n {}\n'.format(
+                os.path.join(self.src_dir, 'Bar.cpp'), os.path.join(self.src_dir, 'Foo.hpp')))
+
+        self._touch(depfile, 10)
+
+        self.assertEqual(
+            set(os.path.join(self.src_dir, x) for x in ('Bar.cpp', 'Foo.cpp', 'main.cpp')),
+            self._get_files_to_recompile())
+
+        # Modified compilation flags.
+        self._touch(depfile, -100)
+        self._touch(os.path.join(self.src_dir, 'Foo.hpp'), -100)
+
+        self.assertEqual(set(), self._get_files_to_recompile())
+
+        self.config['flags'].add('-O2')
+
+        self.assertEqual(sources, self._get_files_to_recompile())
+
+    def test_get_files_to_recompile_by_content(self):
+        """Test the detection of the files to recompile, by content."""
+        import os
+
+        self.config['detection'] = 'content'
+
+        for source in (x for x in self.files if x.endswith('.cpp')):
+            self._compile(source, 10)
+
+        # Up-to-date object files: digests are recorded.
+        self.assertEqual(set(), self._get_files_to_recompile())
+
+        # Touched, but unmodified header.
+        self._touch(os.path.join(self.src_dir, 'Foo.hpp'), 20)
+
+        self.assertEqual(set(), self._get_files_to_recompile())
+
+        # Modified header.
+        with open(os.path.join(self.src_dir, 'Foo.hpp'), 'a') as stream:
+            stream.write('int bar();\n')
+
+        self.assertEqual(
+            set(os.path.join(self.src_dir, x) for x in ('Foo.cpp', 'main.cpp')),
+            self._get_files_to_recompile())
+
+    def test_get_relink_reason(self):
+        """Test the detection of an outdated executable."""
+        import os
+
+        from codestacker.core.helpers import get_relink_reason, record_link
+        from codestacker.core.state   import load_state
+
+        load_state(self.config)
+
+        binary = os.path.join(self.build_dir, 'Test')
+        objects = [os.path.join(self.build_dir, 'Foo.o')]
+        command = ['g++', '-o', binary, *objects]
+
+        self._touch(objects[0], 0)
+
+        # No executable yet.
+        self.assertIsNotNone(get_relink_reason(self.config, binary, objects, command))
+
+        # Up-to-date executable.
+        self._touch(binary, 10)
+        record_link(self.config, binary, command)
+
+        self.assertIsNone(get_relink_reason(self.config, binary, objects, command))
+
+        # Different command.
+        self.assertIsNotNone(get_relink_reason(self.config, binary, objects, [*command, '-lGL']))
+
+        # Newer object file.
+        self._touch(objects[0], 20)
+
+        self.assertIsNotNone(get_relink_reason(self.config, binary, objects, command))
+
+    def test_prune_objects(self):
+        """Test the deletion of the object files of deleted source files."""
+        import os
+
+        from codestacker.constants    import keys
+        from codestacker.core.helpers import prune_objects, record_compilation
+        from codestacker.core.state   import load_state
+
+        load_state(self.config)
+
+        for source in ('Bar.cpp', 'main.cpp'):
+            self._touch(os.path.join(self.build_dir, source[:-4] + '.o'), 10)
+            self._touch(os.path.join(self.build_dir, source[:-4] + '.d'), 10)
+            record_compilation(self.config, os.path.join(self.src_dir, source))
+
+        # Nothing to prune.
+        self.assertEqual(0, prune_objects(self.config))
+
+        # Deleted source file.
+        os.remove(os.path.join(self.src_dir, 'Bar.cpp'))
+        self.config[keys.SNAPSHOT].forget([self.src_dir])
+
+        self.assertEqual(1, prune_objects(self.config))
+        self.assertFalse(os.path.exists(os.path.join(self.build_dir, 'Bar.o')))
+        self.assertTrue(os.path.exists(os.path.join(self.build_dir, 'main.o')))
+
+    def test_get_object_file(self):
+        """Test the object files layout."""
+        import os
+
+        from codestacker.core.helpers import get_object_file
+
+        first = os.path.join(self.src_dir, 'a', 'util.cpp')
+        second = os.path.join(self.src_dir, 'b', 'util.cpp')
+        batch = os.path.join(self.build_dir, 'codestacker_unity_0.cpp')
+
+        # Mirrored "sources" folder.
+        self.assertEqual(
+            os.path.join(self.build_dir, 'a', 'util.o'), get_object_file(self.config, first))
+        self.assertEqual(
+            os.path.join(self.build_dir, 'codestacker_unity_0.o'),
+            get_object_file(self.config, batch))
+
+        # Sharded "build" folder.
+        self.config['shards'] = 4
+
+        objects = [get_object_file(self.config, x) for x in (first, second)]
+
+        self.assertNotEqual(objects[0], objects[1])
+
+        for target in objects:
+            self.assertTrue(os.path.basename(target).startswith('util-'))
+            self.assertIn(os.path.basename(os.path.dirname(target)), ('0', '1', '2', '3'))
+
+    def test_scan_homonymous_sources(self):
+        """Test the scan of source files of the same name, in one batch."""
+        import os
+
+        from codestacker.core.helpers import _scan
+
+        sources = []
+
+        for folder in ('a', 'b'):
+            os.makedirs(os.path.join(self.src_dir, folder))
+
+            with open(os.path.join(self.src_dir, folder + '.hpp'), 'w'):
+                pass
+
+            sources.append(os.path.join(self.src_dir, folder, 'util.cpp'))
+
+            with open(sources[-1], 'w') as stream:
+                stream.write('#include "{}.hpp"\n'.format(folder))
+
+        self.config['jobs'] = 1
+
+        for scanner in ('preprocessor', 'builtin'):
+            self.config['scanner'] = scanner
+
+            with self.subTest(scanner=scanner):
+                self.assertEqual(
+                    {x: [x, os.path.join(self.src_dir, y + '.hpp')]
+                     for x, y in zip(sources, ('a', 'b'))},
+                    _scan(self.config, sources))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for index.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestIndex(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        self.src_dir = os.path.join(root, 'src')
+        self.build_dir = os.path.join(root, 'build')
+
+        os.makedirs(self.src_dir)
+
+        for name in ('Foo.hpp', 'Foo.cpp', 'main.cpp', 'Bar.cpp'):
+            with open(os.path.join(self.src_dir, name), 'w'):
+                pass
+
+        self.config = {
+            '_root': root,
+            '_snapshot': None,
+            '_state': {},
+            'build': self.build_dir,
+            'sources': self.src_dir}
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        """Return the path of a file of the sources folder."""
+        import os
+
+        return os.path.join(self.src_dir, name)
+
+    def test_index_prerequisites(self):
+        """Test the indexing of prerequisites, and its update."""
+        from codestacker.core.helpers import get_object_file
+        from codestacker.core.index   import get_index, index_prerequisites, is_indexed, unindex
+
+        target = get_object_file(self.config, self._path('main.cpp'))
+
+        self.assertFalse(is_indexed(self.config, target))
+
+        index_prerequisites(
+            self.config, target, [self._path('main.cpp'), self._path('../src/Foo.hpp')])
+
+        self.assertTrue(is_indexed(self.config, target))
+        self.assertEqual(
+            {self._path('main.cpp'): [target], self._path('Foo.hpp'): [target]},
+            get_index(self.config))
+
+        # The previous prerequisites are forgotten.
+        index_prerequisites(self.config, target, [self._path('main.cpp')])
+
+        self.assertEqual({self._path('main.cpp'): [target]}, get_index(self.config))
+
+        unindex(self.config, target)
+
+        self.assertFalse(is_indexed(self.config, target))
+        self.assertEqual({}, get_index(self.config))
+
+    def test_saved_index(self):
+        """Test that the reverse index isn't saved, but rebuilt from the object files' records."""
+        import os
+
+        from codestacker.core.helpers          import get_object_file
+        from codestacker.core.index            import get_index, index_prerequisites
+        from codestacker.core.state            import INDEX, load_state, save_state
+        from codestacker.system.file_utilities import Snapshot
+        from codestacker.system.json_handler   import load_json
+
+        target = get_object_file(self.config, self._path('main.cpp'))
+
+        os.makedirs(self.build_dir)
+
+        index_prerequisites(self.config, target, [self._path('main.cpp'), self._path('Foo.hpp')])
+        get_index(self.config)
+
+        self.config['_snapshot'] = Snapshot()
+
+        save_state(self.config)
+
+        self.assertNotIn(INDEX, load_json(os.path.join(self.build_dir, '.codestacker.json')))
+
+        load_state(self.config)
+
+        self.assertEqual(
+            {self._path('main.cpp'): [target], self._path('Foo.hpp'): [target]},
+            get_index(self.config))
+
+    def test_get_affected_units(self):
+        """Test the translation units affected by changed files."""
+        from codestacker.core.helpers import get_object_file
+        from codestacker.core.index   import get_affected_units, index_prerequisites
+
+        for name, prerequisites in (
+                ('Foo.cpp', ['Foo.cpp', 'Foo.hpp']),
+                ('main.cpp', ['main.cpp', 'Foo.hpp']),
+                ('Bar.cpp', ['Bar.cpp'])):
+            index_prerequisites(
+                self.config, get_object_file(self.config, self._path(name)),
+                [self._path(x) for x in prerequisites])
+
+        self.assertEqual(
+            [self._path('Foo.cpp'), self._path('main.cpp')],
+            sorted(x for _, x in get_affected_units(self.config, [self._path('Foo.hpp')])))
+
+        self.assertEqual(
+            [self._path('Bar.cpp')],
+            sorted(x for _, x in get_affected_units(self.config, [self._path('Bar.cpp')])))
+
+        # A new source file, never compiled.
+        with open(self._path('New.cpp'), 'w'):
+            pass
+
+        self.assertEqual(
+            [(None, self._path('New.cpp'))], list(get_affected_units(self.config, [])))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for pch.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestPch(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        self.src_dir = os.path.join(root, 'src')
+        self.build_dir = os.path.join(root, 'build')
+
+        os.makedirs(self.src_dir)
+        os.makedirs(self.build_dir)
+
+        for name, content in (
+                ('Foo.hpp', '#pragma once\nint foo();\n'),
+                ('Bar.hpp', '#pragma once\nint bar();\n'),
+                ('Foo.cpp', '#include "Foo.hpp"\n#include "Bar.hpp"\nint foo() { return 0; }\n'),
+                ('main.cpp', '#include "Foo.hpp"\nint main() { return foo(); }\n')):
+            with open(os.path.join(self.src_dir, name), 'w') as stream:
+                stream.write(content)
+
+        self.config = {
+            '_root': root,
+            'build': self.build_dir,
+            'flags': set(),
+            'include': self.src_dir,
+            'jobs': 1,
+            'pch': 'auto',
+            'scanner': 'preprocessor',
+            'sources': self.src_dir}
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def test_prepare_pch(self):
+        """Test the header precompilation."""
+        import os
+
+        from codestacker.core.helpers import get_pch_header
+        from codestacker.core.pch     import prepare_pch
+        from codestacker.core.state   import load_state, save_state
+
+        load_state(self.config)
+        prepare_pch(self.config, False)
+        save_state(self.config)
+
+        header = get_pch_header(self.config)
+
+        # Only the header included by all the sources is selected.
+        with open(header, 'r') as stream:
+            self.assertEqual('#include "{}"\n'.format(os.path.join(self.src_dir, 'Foo.hpp')),
+                             stream.read())
+
+        self.assertTrue(os.path.isfile(header + '.gch'))
+
+        # Up-to-date precompiled header.
+        mtime = os.path.getmtime(header + '.gch')
+
+        load_state(self.config)
+        prepare_pch(self.config, False)
+
+        self.assertEqual(mtime, os.path.getmtime(header + '.gch'))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
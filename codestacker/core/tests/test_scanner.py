@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for scanner.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestScanner(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        self.src_dir = os.path.join(root, 'src')
+        self.include_dir = os.path.join(root, 'include')
+
+        self.files = {
+            'include/Foo.hpp': '#pragma once\n#include <Bar.hpp>\n#include <vector>\n',
+            'include/Bar.hpp': '#ifdef DEBUG\n#  include "Debug.hpp"\n#endif\n',
+            'include/Debug.hpp': '// #include "Nothing.hpp"\n',
+            'src/Local.hpp': '#include "Foo.hpp"\n',
+            'src/main.cpp': '#include "Local.hpp"\n#include <Foo.hpp>\nint main() {}\n',
+            'src/computed.cpp': '#define HEADER "Foo.hpp"\n#include HEADER\n'}
+
+        for name, content in self.files.items():
+            self._write(name, content)
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def _write(self, name, content, mtime=0):
+        """Write a file of the project, with a given modification time."""
+        import os
+
+        path = os.path.join(self.temp_dir.name, name)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, 'w') as stream:
+            stream.write(content)
+
+        os.utime(path, (mtime, mtime))
+
+    def test_scan_includes(self):
+        """Test the prerequisites found by following the includes."""
+        import os
+
+        from codestacker.core.scanner import scan_includes
+
+        main = os.path.join(self.src_dir, 'main.cpp')
+        computed = os.path.join(self.src_dir, 'computed.cpp')
+
+        recipes, to_preprocess = scan_includes([main, computed], self.include_dir)
+
+        # Depth first, every conditional branch taken, system headers left out.
+        self.assertEqual(
+            [main, os.path.join(self.src_dir, 'Local.hpp'), *(
+                os.path.join(self.include_dir, x) for x in ('Foo.hpp', 'Bar.hpp', 'Debug.hpp'))],
+            recipes[main])
+        self.assertEqual([computed], to_preprocess)
+
+        # A modified header is parsed again.
+        self._write('include/Debug.hpp', '#include "Extra.hpp"\n', 10)
+        self._write('include/Extra.hpp', '')
+
+        recipes, _ = scan_includes([main], self.include_dir)
+
+        self.assertEqual(os.path.join(self.include_dir, 'Extra.hpp'), recipes[main][-1])
+
+    def test_get_differences(self):
+        """Test the comparison with the preprocessor's recipes."""
+        from codestacker.core.scanner import get_differences
+
+        reference = {'/a.cpp': ['/a.cpp', '/b.hpp'], '/c.cpp': ['/c.cpp']}
+
+        # Same prerequisites, once normalized.
+        recipes = {'/a.cpp': ['/a.cpp', '/x/../b.hpp'], '/c.cpp': ['/c.cpp']}
+
+        self.assertEqual({}, get_differences(recipes, reference))
+
+        # A missing prerequisite, and an extra one.
+        recipes = {'/a.cpp': ['/a.cpp', '/d.hpp'], '/c.cpp': ['/c.cpp']}
+
+        self.assertEqual({'/a.cpp': (['/b.hpp'], ['/d.hpp'])}, get_differences(recipes, reference))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for scheduler.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestScheduler(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        self.jobs_good = [
+            ('First', ['sh', '-c', 'echo 1']),
+            ('Second', ['sh', '-c', 'sleep 0.1; echo 2']),
+            ('Third', ['sh', '-c', 'echo 3'])]
+
+        self.jobs_bad = [
+            ('First', ['sh', '-c', 'echo oops >&2; exit 1']),
+            ('Second', ['sh', '-c', 'echo 2'])]
+
+    def test_run_jobs(self):
+        """Test concurrent commands execution."""
+        from codestacker.core.scheduler    import run_jobs
+        from codestacker.errors            import errors
+        from codestacker.errors.exceptions import TechnicalError
+
+        # Results are returned in order, whatever the completion order.
+        results = run_jobs(self.jobs_good, 3, errors.COMPILATION_FAILED)
+
+        self.assertEqual(['1', '2', '3'], [x.stdout.strip() for x in results])
+
+        # Failing command: with a single slot, the next command is never started.
+        with self.assertRaises(TechnicalError) as context:
+            run_jobs(self.jobs_bad, 1, errors.COMPILATION_FAILED)
+
+        context.exception.print()
+        self.assertEqual(context.exception.args[0], errors.COMPILATION_FAILED)
+        self.assertEqual(context.exception.args[1], 'First')
+        self.assertEqual(context.exception.args[2], 'oops\n')
+
+    def test_run_process(self):
+        """Test the exit status of a command."""
+        from codestacker.core.scheduler import run_process
+
+        self.assertEqual(3, run_process(['sh', '-c', 'exit 3']).returncode)
+
+        # Killed by a signal.
+        self.assertEqual(-9, run_process(['sh', '-c', 'kill -9 $$']).returncode)
+
+    def test_run_jobs_traced(self):
+        """Test the tracing of concurrent commands."""
+        import json
+        import os
+        import tempfile
+
+        from codestacker.core.scheduler import run_jobs
+        from codestacker.errors         import errors
+        from codestacker.tracer         import Tracer
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            trace_file = os.path.join(temp_dir, 'trace.json')
+
+            Tracer.start()
+            run_jobs(self.jobs_good, 2, errors.COMPILATION_FAILED)
+            Tracer.save(trace_file)
+
+            with open(trace_file, 'r') as stream:
+                events = [x for x in json.load(stream)['traceEvents'] if x['ph'] == 'X']
+
+        self.assertEqual(['First', 'Second', 'Third'], sorted(x['name'] for x in events))
+
+        # Each command in its own slot, with its process' resources usage.
+        for event in events:
+            self.assertIn(event['tid'], (1, 2))
+            self.assertEqual(event['tid'], event['args']['slot'])
+            self.assertIn('pid', event['args'])
+            self.assertIn('cpu_time', event['args'])
+            self.assertGreater(event['args']['max_rss'], 0)
+
+        self.assertFalse(Tracer.is_started())
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for unity.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestUnity(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        self.src_dir = os.path.join(root, 'src')
+        self.build_dir = os.path.join(root, 'build')
+
+        os.makedirs(self.src_dir)
+        os.makedirs(self.build_dir)
+
+        # One big file, and three small ones.
+        for name, size in (('A.cpp', 300), ('B.cpp', 100), ('C.cpp', 100), ('D.cpp', 100)):
+            with open(os.path.join(self.src_dir, name), 'w') as stream:
+                stream.write('/' * size)
+
+        self.config = {
+            '_root': root,
+            'build': self.build_dir,
+            'detection': 'timestamp',
+            'jobs': 2,
+            'sources': self.src_dir,
+            'unity': True}
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def _prepare_unity(self):
+        """Prepare the unity build, as a new build would."""
+        from codestacker.core.state import load_state, save_state
+        from codestacker.core.unity import prepare_unity
+
+        if '_state' in self.config:
+            save_state(self.config)
+
+        load_state(self.config)
+        prepare_unity(self.config)
+
+        return self.config['_units']
+
+    def test_prepare_unity(self):
+        """Test the batches making, and the edited files leaving their batch."""
+        import os
+        import time
+
+        sources = [os.path.join(self.src_dir, x) for x in ('A.cpp', 'B.cpp', 'C.cpp', 'D.cpp')]
+        batches = [
+            os.path.join(self.build_dir, 'codestacker_unity_{}.cpp'.format(x)) for x in (0, 1)]
+
+        # Balanced batches, by size.
+        self.assertEqual(batches, self._prepare_unity())
+
+        with open(batches[0], 'r') as stream:
+            self.assertEqual('#include "{}"\n'.format(sources[0]), stream.read())
+
+        # Compiled batches, then an edited source file.
+        for batch in batches:
+            with open(batch[:-4] + '.o', 'w'):
+                pass
+
+        os.utime(sources[2], (time.time() + 10, time.time() + 10))
+
+        self.assertEqual([*batches, sources[2]], self._prepare_unity())
+
+        with open(batches[1], 'r') as stream:
+            self.assertEqual(
+                ''.join('#include "{}"\n'.format(x) for x in (sources[1], sources[3])),
+                stream.read())
+
+        # A new source file, compiled on its own too.
+        new_source = os.path.join(self.src_dir, 'E.cpp')
+
+        with open(new_source, 'w'):
+            pass
+
+        self.assertEqual([*batches, sources[2], new_source], self._prepare_unity())
+
+    def test_rebalance_unity(self):
+        """Test the batches made again from their compilation times."""
+        import os
+
+        from codestacker.constants import keys
+
+        sources = [os.path.join(self.src_dir, x) for x in ('A.cpp', 'B.cpp', 'C.cpp', 'D.cpp')]
+        batches = [
+            os.path.join(self.build_dir, 'codestacker_unity_{}.cpp'.format(x)) for x in (0, 1)]
+
+        self.assertEqual(batches, self._prepare_unity())
+
+        # Compiled: the big file is quick, the small ones are slow (3s for their batch).
+        objects = self.config[keys.STATE].setdefault('objects', {})
+
+        for batch, duration in zip(batches, (0.1, 3.0)):
+            with open(batch[:-4] + '.o', 'w'):
+                pass
+
+            objects[batch[:-4] + '.o'] = {'duration': duration}
+
+        # Each slow file (1s) in a batch of its own, then the last ones where there's room.
+        self.assertEqual(batches, self._prepare_unity())
+
+        expected = ((sources[1], sources[3]), (sources[0], sources[2]))
+
+        for batch, members in zip(batches, expected):
+            with open(batch, 'r') as stream:
+                self.assertEqual(
+                    ''.join('#include "{}"\n'.format(x) for x in members), stream.read())
+
+        # Balanced enough: kept as is.
+        objects[batches[0][:-4] + '.o'] = {'duration': 2.0}
+        objects[batches[1][:-4] + '.o'] = {'duration': 1.1}
+
+        self._prepare_unity()
+
+        for batch, members in zip(batches, expected):
+            with open(batch, 'r') as stream:
+                self.assertEqual(
+                    ''.join('#include "{}"\n'.format(x) for x in members), stream.read())
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
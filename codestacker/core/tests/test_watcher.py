@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for watcher.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestWatcher(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        files = {
+            'include/h.hpp': 'int h();\n',
+            'src/main.cpp': '#include "h.hpp"\nint f1();\nint main() { return f1() - 1; }\n',
+            'src/s1.cpp': '#include "h.hpp"\nint f1() { return 1; }\n',
+            'src/s2.cpp': '#include "h.hpp"\nint f2() { return 2; }\n'}
+
+        for name, content in files.items():
+            os.makedirs(os.path.dirname(os.path.join(root, name)), exist_ok=True)
+
+            with open(os.path.join(root, name), 'w') as stream:
+                stream.write(content)
+
+        self.config = {
+            '_root': root,
+            'binary': 'bin',
+            'build': 'build',
+            'include': 'include',
+            'jobs': 1,
+            'output': 'app',
+            'sources': 'src',
+            'unity': True}
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def _write(self, name, content, offset):
+        """Write a file of the project, dated some seconds from now, and return its path."""
+        import os
+        import time
+
+        path = os.path.join(self.temp_dir.name, name)
+        mtime = time.time() + offset
+
+        with open(path, 'w') as stream:
+            stream.write(content)
+
+        os.utime(path, (mtime, mtime))
+
+        return path
+
+    def test_watch_unity(self):
+        """Test rebuilding a unity build in watch mode, as its source files get edited or added."""
+        import os
+        import subprocess
+
+        from unittest import mock
+
+        from codestacker.config_inspector.adaptor   import adapt_config
+        from codestacker.config_inspector.validator import validate_config
+        from codestacker.core.watcher               import watch
+
+        root = self.temp_dir.name
+
+        validate_config(self.config)
+        adapt_config(self.config)
+
+        changes = [
+            # An edited source file leaves its batch.
+            lambda: self._write('src/s1.cpp', '#include "h.hpp"\nint f1() { return 1; }\n', 10),
+            # A new source file is compiled on its own.
+            lambda: self._write('src/s3.cpp', '#include "h.hpp"\nint f3() { return 3; }\n', 20)]
+
+        def wait():
+            """Make the next change, or stop."""
+            if not changes:
+                raise KeyboardInterrupt()
+
+            return set([changes.pop(0)()])
+
+        with mock.patch('codestacker.system.file_watcher.FileWatcher') as watcher:
+            watcher.return_value.polling = False
+            watcher.return_value.wait.side_effect = wait
+
+            watch(self.config, False)
+
+        for name in ('s1.o', 's3.o'):
+            self.assertTrue(os.path.isfile(os.path.join(root, 'build', name)))
+
+        self.assertEqual(0, subprocess.run([os.path.join(root, 'bin', 'app')]).returncode)
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unity build: source files compiled by batches.
+"""
+
+####################################################################################################
+
+# Records of the unity build.
+_BATCHES = 'batches'
+_SINGLES = 'singles'
+
+def prepare_unity(config):
+    """
+    Write the batches (translation units including several source files), and set the units to
+    compile. Batches are kept from one build to the next: new source files, and source files edited
+    since their batch was compiled, are compiled on their own from then on (the batch is recompiled
+    once without them, instead of at each of their edits). Once the batches' compilation times have
+    drifted too far apart, all the source files are spread over new batches.
+
+    :param config: The configuration to operate on.
+    """
+    import os
+
+    from .helpers                          import get_object_file, is_modified
+    from .state                            import UNITY, get_section
+    from codestacker.constants             import keys, extensions
+    from codestacker.logger                import Logger
+    from codestacker.system.file_utilities import get_files, write_if_changed
+
+    if not config[keys.UNITY]:
+        config[keys.STATE].pop(UNITY, None)
+        return
+
+    sources = get_files(config[keys.SOURCES], extensions.SOURCES, config[keys.SNAPSHOT])
+    record = get_section(config, UNITY)
+
+    if _BATCHES not in record:
+        batches = _make_batches(config, sources, _get_costs(config, sources, {}))
+        singles = set()
+    else:
+        present = set(sources)
+
+        # Deleted source files leave their batch, new ones are compiled on their own.
+        batches = {
+            x: [y for y in members if y in present] for x, members in record[_BATCHES].items()}
+        singles = present.difference(*batches.values())
+
+        # As last compiled (their compilation times are these batches').
+        compiled = dict(batches)
+
+        for batch, members in batches.items():
+            target = get_object_file(config, batch)
+
+            if not os.path.exists(target):
+                continue
+
+            edited = [x for x in members if is_modified(config, target, x)]
+
+            if edited:
+                batches[batch] = [x for x in members if x not in edited]
+                singles.update(edited)
+
+        batches = {x: members for x, members in batches.items() if members}
+
+        costs = _get_costs(config, sources, compiled)
+
+        if _is_unbalanced(config, batches, costs):
+            Logger.info('Unity build: batches rebalanced')
+
+            batches = _make_batches(config, sources, costs)
+            singles = set()
+
+    for batch, members in batches.items():
+        write_if_changed(batch, ''.join('#include "{}"\n'.format(x) for x in members))
+
+    Logger.info('Unity build: {} batch(es), {} source file(s) on their own'.format(
+        len(batches), len(singles)))
+
+    record[_BATCHES] = batches
+    record[_SINGLES] = sorted(singles)
+
+    config[keys.UNITS] = [*sorted(batches), *sorted(singles)]
+
+####################################################################################################
+
+def get_batches(config):
+    """
+    Return the batches of a unity build, as last made.
+
+    :param config: The configuration to operate on.
+
+    :returns: A dictionary of batches (key = batch, value = source files it includes).
+    """
+    from .state                import UNITY
+    from codestacker.constants import keys
+
+    return config[keys.STATE].get(UNITY, {}).get(_BATCHES, {})
+
+####################################################################################################
+
+def _get_costs(config, sources, batches):
+    """
+    Estimate the compilation time of each source file: as last compiled on its own, or its share
+    of its batch's last compilation time (by size). The other ones are estimated from their size,
+    at the average time per byte of the known ones (their size alone, if none is known).
+
+    :param config: The configuration to operate on.
+    :param sources: The source files.
+    :param batches: The current batches (key = batch file, value = source files).
+
+    :returns: A dictionary of costs (key = source file, value = estimated time).
+    """
+    import os
+
+    from .helpers import get_duration
+
+    sizes = {x: os.path.getsize(x) for x in sources}
+    costs = {x: get_duration(config, x) for x in sources}
+
+    for batch, members in batches.items():
+        duration = get_duration(config, batch)
+        total = sum(sizes[x] for x in members)
+
+        if (duration is None) or (not total):
+            continue
+
+        for source in members:
+            costs[source] = duration * sizes[source] / total
+
+    known = [x for x in sources if costs[x] is not None]
+    known_size = sum(sizes[x] for x in known)
+    rate = (sum(costs[x] for x in known) / known_size) if known_size else 1
+
+    return {x: (sizes[x] * rate) if costs[x] is None else costs[x] for x in sources}
+
+####################################################################################################
+
+# Beyond that ratio between the most loaded batch and the best balance possible, batches are made
+# again (recompiling most of them: not for small drifts).
+_MAX_SPREAD = 1.5
+
+def _is_unbalanced(config, batches, costs):
+    """
+    Tell whether the batches' loads have drifted too far apart, once they were all compiled.
+
+    :param config: The configuration to operate on.
+    :param batches: The current batches (key = batch file, value = source files).
+    :param costs: The estimated costs of the source files.
+
+    :returns: The boolean answer.
+    """
+    from .helpers import get_duration
+
+    if (len(batches) < 2) or any(get_duration(config, x) is None for x in batches):
+        return False
+
+    loads = [sum(costs[x] for x in members) for members in batches.values()]
+
+    # No batch can be lighter than its costliest source file.
+    best = max(sum(loads) / len(loads), max(costs[x] for y in batches.values() for x in y))
+
+    return max(loads) > _MAX_SPREAD * best
+
+####################################################################################################
+
+# Beyond that number of source files, batches get too coarse to balance the load between jobs.
+_MAX_BATCH_SIZE = 16
+
+_BATCH_NAME = 'codestacker_unity_{}.cpp'
+
+def _make_batches(config, sources, costs):
+    """
+    Spread the source files over batches of even costs. There are at least as many batches as jobs.
+
+    :param config: The configuration to operate on.
+    :param sources: The source files.
+    :param costs: The estimated costs of the source files.
+
+    :returns: A dictionary of batches (key = batch file, value = source files).
+    """
+    import heapq
+    import os
+
+    from codestacker.constants import keys
+
+    count = min(len(sources), max(config[keys.JOBS], -(-len(sources) // _MAX_BATCH_SIZE)))
+    loads = [(0, x) for x in range(count)]
+    batches = [[] for _ in range(count)]
+
+    # Costliest first, each one into the least loaded batch.
+    for source in sorted(sources, key=lambda x: (-costs[x], x)):
+        load, index = heapq.heappop(loads)
+
+        batches[index].append(source)
+        heapq.heappush(loads, (load + costs[source], index))
+
+    return {
+        os.path.join(config[keys.BUILD], _BATCH_NAME.format(index)): sorted(members)
+        for index, members in enumerate(batches)}
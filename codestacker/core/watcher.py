@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Watch mode: rebuild on every change.
+"""
+
+####################################################################################################
+
+def watch(config, verbose):
+    """
+    Build the project, then rebuild it each time a file changes in the "sources" or "include"
+    folders, until interrupted. The blueprint is read once; the build state (along with its index of
+    the prerequisites) and the file system snapshot are kept in memory, so that only the units
+    depending on a changed file are looked at (once the units are made, e.g. in a unity build).
+
+    :param config: The configuration to operate on.
+    :param verbose: The boolean flag to output the commands.
+    """
+    from .builder                        import build
+    from .helpers                        import get_targets
+    from codestacker.constants           import keys
+    from codestacker.errors.exceptions   import Error
+    from codestacker.logger              import Logger
+    from codestacker.system.file_watcher import FileWatcher
+
+    watcher = FileWatcher(get_watched_directories(config))
+    changed = None
+
+    if watcher.polling:
+        Logger.warning('Inotify unavailable: polling for changes')
+
+    try:
+        while True:
+            try:
+                build(config, verbose, changed)
+            except Error as error:
+                error.print()
+                Logger.reset()
+
+                # Looked at again by the next build (e.g. the units a failure left uncompiled).
+                pending = changed
+            else:
+                pending = set()
+
+            Logger.info('Watching for changes (Ctrl+C to stop)...')
+
+            changed = watcher.wait()
+
+            forgotten = changed if changed is not None else get_watched_directories(config)
+
+            # Build outputs are looked at again too (e.g. a rewritten batch of a unity build).
+            for target in get_targets(config):
+                target[keys.SNAPSHOT].forget([*forgotten, target[keys.BUILD]])
+
+            if (changed is not None) and (pending is not None):
+                changed = changed | pending
+            else:
+                changed = None
+    except KeyboardInterrupt:
+        print()
+    finally:
+        watcher.close()
+
+####################################################################################################
+
+def get_watched_directories(config):
+    """
+    Return the "include" and "sources" folders of all the targets, without the ones nested in
+    another.
+
+    :param config: The configuration to operate on.
+
+    :returns: A list of directories.
+    """
+    import os
+
+    from .helpers              import get_targets
+    from codestacker.constants import keys
+
+    directories = sorted(
+        set(y for x in get_targets(config) for y in (x[keys.INCLUDE], x[keys.SOURCES])))
+
+    return [
+        x for x in directories
+        if not any(x.startswith(os.path.join(y, '')) for y in directories)]
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Build daemon, serving the "build", "clean", "compile" and "impact" commands over a Unix socket.
+"""
+
+####################################################################################################
+
+# Commands served by the daemon (when it's running).
+_SERVED_COMMANDS = ('build', 'clean', 'compile', 'impact')
+
+# Separates the streamed output from the exit status, at the end of a response.
+_END_OF_OUTPUT = b'\0'
+
+def request_daemon(arguments):
+    """
+    Have the daemon run a command, streaming its output back.
+
+    :param arguments: The command line's arguments.
+
+    :returns: The command's exit status, or "None" if no daemon is running (or the command isn't
+              served by the daemon).
+    """
+    import os
+
+    if arguments['command'] not in _SERVED_COMMANDS:
+        return None
+
+    socket_path = _get_socket_path()
+
+    # No daemon started: not worth importing what talking to it takes, at each command's startup.
+    # Nor talking to another user's one (it would receive the commands).
+    if not _is_trusted(socket_path):
+        return None
+
+    import json
+    import socket
+    import sys
+
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import TechnicalError
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        client.connect(socket_path)
+    except OSError:
+        client.close()
+        return None
+
+    with client:
+        request = {'cwd': os.getcwd(), 'arguments': arguments}
+
+        client.sendall(json.dumps(request).encode() + b'\n')
+
+        status = None
+
+        while True:
+            data = client.recv(1 << 16)
+
+            if not data:
+                break
+
+            # Output streamed until the end marker, followed by the exit status.
+            if status is None:
+                output, end, data = data.partition(_END_OF_OUTPUT)
+
+                sys.stdout.buffer.write(output)
+                sys.stdout.flush()
+
+                if not end:
+                    continue
+
+                status = b''
+
+            status += data
+
+    if not status:
+        TechnicalError(errors.DAEMON_CONNECTION_LOST).print()
+        return 1
+
+    return int(status)
+
+####################################################################################################
+
+# In seconds.
+_START_TIMEOUT = 5
+
+def manage_daemon(action):
+    """
+    Start, stop or query the daemon; or serve requests (in the foreground).
+
+    :param action: Either "start", "stop", "status" or "serve".
+
+    :raises TechnicalError: the daemon failed to start.
+    """
+    import subprocess
+    import sys
+    import time
+
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import TechnicalError
+    from codestacker.logger            import Logger
+
+    if _contact_daemon('ping'):
+        if action == 'stop':
+            _contact_daemon('stop')
+
+        Logger.info('Daemon stopped' if action == 'stop' else 'Daemon running')
+    elif action == 'serve':
+        Logger.info('Serving on "{}"'.format(_get_socket_path()))
+
+        _serve()
+    elif action == 'start':
+        subprocess.Popen(
+            [sys.executable, '-m', 'codestacker', 'daemon', 'serve'],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True)
+
+        for _ in range(_START_TIMEOUT * 10):
+            if _contact_daemon('ping'):
+                Logger.info('Daemon started')
+                return
+
+            time.sleep(0.1)
+
+        raise TechnicalError(errors.DAEMON_NOT_STARTED)
+    else:
+        Logger.info('No daemon running')
+
+####################################################################################################
+
+class Sessions():
+    """
+    Configurations kept in memory from one command to the next, along with their build state, file
+    system snapshot, and a watcher of their files (so that only the changed ones are looked at
+    again). A configuration is loaded again once its blueprint is modified.
+    """
+    def __init__(self):
+        """
+        Constructor.
+        """
+        self.__sessions = {}
+
+    def get_config(self, arguments):
+        """
+        Return the configuration matching the arguments: loaded, checked and adapted once, then
+        kept up to date.
+
+        :param arguments: The command line's arguments.
+
+        :returns: The configuration.
+        """
+        import os
+
+        from codestacker.config_inspector.resolver import resolve_config
+        from codestacker.constants                 import keys
+        from codestacker.core.helpers              import get_targets
+        from codestacker.core.watcher              import get_watched_directories
+        from codestacker.system.file_watcher       import FileWatcher
+
+        key = (os.path.realpath(arguments['file']), arguments['config'], arguments.get('jobs'))
+
+        try:
+            mtime = os.stat(arguments['file']).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        session = self.__sessions.pop(key, None)
+
+        # A clean-up invalidates the build state.
+        if (session is not None) and ((session[0] != mtime) or (arguments['command'] == 'clean')):
+            session[2].close()
+            session = None
+
+        if session is None:
+            config = resolve_config(arguments)
+
+            if arguments['command'] == 'clean':
+                return config
+
+            session = (mtime, config, FileWatcher(get_watched_directories(config)))
+        else:
+            config = session[1]
+
+            config[keys.ACTION] = arguments.get('action')
+            config[keys.COMMAND] = arguments['command']
+            config[keys.VERBOSE] = arguments['verbose']
+
+            targets = [x for x in get_targets(config) if x.get(keys.STATE) is not None]
+
+            if targets:
+                changed = session[2].get_changes()
+
+                watched = get_watched_directories(config)
+
+                if changed is None:
+                    changed = watched
+
+                # The files outside the watched folders (e.g. reached through a "-I" flag) may
+                # have changed unnoticed.
+                for target in targets:
+                    target[keys.SNAPSHOT].forget([*changed, target[keys.BUILD]])
+                    target[keys.SNAPSHOT].forget_outside(watched)
+
+        self.__sessions[key] = session
+
+        return config
+
+    def close(self):
+        """Stop watching the files of all the configurations."""
+        for session in self.__sessions.values():
+            session[2].close()
+
+        self.__sessions.clear()
+
+####################################################################################################
+
+def _serve():
+    """
+    Serve requests one at a time, until asked to stop.
+    """
+    import io
+    import os
+    import socket
+
+    path = _get_socket_path()
+    sessions = Sessions()
+
+    _make_socket_folder(os.path.dirname(path))
+
+    # Left by a daemon that didn't stop properly.
+    if os.path.exists(path):
+        os.unlink(path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(path)
+    server.listen()
+
+    os.chmod(path, 0o600)
+
+    try:
+        while True:
+            connection, _ = server.accept()
+
+            stream = io.TextIOWrapper(
+                connection.makefile('rwb'), encoding='UTF-8', line_buffering=True)
+
+            try:
+                with connection, stream:
+                    if not _handle_request(stream, sessions):
+                        break
+            except OSError:
+                # Client gone.
+                continue
+    finally:
+        sessions.close()
+        server.close()
+        os.unlink(path)
+
+####################################################################################################
+
+def _handle_request(stream, sessions):
+    """
+    Handle a request: run a command, and stream its output back along with its exit status.
+
+    :param stream: The connection to the client.
+    :param sessions: The configurations kept in memory.
+
+    :returns: "False" if the daemon was asked to stop.
+    """
+    import contextlib
+    import json
+    import os
+
+    from codestacker.codestacker import run
+    from codestacker.logger      import Logger
+
+    try:
+        request = json.loads(stream.readline())
+    except ValueError:
+        return True
+
+    if request.get('control') is not None:
+        return request['control'] != 'stop'
+
+    os.chdir(request['cwd'])
+
+    Logger.reset()
+
+    with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+        status = run(request['arguments'], sessions)
+
+    stream.write(_END_OF_OUTPUT.decode() + str(status))
+
+    return True
+
+####################################################################################################
+
+def _contact_daemon(control):
+    """
+    Send a control message to the daemon.
+
+    :param control: Either "ping" (to check whether it's running) or "stop".
+
+    :returns: "True" if the daemon is running.
+    """
+    import json
+    import socket
+
+    if not _is_trusted(_get_socket_path()):
+        return False
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(_get_socket_path())
+            client.sendall(json.dumps({'control': control}).encode() + b'\n')
+    except OSError:
+        return False
+
+    return True
+
+####################################################################################################
+
+def _get_socket_path():
+    """
+    Return the daemon's socket path, specific to CodeStacker's version (a daemon left running after
+    an upgrade is then simply not used), in a folder of the user's own.
+
+    :returns: The socket path.
+    """
+    import os
+    import tempfile
+
+    import codestacker
+
+    directory = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+
+    return os.path.join(
+        directory, 'codestacker-{}'.format(os.getuid()),
+        'daemon-{}.sock'.format(codestacker.__version__))
+
+####################################################################################################
+
+def _make_socket_folder(directory):
+    """
+    Create the folder of the daemon's socket, accessible to the user only.
+
+    :param directory: The folder.
+
+    :raises TechnicalError: the folder exists, but is another user's or open to others (e.g. made
+                            beforehand in the shared temporary folder, to receive the commands).
+    """
+    import os
+
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import TechnicalError
+
+    os.makedirs(directory, 0o700, exist_ok=True)
+
+    if not _is_trusted(directory):
+        raise TechnicalError(errors.DAEMON_UNSAFE_FOLDER, directory)
+
+####################################################################################################
+
+def _is_trusted(path):
+    """
+    Tell whether the daemon's socket (or its folder) can be trusted: the user's own, in a folder
+    accessible to the user only.
+
+    :param path: The socket, or its folder.
+
+    :returns: "False" if it doesn't exist, or can't be trusted.
+    """
+    import os
+    import stat
+
+    directory = path if os.path.isdir(path) else os.path.dirname(path)
+
+    try:
+        statuses = [os.lstat(path), os.lstat(directory)]
+    except OSError:
+        return False
+
+    return (
+        all(x.st_uid == os.getuid() for x in statuses) and stat.S_ISDIR(statuses[1].st_mode)
+        and (not statuses[1].st_mode & 0o077))
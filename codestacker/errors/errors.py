@@ -14,21 +14,32 @@ EMPTY_YAML = 'empty YAML file'
 FILE_WRITING_ERROR = 'file writing error'
 YAML_DUMPING_ERROR = 'YAML dumping error'
 
+JSON_PARSING_ERROR = 'JSON parsing error'
+
 # Configuration inspection errors.
 CONFIG_NOT_FOUND = 'configuration not found'
+CONFIGS_CLASH = 'configurations sharing a build folder or an output'
 
 MISSING_KEY = 'missing mandatory key'
 WRONG_KEY_TYPE = 'key is of incorrect type'
+INVALID_JOBS = 'number of jobs must be a positive integer'
+INVALID_CACHE_SIZE = 'cache size must be a positive integer'
+INVALID_SHARDS = 'number of shards must be a positive integer'
+WRONG_KEY_VALUE = 'key has an unexpected value'
 
 VAR_GRAPH_ERROR = 'error in variables references'
 UNDEFINED_VAR = 'variable is undefined'
 WRONG_VAR_TYPE = 'variable is not of type "str"'
 
+INVALID_TARGET_NAME = 'invalid target name'
+UNDEFINED_TARGET = 'target is undefined'
+EXECUTABLE_DEPENDENCY = 'an executable can\'t be depended on'
+TARGET_GRAPH_ERROR = 'error in targets dependencies'
+
 FOLDER_NOT_FOUND = 'folder is nonexistent'
 
 # Graph errors.
 CYCLES_IN_GRAPH = 'cycle(s) in graph detected'
-GRAPH_TOO_DEEP = 'depth threshold exceeded'
 
 # Sources inspection errors.
 INVALID_FILENAME = 'file doesn\'t match filenames requirements'
@@ -37,8 +48,20 @@ INVALID_FILENAME = 'file doesn\'t match filenames requirements'
 INVALID_OUTPUT_NAME = 'invalid output name'
 
 COMPILATION_FAILED = 'compilation failed'
+PRECOMPILATION_FAILED = 'header precompilation failed'
 LINKING_FAILED = 'linking failed'
+LINKER_NOT_FOUND = 'linker not installed'
 RECIPE_FAILED = 'recipe creation failed'
+UNKNOWN_SOURCES = 'no translation unit compiles these files'
+
+# Cache errors.
+NO_CACHE = 'no cache directory configured ("cache" key)'
+
+# Daemon errors.
+DAEMON_NOT_STARTED = 'daemon failed to start'
+DAEMON_CONNECTION_LOST = 'connection to the daemon lost'
+DAEMON_UNSAFE_FOLDER = 'daemon folder not owned by the user, or open to others'
 
 # Clean-up errors.
 REMOVAL_FAILED = 'removal failed'
+UNKNOWN_PART = 'neither a target nor a folder'
@@ -3,6 +3,9 @@
 
 """
 Directed graph scanning utilities.
+
+Graphs are dictionaries (key = node, value = children); a child that is not a key has no children.
+All the functions run in linear time (in the number of nodes and edges), without recursion.
 """
 
 ####################################################################################################
@@ -12,87 +15,157 @@ def is_directed_acyclic_graph(graph):
     Check whether the input graph is a DAG (Directed Acyclic Graph).
 
     :param graph: The directed graph, in a form of a dictionary (key = node, value = children).
-    """
-    dead_ends = set()
-    depth = 0
 
-    for node, children in graph.items():
-        if node in dead_ends:
-            continue
+    :raises GraphError: the graph is cyclic (the cycle's path being given as details).
+    """
+    cycle = _find_cycle(graph)
 
-        _go_down_and_check_cycle(graph, [node], children, dead_ends, depth)
+    if cycle is not None:
+        _raise_cycle_error(cycle)
 
 ####################################################################################################
 
 def get_topological_ordering(graph):
     """
-    Given a directed graph in input, return the topological ordering of its nodes.
+    Given a directed graph in input, return the topological ordering of its nodes that are children
+    of another one.
 
     :param graph: The directed graph, in a form of a dictionary (key = node, value = children).
 
     :returns: A list of nodes, in topological order (from bottom to top node).
+
+    :raises GraphError: the graph is cyclic.
     """
-    import copy
+    levels, parents = _get_levels(graph)
 
-    topological_ordering = []
-    altered_graph = copy.deepcopy(graph)
+    return [node for level in levels for node in level if parents.get(node)]
 
-    # The altered graph *should* progressively shrink in size until emptiness, hence the "while".
-    while altered_graph:
-        for node, children in graph.items():
-            if not children:
-                altered_graph.pop(node)
+####################################################################################################
 
-            for child in children:
-                if child not in graph:
-                    # Prevent addition of duplicates.
-                    if child not in topological_ordering:
-                        topological_ordering.append(child)
+def get_ready_sets(graph):
+    """
+    Given a directed acyclic graph in input, group its nodes into successive "ready sets": each node
+    comes after all its children, and the nodes of a same set don't depend on one another (Kahn's
+    algorithm, level by level).
 
-                    altered_graph[node].discard(child)
+    :param graph: The directed graph, in a form of a dictionary (key = node, value = children).
 
-                    if not altered_graph[node]:
-                        altered_graph.pop(node)
+    :returns: A list of sets of nodes (from bottom to top nodes).
 
-        graph = copy.deepcopy(altered_graph)
+    :raises GraphError: the graph is cyclic.
+    """
+    levels, _ = _get_levels(graph)
 
-    return topological_ordering
+    return [set(level) for level in levels]
 
 ####################################################################################################
 
-# '10' is an arbitrary limit.
-_DEPTH_THRESHOLD = 10
+def _get_levels(graph):
+    """
+    Group the nodes of a graph by levels: the nodes without children first, then the nodes whose
+    children are all in the previous levels, etc.
 
-def _go_down_and_check_cycle(graph, visited_nodes, children, dead_ends, depth):
+    :param graph: The directed graph.
+
+    :returns: The list of levels (lists of nodes), and the parents of each node.
+
+    :raises GraphError: the graph is cyclic.
     """
-    Given a start node, visit recursively all its descendants, looking for a cycle. The depth value
-    is monitored, and a "too deep" graph (more than 10 descendants) will abort the visitation.
+    # Number of children not placed yet, and parents of each node.
+    pending = {}
+    parents = {}
+
+    for node, children in graph.items():
+        pending[node] = len(children)
+
+        for child in children:
+            parents.setdefault(child, []).append(node)
+            pending.setdefault(child, 0)
+
+    levels = []
+    level = [node for node, count in pending.items() if count == 0]
+    placed = 0
+
+    while level:
+        levels.append(level)
+        placed += len(level)
+
+        next_level = []
+
+        for node in level:
+            for parent in parents.get(node, ()):
+                pending[parent] -= 1
+
+                if pending[parent] == 0:
+                    next_level.append(parent)
+
+        level = next_level
 
-    :param graph: The directed graph being visited.
-    :param visited_nodes: The list of previously visited nodes.
-    :param children: The set of direct children of a node.
-    :param dead_ends: The list of identified "dead-end" nodes in the graph.
-    :param depth: The graph's depth.
+    # The nodes never placed are on a cycle, or above one.
+    if placed < len(pending):
+        _raise_cycle_error(_find_cycle(graph))
 
-    :raises GraphError: either the graph is cyclic, or its depth is too high.
+    return levels, parents
+
+####################################################################################################
+
+# Nodes visitation states.
+_IN_PROGRESS = 1
+_DONE = 2
+
+def _find_cycle(graph):
     """
-    from .errors            import errors as E
-    from .errors.exceptions import GraphError
+    Look for a cycle in a graph, through an iterative depth-first search.
 
-    depth += 1
+    :param graph: The directed graph.
 
-    if depth >= _DEPTH_THRESHOLD:
-        raise GraphError(E.GRAPH_TOO_DEEP)
+    :returns: The cycle's path (its first node repeated at the end), or "None" if acyclic.
+    """
+    states = {}
 
-    for node in children:
-        if (node not in graph) or (node in dead_ends):
+    for root in graph:
+        if root in states:
             continue
 
-        if node in visited_nodes:
-            raise GraphError(E.CYCLES_IN_GRAPH)
+        states[root] = _IN_PROGRESS
+
+        # The current path, and the children left to visit at each of its steps.
+        path = [root]
+        to_visit = [iter(graph[root])]
+
+        while to_visit:
+            for child in to_visit[-1]:
+                if child not in graph:
+                    continue
+
+                state = states.get(child)
 
-        visited_nodes.append(node)
+                if state == _IN_PROGRESS:
+                    return path[path.index(child):] + [child]
 
-        _go_down_and_check_cycle(graph, visited_nodes, graph[node], dead_ends, depth)
+                if state is None:
+                    states[child] = _IN_PROGRESS
+
+                    path.append(child)
+                    to_visit.append(iter(graph[child]))
+                    break
+            else:
+                states[path.pop()] = _DONE
+                to_visit.pop()
+
+    return None
+
+####################################################################################################
+
+def _raise_cycle_error(cycle):
+    """
+    Raise the error of a cyclic graph.
+
+    :param cycle: The cycle's path.
+
+    :raises GraphError: always.
+    """
+    from .errors            import errors as E
+    from .errors.exceptions import GraphError
 
-        dead_ends.add(visited_nodes.pop())
+    raise GraphError(E.CYCLES_IN_GRAPH, ' -> '.join(str(x) for x in cycle))
@@ -67,6 +67,11 @@ class Logger():
         Logger.__log_label(Logger.__BLUE, 'INFO ', '×'' ')
         Logger.__log_message(Logger.__BLUE, message)
 
+    @staticmethod
+    def reset():
+        """Reset the indentation, after a sequence was aborted without ending."""
+        Logger.__INDENT = 0
+
     @staticmethod
     def __indent(symbol='│'):
         """Indent the message with the input symbol."""
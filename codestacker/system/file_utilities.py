@@ -7,34 +7,39 @@ File utilities.
 
 ####################################################################################################
 
-def get_files(directory, extensions):
+def get_files(directory, extensions, snapshot=None):
     """
     Browse a directory and descendants, and gather all files ending with given extensions.
 
     :param directory: The directory to start visiting from.
     :param extensions: The extensions to look for in the directory and descendants.
+    :param snapshot: An optional snapshot to browse, instead of the file system.
 
     :returns: A list of filenames / paths.
     """
     import os
 
+    from codestacker.tracer import Tracer
+
     all_files = []
 
-    for current_dir, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(extensions):
-                all_files.append(os.path.join(current_dir, file))
+    with Tracer.span('Walk {}'.format(directory), 'walk'):
+        for current_dir, _, files in (os.walk if snapshot is None else snapshot.walk)(directory):
+            for file in files:
+                if file.endswith(extensions):
+                    all_files.append(os.path.join(current_dir, file))
 
     return all_files
 
 ####################################################################################################
 
-def check_files(directory, extensions):
+def check_files(directory, extensions, snapshot=None):
     """
     Check the validity of any source files within directory and descendants.
 
     :param directory: The directory to start visiting from.
     :param extensions: The extensions to look for in the directory and descendants.
+    :param snapshot: An optional snapshot to browse, instead of the file system.
 
     :raises FileSystemError: a file doesn't match the naming requirements.
     """
@@ -43,10 +48,218 @@ def check_files(directory, extensions):
 
     from codestacker.errors            import errors as E
     from codestacker.errors.exceptions import FileSystemError
+    from codestacker.tracer            import Tracer
 
     pattern = re.compile(r'^\w+$')
 
-    for _, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(extensions) and (pattern.search(os.path.splitext(file)[0]) is None):
-                raise FileSystemError(E.INVALID_FILENAME, file)
+    with Tracer.span('Check {}'.format(directory), 'walk'):
+        for _, _, files in (os.walk if snapshot is None else snapshot.walk)(directory):
+            for file in files:
+                if not file.endswith(extensions):
+                    continue
+
+                if pattern.search(os.path.splitext(file)[0]) is None:
+                    raise FileSystemError(E.INVALID_FILENAME, file)
+
+####################################################################################################
+
+def get_digest(file, cache):
+    """
+    Compute the digest of a file's content. Digests are cached by inode, size and modification time,
+    so that an unchanged file is never read twice.
+
+    :param file: The file to hash.
+    :param cache: The dictionary of previously computed digests (key = file, value = inode, size,
+                  modification time and digest), updated in place.
+
+    :returns: The file's digest, as a hexadecimal string.
+
+    :raises OSError: the file doesn't exist, or can't be read.
+    """
+    import hashlib
+    import os
+
+    stat = os.stat(file)
+    signature = [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+    cached = cache.get(file)
+
+    if (cached is not None) and (cached[:3] == signature):
+        return cached[3]
+
+    hasher = hashlib.blake2b(digest_size=16)
+
+    with open(file, 'rb') as stream:
+        for chunk in iter(lambda: stream.read(1 << 20), b''):
+            hasher.update(chunk)
+
+    cache[file] = [*signature, hasher.hexdigest()]
+
+    return cache[file][3]
+
+####################################################################################################
+
+def write_if_changed(file, content):
+    """
+    Write a file, only if its content is different: a file rewritten as is would still look
+    modified, and trigger useless recompilations.
+
+    :param file: The file to write.
+    :param content: Its content.
+
+    :returns: "True" if the file was written.
+    """
+    try:
+        with open(file, 'r') as stream:
+            if stream.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    with open(file, 'w') as stream:
+        stream.write(content)
+
+    return True
+
+####################################################################################################
+
+class Snapshot():
+    """
+    In-memory snapshot of the file system: each directory is listed once, and each file is stat'ed
+    once. Directories listings are kept along with their modification time, so that they can be
+    reused by the next builds as long as the directory is unchanged.
+    """
+    def __init__(self, listings=None):
+        """
+        Constructor.
+
+        :param listings: The directories listings of a previous snapshot (key = directory, value =
+                         modification time, subdirectories and files).
+        """
+        self.__previous_listings = listings or {}
+        self.__listings = {}
+        self.__stats = {}
+
+    @property
+    def listings(self):
+        """The directories listings of this snapshot, to be given to the next one."""
+        return self.__listings
+
+    def extend(self, listings):
+        """
+        Add the directories listings of another previous snapshot (e.g. of another build state), to
+        be reused as well.
+
+        :param listings: The directories listings (as given to the constructor).
+        """
+        for directory, listing in (listings or {}).items():
+            self.__previous_listings.setdefault(directory, listing)
+
+    def walk(self, directory):
+        """
+        Browse a directory and descendants, like "os.walk" (top-down, symbolic links not followed).
+
+        :param directory: The directory to start visiting from.
+
+        :returns: A generator of (directory, subdirectories, files) tuples.
+        """
+        import os
+
+        pending = [directory]
+
+        while pending:
+            current_dir = pending.pop()
+            dirs, files = self.__list(current_dir)
+
+            yield current_dir, dirs, files
+
+            pending.extend(os.path.join(current_dir, x) for x in reversed(dirs))
+
+    def get_mtime(self, file):
+        """
+        Return a file's modification time.
+
+        :param file: The file to look at.
+
+        :returns: The modification time, in seconds.
+
+        :raises OSError: the file doesn't exist.
+        """
+        import os
+
+        stat = self.__stats.get(file)
+
+        if stat is None:
+            stat = self.__stats[file] = os.stat(file)
+
+        return stat.st_mtime
+
+    def forget(self, paths):
+        """
+        Forget what is known of some files or directories (and their descendants), for them to be
+        looked at again.
+
+        :param paths: The files or directories to forget.
+        """
+        import os
+
+        paths = set(paths)
+        prefixes = tuple(os.path.join(x, '') for x in paths)
+        parents = set(os.path.dirname(x) for x in paths)
+
+        for file in [x for x in self.__stats if (x in paths) or x.startswith(prefixes)]:
+            del self.__stats[file]
+
+        for directory in [
+                x for x in self.__listings
+                if (x in paths) or (x in parents) or x.startswith(prefixes)]:
+            # Still reused if the directory's modification time didn't change.
+            self.__previous_listings[directory] = self.__listings.pop(directory)
+
+    def forget_outside(self, directories):
+        """
+        Forget what is known of the files outside some directories (e.g. the headers of another
+        project, reached through a "-I" flag), for them to be looked at again: only the changes in
+        those directories are reported (by a file watcher).
+
+        :param directories: The directories whose files are still known.
+        """
+        import os
+
+        prefixes = tuple(os.path.join(x, '') for x in directories)
+
+        for file in [x for x in self.__stats if not x.startswith(prefixes)]:
+            del self.__stats[file]
+
+    def __list(self, directory):
+        """List a directory's subdirectories and files, unless unchanged since the last snapshot."""
+        import os
+
+        listing = self.__listings.get(directory)
+
+        if listing is not None:
+            return listing[1], listing[2]
+
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return [], []
+
+        listing = self.__previous_listings.get(directory)
+
+        if (listing is None) or (listing[0] != mtime):
+            dirs = []
+            files = []
+
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif not entry.is_dir():
+                        files.append(entry.name)
+
+            listing = [mtime, sorted(dirs), sorted(files)]
+
+        self.__listings[directory] = listing
+
+        return listing[1], listing[2]
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+File changes watching.
+"""
+
+####################################################################################################
+
+# Inotify events (see "inotify(7)").
+_IN_ATTRIB = 0x4
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ISDIR = 0x40000000
+
+_IN_MASK = (
+    _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE)
+
+# Header of an inotify event: watch descriptor, mask, cookie and name's length.
+_EVENT_FORMAT = 'iIII'
+
+# In seconds.
+_DEBOUNCE_DELAY = 0.1
+_POLLING_INTERVAL = 0.5
+
+class FileWatcher():
+    """
+    Watcher of the files within directories and descendants: with inotify where available, by
+    polling the files' modification times otherwise.
+    """
+    def __init__(self, directories):
+        """
+        Constructor.
+
+        :param directories: The directories to watch.
+        """
+        self.__directories = directories
+        self.__fd = None
+        self.__watches = {}
+        self.__stats = None
+
+        try:
+            self.__fd = self.__init_inotify()
+
+            for directory in directories:
+                self.__add_watches(directory)
+        except (AttributeError, OSError):
+            self.close()
+
+            self.__stats = self.__scan()
+
+    @property
+    def polling(self):
+        """Whether the files are polled, inotify being unavailable."""
+        return self.__fd is None
+
+    def wait(self):
+        """
+        Wait for files or directories to change. Changes happening shortly after one another are
+        gathered together (e.g. an editor saving several files).
+
+        :returns: The set of changed files and directories, or "None" if changes were missed.
+        """
+        import select
+        import time
+
+        if self.polling:
+            while True:
+                time.sleep(_POLLING_INTERVAL)
+
+                changed = self.__poll()
+
+                if changed:
+                    return changed
+
+        changed = set()
+        timeout = None
+
+        while True:
+            if select.select([self.__fd], [], [], timeout)[0]:
+                if not self.__read_events(changed):
+                    return None
+
+                timeout = _DEBOUNCE_DELAY
+            elif changed:
+                return changed
+            else:
+                timeout = None
+
+    def get_changes(self):
+        """
+        Return the changes that happened since the last call, without waiting.
+
+        :returns: The set of changed files and directories (possibly empty), or "None" if changes
+                  were missed.
+        """
+        import select
+
+        if self.polling:
+            return self.__poll()
+
+        changed = set()
+
+        while select.select([self.__fd], [], [], 0)[0]:
+            if not self.__read_events(changed):
+                return None
+
+        return changed
+
+    def close(self):
+        """Stop watching."""
+        import os
+
+        if self.__fd is not None:
+            os.close(self.__fd)
+
+            self.__fd = None
+
+    def __init_inotify(self):
+        """Create an inotify instance, and return its file descriptor."""
+        import ctypes
+        import os
+
+        self.__libc = ctypes.CDLL(None, use_errno=True)
+
+        fd = self.__libc.inotify_init1(os.O_CLOEXEC)
+
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1')
+
+        return fd
+
+    def __add_watches(self, directory):
+        """Watch a directory and descendants, and return the files within them."""
+        import ctypes
+        import os
+
+        files = set()
+
+        for current_dir, _, names in os.walk(directory):
+            wd = self.__libc.inotify_add_watch(self.__fd, os.fsencode(current_dir), _IN_MASK)
+
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), 'inotify_add_watch', current_dir)
+
+            self.__watches[wd] = current_dir
+
+            files.update(os.path.join(current_dir, x) for x in names)
+
+        return files
+
+    def __read_events(self, changed):
+        """Read the pending inotify events into a set of changed paths; "False" on an overflow."""
+        import os
+        import struct
+
+        data = os.read(self.__fd, 1 << 16)
+        header_size = struct.calcsize(_EVENT_FORMAT)
+        offset = 0
+
+        while offset < len(data):
+            wd, mask, _, length = struct.unpack_from(_EVENT_FORMAT, data, offset)
+            offset += header_size
+
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                return False
+
+            if mask & _IN_IGNORED:
+                self.__watches.pop(wd, None)
+                continue
+
+            if wd not in self.__watches:
+                continue
+
+            path = os.path.join(self.__watches[wd], name)
+
+            changed.add(path)
+
+            # New directories are watched too, and their files are new as well.
+            if (mask & _IN_ISDIR) and (mask & (_IN_CREATE | _IN_MOVED_TO)):
+                try:
+                    changed.update(self.__add_watches(path))
+                except OSError:
+                    return False
+
+        return True
+
+    def __scan(self):
+        """Return the modification times and sizes of all the watched files and directories."""
+        import os
+
+        stats = {}
+
+        for directory in self.__directories:
+            for current_dir, _, files in os.walk(directory):
+                for path in (current_dir, *(os.path.join(current_dir, x) for x in files)):
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+
+                    stats[path] = (stat.st_mtime_ns, stat.st_size)
+
+        return stats
+
+    def __poll(self):
+        """Return the set of files and directories changed since the last poll."""
+        stats = self.__scan()
+        changed = set(stats).symmetric_difference(self.__stats)
+
+        changed.update(x for x, stat in stats.items() if self.__stats.get(x, stat) != stat)
+
+        self.__stats = stats
+
+        return changed
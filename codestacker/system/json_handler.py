@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+JSON file handling utilities.
+"""
+
+####################################################################################################
+
+def load_json(file):
+    """
+    Read a JSON file and return its content.
+
+    :param file: The filename / path to read from.
+
+    :returns: The file's content.
+
+    :raises FileSystemError: the file reading failed.
+    :raises TechnicalError: the JSON parsing failed.
+    """
+    import json
+
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import FileSystemError, TechnicalError
+
+    try:
+        with open(file, 'r') as stream:
+            return json.load(stream)
+    except IOError as error:
+        raise FileSystemError(errors.FILE_READING_ERROR, error=error)
+    except ValueError as error:
+        raise TechnicalError(errors.JSON_PARSING_ERROR, error=error)
+
+####################################################################################################
+
+def dump_json(content, file):
+    """
+    Dump some JSON content into a file. The file is replaced atomically, so that an interrupted
+    dump never leaves a truncated file behind.
+
+    :param content: The content to write in a file.
+    :param file: The filename / path to write in.
+
+    :raises FileSystemError: the file writing failed.
+    """
+    import json
+    import os
+
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import FileSystemError
+
+    temp_file = '{}.{}.tmp'.format(file, os.getpid())
+
+    try:
+        with open(temp_file, 'w') as stream:
+            # Encoded at once, which is much faster than "json.dump" for big contents.
+            stream.write(json.dumps(content, separators=(',', ':')))
+
+        os.replace(temp_file, file)
+    except IOError as error:
+        raise FileSystemError(errors.FILE_WRITING_ERROR, error=error)
@@ -32,6 +32,110 @@ class TestFileUtilities(unittest.TestCase):
         context.exception.print()
         self.assertEqual(context.exception.args[0], errors.INVALID_FILENAME)
 
+    def test_get_digest(self):
+        """Test content digests."""
+        import os
+
+        from codestacker.system.file_utilities import get_digest
+
+        file = os.path.join(self.source_dir, 'blueprint_good.yaml')
+        cache = {}
+
+        digest = get_digest(file, cache)
+
+        self.assertIn(file, cache)
+        self.assertEqual(digest, cache[file][3])
+
+        # Cached digest (a fake one, to make sure the file isn't read again).
+        cache[file][3] = 'cached'
+
+        self.assertEqual('cached', get_digest(file, cache))
+
+        # Non-existent file.
+        with self.assertRaises(OSError):
+            get_digest(os.path.join(self.source_dir, '#dummy#'), cache)
+
+    def test_write_if_changed(self):
+        """Test writing files only when their content changes."""
+        import os
+        import tempfile
+
+        from codestacker.system.file_utilities import write_if_changed
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file = os.path.join(temp_dir, 'batch.cpp')
+
+            self.assertTrue(write_if_changed(file, 'foo'))
+
+            os.utime(file, (0, 0))
+
+            # Same content: left as is.
+            self.assertFalse(write_if_changed(file, 'foo'))
+            self.assertEqual(0, os.path.getmtime(file))
+
+            self.assertTrue(write_if_changed(file, 'bar'))
+
+            with open(file, 'r') as stream:
+                self.assertEqual('bar', stream.read())
+
+    def test_snapshot(self):
+        """Test file system snapshots."""
+        import os
+        import tempfile
+
+        from codestacker.system.file_utilities import Snapshot, get_files
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.makedirs(os.path.join(temp_dir, 'sub'))
+
+            for file in ('a.cpp', os.path.join('sub', 'b.cpp'), os.path.join('sub', 'c.hpp')):
+                open(os.path.join(temp_dir, file), 'w').close()
+
+            snapshot = Snapshot()
+
+            self.assertEqual(
+                sorted(get_files(temp_dir, '.cpp')), sorted(get_files(temp_dir, '.cpp', snapshot)))
+
+            # Unchanged directories are not listed again.
+            listings = snapshot.listings
+            listings[temp_dir][2].append('fake.cpp')
+
+            self.assertIn(
+                os.path.join(temp_dir, 'fake.cpp'), get_files(temp_dir, '.cpp', Snapshot(listings)))
+
+            # Changed directories are.
+            open(os.path.join(temp_dir, 'd.cpp'), 'w').close()
+            os.utime(temp_dir, ns=(0, 0))
+
+            self.assertEqual(
+                sorted(get_files(temp_dir, '.cpp')),
+                sorted(get_files(temp_dir, '.cpp', Snapshot(listings))))
+
+            # Forgotten files and directories are looked at again.
+            file = os.path.join(temp_dir, 'd.cpp')
+            new_file = os.path.join(temp_dir, 'sub', 'e.cpp')
+            snapshot = Snapshot()
+
+            get_files(temp_dir, '.cpp', snapshot)
+            mtime = snapshot.get_mtime(file)
+
+            os.utime(file, (mtime + 10, mtime + 10))
+            open(new_file, 'w').close()
+            os.utime(os.path.join(temp_dir, 'sub'), ns=(0, 0))
+
+            self.assertEqual(mtime, snapshot.get_mtime(file))
+
+            snapshot.forget([file, new_file])
+
+            self.assertEqual(mtime + 10, snapshot.get_mtime(file))
+            self.assertIn(new_file, get_files(temp_dir, '.cpp', snapshot))
+
+            # So are the files outside the given directories.
+            os.utime(file, (mtime + 20, mtime + 20))
+            snapshot.forget_outside([os.path.join(temp_dir, 'sub')])
+
+            self.assertEqual(mtime + 20, snapshot.get_mtime(file))
+
 ####################################################################################################
 
 if __name__ == '__main__':
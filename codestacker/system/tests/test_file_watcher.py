@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for file_watcher.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestFileWatcher(unittest.TestCase):
+    """
+    Test class.
+    """
+    def test_wait(self):
+        """Test the detection of changes."""
+        import os
+        import tempfile
+
+        from codestacker.system.file_watcher import FileWatcher
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.makedirs(os.path.join(temp_dir, 'sub'))
+
+            file = os.path.join(temp_dir, 'sub', 'a.cpp')
+            new_dir = os.path.join(temp_dir, 'new')
+
+            open(file, 'w').close()
+
+            watcher = FileWatcher([temp_dir])
+
+            try:
+                # Modified file.
+                os.utime(file, ns=(0, 0))
+
+                self.assertEqual({file}, watcher.wait())
+
+                # New directory, along with its files.
+                os.makedirs(new_dir)
+                open(os.path.join(new_dir, 'b.cpp'), 'w').close()
+
+                self.assertLessEqual({new_dir, os.path.join(new_dir, 'b.cpp')}, watcher.wait())
+            finally:
+                watcher.close()
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for trash.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestTrash(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        for name in ('build/a/x.o', 'build/a/b/y.o', 'build/z.o', 'bin/Test'):
+            os.makedirs(os.path.dirname(os.path.join(root, name)), exist_ok=True)
+
+            with open(os.path.join(root, name), 'w') as stream:
+                stream.write(name)
+
+    def tearDown(self):
+        """Tear down."""
+        self.temp_dir.cleanup()
+
+    def test_trash(self):
+        """Test moving files and folders to the trash, then emptying it."""
+        import os
+
+        from codestacker.system.trash import empty_trash, move_to_trash
+
+        root = self.temp_dir.name
+
+        trashes = move_to_trash([
+            os.path.join(root, 'build'), os.path.join(root, 'bin', 'Test'),
+            os.path.join(root, 'missing')])
+
+        # One trash folder next to each moved file or folder.
+        self.assertEqual(2, len(trashes))
+        self.assertEqual(['bin'], [x for x in os.listdir(root) if not x.startswith('.')])
+        self.assertEqual([], [x for x in os.listdir(os.path.join(root, 'bin')) if x == 'Test'])
+
+        # Leftovers of a previous clean-up are collected too.
+        leftover = os.path.join(root, [x for x in os.listdir(root) if x.startswith('.')][0])
+        trashes = move_to_trash([os.path.join(root, 'bin')])
+
+        self.assertEqual(2, len(trashes))
+        self.assertIn(leftover, trashes)
+
+        empty_trash(trashes, 2)
+
+        self.assertEqual([], os.listdir(root))
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Trash folders: files and folders are moved out of the way at once, then deleted in the background.
+"""
+
+####################################################################################################
+
+_TRASH_PREFIX = '.codestacker-trash-'
+
+def move_to_trash(paths):
+    """
+    Move files and folders into trash folders, created next to them: renaming is immediate,
+    whatever their size. The trash folders left over by previous clean-ups are collected as well.
+
+    :param paths: The files and folders to move (nonexistent ones are skipped).
+
+    :returns: The list of trash folders.
+
+    :raises FileSystemError: a file or folder couldn't be moved.
+    """
+    import glob
+    import os
+    import tempfile
+
+    from codestacker.errors            import errors
+    from codestacker.errors.exceptions import FileSystemError
+
+    trashes = {}
+
+    for path in paths:
+        if not os.path.lexists(path):
+            continue
+
+        # Renamed within the same folder, hence the same file system.
+        parent = os.path.dirname(path)
+        trash = trashes.get(parent)
+
+        if trash is None:
+            trash = trashes[parent] = tempfile.mkdtemp(prefix=_TRASH_PREFIX, dir=parent)
+
+        try:
+            os.rename(path, os.path.join(trash, os.path.basename(path)))
+        except OSError as error:
+            raise FileSystemError(errors.REMOVAL_FAILED, path, error)
+
+    leftovers = set()
+
+    for parent in trashes:
+        leftovers.update(glob.glob(os.path.join(glob.escape(parent), _TRASH_PREFIX + '*')))
+
+    return sorted(leftovers.union(trashes.values()))
+
+####################################################################################################
+
+def empty_trash(trashes, jobs):
+    """
+    Delete trash folders, deleting their sub-folders in parallel.
+
+    :param trashes: The trash folders.
+    :param jobs: The maximum number of deletions running at once.
+    """
+    import shutil
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    folders = []
+    files = []
+
+    # Two levels down, for the load to be spread over the jobs (e.g. one folder per target).
+    for trash in trashes:
+        for entry in _scan(trash):
+            children = _scan(entry.path) if entry.is_dir(follow_symlinks=False) else [entry]
+
+            for child in children:
+                if child.is_dir(follow_symlinks=False):
+                    folders.append(child.path)
+                else:
+                    files.append(child.path)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for folder in folders:
+            executor.submit(shutil.rmtree, folder, ignore_errors=True)
+
+        for file in files:
+            executor.submit(_unlink, file)
+
+    # Left (almost) empty.
+    for trash in trashes:
+        shutil.rmtree(trash, ignore_errors=True)
+
+####################################################################################################
+
+def empty_trash_later(trashes):
+    """
+    Delete trash folders in a detached process, without waiting for it.
+
+    :param trashes: The trash folders.
+    """
+    import subprocess
+    import sys
+
+    if not trashes:
+        return
+
+    subprocess.Popen(
+        [sys.executable, '-m', 'codestacker.system.trash', *trashes], stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+
+####################################################################################################
+
+def _scan(directory):
+    """Return the entries of a folder (none if it vanished)."""
+    import os
+
+    try:
+        with os.scandir(directory) as entries:
+            return list(entries)
+    except OSError:
+        return []
+
+####################################################################################################
+
+def _unlink(file):
+    """Delete a file (unless it vanished)."""
+    import os
+
+    try:
+        os.unlink(file)
+    except OSError:
+        pass
+
+####################################################################################################
+
+if __name__ == '__main__':
+    import os
+    import sys
+
+    empty_trash(sys.argv[1:], os.cpu_count() or 1)
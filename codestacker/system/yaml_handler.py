@@ -27,9 +27,12 @@ def load_yaml(file):
 
     Logger.begin('Load "{}" file...'.format(os.path.relpath(file)))
 
+    # The libyaml bindings, when available, are much faster.
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
     try:
         with open(file, 'r') as stream:
-            content = list(yaml.safe_load_all(stream))
+            content = list(yaml.load_all(stream, Loader=loader))
     except IOError as error:
         raise FileSystemError(errors.FILE_READING_ERROR, error=error)
     except yaml.YAMLError as error:
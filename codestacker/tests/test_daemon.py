@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit test for daemon.py module.
+"""
+
+####################################################################################################
+
+import unittest
+
+class TestDaemon(unittest.TestCase):
+    """
+    Test class.
+    """
+    def setUp(self):
+        """Set up."""
+        import os
+        import tempfile
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        root = self.temp_dir.name
+
+        os.makedirs(os.path.join(root, 'src'))
+
+        with open(os.path.join(root, 'src', 'main.cpp'), 'w') as stream:
+            stream.write('int main() { return 0; }\n')
+
+        with open(os.path.join(root, 'blueprint.yaml'), 'w') as stream:
+            stream.write(
+                'default:\n  binary: bin\n  build: build\n  include: src\n  output: Test\n'
+                '  sources: src\n')
+
+        self.env = dict(os.environ)
+        self.env['XDG_RUNTIME_DIR'] = root
+        self.env['PYTHONPATH'] = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+    def tearDown(self):
+        """Tear down."""
+        self._run('daemon', 'stop')
+        self.temp_dir.cleanup()
+
+    def _run(self, *arguments):
+        """Run CodeStacker in the project's folder."""
+        import subprocess
+        import sys
+
+        return subprocess.run(
+            [sys.executable, '-m', 'codestacker', *arguments], cwd=self.temp_dir.name,
+            env=self.env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding='UTF-8')
+
+    def test_daemon(self):
+        """Test the commands served by the daemon."""
+        import os
+
+        self.assertIn('No daemon running', self._run('daemon', 'status').stdout)
+        self.assertEqual(0, self._run('daemon', 'start').returncode)
+
+        # Configuration loaded by the first command only, then kept in memory.
+        result = self._run('build')
+
+        self.assertEqual(0, result.returncode)
+        self.assertIn('Load "blueprint.yaml"', result.stdout)
+        self.assertTrue(os.path.isfile(os.path.join(self.temp_dir.name, 'bin', 'Test')))
+
+        result = self._run('build')
+
+        self.assertEqual(0, result.returncode)
+        self.assertNotIn('Load "blueprint.yaml"', result.stdout)
+        self.assertIn('Nothing to (re)compile', result.stdout)
+
+        # Failures are reported as such.
+        with open(os.path.join(self.temp_dir.name, 'src', 'main.cpp'), 'a') as stream:
+            stream.write('int broken(\n')
+
+        self.assertEqual(1, self._run('build').returncode)
+
+        self.assertIn('Daemon stopped', self._run('daemon', 'stop').stdout)
+
+    def test_daemon_external_header(self):
+        """Test the changes of a header outside the watched folders, between two requests."""
+        import os
+
+        root = self.temp_dir.name
+        header = os.path.join(root, 'external', 'external.hpp')
+
+        os.makedirs(os.path.dirname(header))
+
+        with open(header, 'w') as stream:
+            stream.write('inline int value() { return 0; }\n')
+
+        with open(os.path.join(root, 'src', 'main.cpp'), 'w') as stream:
+            stream.write('#include <external.hpp>\nint main() { return value(); }\n')
+
+        with open(os.path.join(root, 'blueprint.yaml'), 'a') as stream:
+            stream.write('  flags: [-I{}]\n'.format(os.path.dirname(header)))
+
+        self.assertEqual(0, self._run('daemon', 'start').returncode)
+        self.assertEqual(0, self._run('build').returncode)
+
+        # Up to date: the header's modification time is looked at, and known from then on.
+        self.assertIn('Nothing to (re)compile', self._run('build').stdout)
+
+        # Reached through a "-I" flag: not watched, but looked at again.
+        with open(header, 'w') as stream:
+            stream.write('inline int value() { return 1; }\n')
+
+        mtime = os.stat(header).st_mtime + 10
+        os.utime(header, (mtime, mtime))
+
+        result = self._run('build')
+
+        self.assertEqual(0, result.returncode)
+        self.assertNotIn('Load "blueprint.yaml"', result.stdout)
+        self.assertIn('Compiling src/main.cpp', result.stdout)
+
+    def test_socket_folder(self):
+        """Test the checks of the socket's folder."""
+        import os
+
+        from codestacker.daemon            import _is_trusted, _make_socket_folder
+        from codestacker.errors            import errors
+        from codestacker.errors.exceptions import TechnicalError
+
+        directory = os.path.join(self.temp_dir.name, 'sockets')
+        socket_path = os.path.join(directory, 'daemon.sock')
+
+        _make_socket_folder(directory)
+
+        self.assertEqual(0o700, os.stat(directory).st_mode & 0o777)
+        self.assertFalse(_is_trusted(socket_path))
+
+        with open(socket_path, 'w'):
+            pass
+
+        self.assertTrue(_is_trusted(socket_path))
+
+        # Open to others (e.g. made beforehand by another user).
+        os.chmod(directory, 0o777)
+
+        self.assertFalse(_is_trusted(socket_path))
+
+        with self.assertRaises(TechnicalError) as context:
+            _make_socket_folder(directory)
+
+        context.exception.print()
+        self.assertEqual(context.exception.args[0], errors.DAEMON_UNSAFE_FOLDER)
+
+####################################################################################################
+
+if __name__ == '__main__':
+    unittest.main()
@@ -56,11 +56,18 @@ class TestGraphTools(unittest.TestCase):
 
         self.assertEqual(context.exception.args[0], E.CYCLES_IN_GRAPH)
 
-        # Deep graph.
+        # The cycle's path is reported.
+        self.assertEqual('a -> b -> c -> a', context.exception.args[1])
+
+        # Deep graph (no depth limit).
+        is_directed_acyclic_graph(self.deep_graph)
+        is_directed_acyclic_graph({x: set([x + 1]) for x in range(100000)})
+
+        # Self-reference.
         with self.assertRaises(GraphError) as context:
-            is_directed_acyclic_graph(self.deep_graph)
+            is_directed_acyclic_graph({'a': set(['a'])})
 
-        self.assertEqual(context.exception.args[0], E.GRAPH_TOO_DEEP)
+        self.assertEqual('a -> a', context.exception.args[1])
 
     def test_get_topological_ordering(self):
         """Test topological ordering."""
@@ -68,6 +75,28 @@ class TestGraphTools(unittest.TestCase):
 
         self.assertEqual(self.ordered_nodes, get_topological_ordering(self.acyclic_graph))
 
+        # Deep graph.
+        self.assertEqual(list('kjihgfedcb'), get_topological_ordering(self.deep_graph))
+
+    def test_get_ready_sets(self):
+        """Test ready sets grouping."""
+        from codestacker.errors            import errors as E
+        from codestacker.errors.exceptions import GraphError
+        from codestacker.graph_tools       import get_ready_sets
+
+        self.assertEqual(
+            [set(['g']), set(['e']), set(['d']), set(['c']), set(['b']), set(['a'])],
+            get_ready_sets(self.acyclic_graph))
+
+        self.assertEqual(
+            [set(['c', 'd']), set(['a', 'b'])],
+            get_ready_sets({'a': set(['c']), 'b': set(['c', 'd'])}))
+
+        with self.assertRaises(GraphError) as context:
+            get_ready_sets(self.cyclic_graph)
+
+        self.assertEqual(context.exception.args[0], E.CYCLES_IN_GRAPH)
+
 ####################################################################################################
 
 if __name__ == '__main__':
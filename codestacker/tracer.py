@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Build timeline tracing.
+"""
+
+####################################################################################################
+
+class Tracer():
+    """
+    Recorder of the build's timeline, saved in the Chrome trace event format (to be opened with
+    "chrome://tracing", or Perfetto). Spans are recorded on the main thread (slot 0), or on the slot
+    of the job they ran in; nothing is recorded unless started.
+    """
+    __EVENTS = None
+    __ORIGIN = 0
+
+    @staticmethod
+    def start():
+        """Start recording."""
+        import time
+
+        Tracer.__EVENTS = []
+        Tracer.__ORIGIN = time.perf_counter()
+
+    @staticmethod
+    def is_started():
+        """Tell whether spans are recorded."""
+        return Tracer.__EVENTS is not None
+
+    @staticmethod
+    def span(name, category, args=None):
+        """
+        Return a context manager recording a span on the main thread, for the time it's entered.
+
+        :param name: The span's name.
+        :param category: The span's category (e.g. "config", "walk", "compile").
+        :param args: An optional dictionary of details.
+        """
+        return _Span(name, category, args)
+
+    @staticmethod
+    def add(name, category, start, end, slot=0, args=None):
+        """
+        Record a span.
+
+        :param name: The span's name.
+        :param category: The span's category.
+        :param start: The span's start, as given by "time.perf_counter".
+        :param end: The span's end, as given by "time.perf_counter".
+        :param slot: The optional slot of the job the span ran in (0 for the main thread).
+        :param args: An optional dictionary of details.
+        """
+        import os
+
+        if Tracer.__EVENTS is None:
+            return
+
+        Tracer.__EVENTS.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round((start - Tracer.__ORIGIN) * 1e6, 1),
+            'dur': round((end - start) * 1e6, 1),
+            'pid': os.getpid(),
+            'tid': slot,
+            'args': args or {}})
+
+    @staticmethod
+    def save(file):
+        """
+        Stop recording, and save the recorded spans.
+
+        :param file: The trace file to write.
+
+        :raises FileSystemError: the file writing failed.
+        """
+        import os
+
+        from codestacker.system.json_handler import dump_json
+
+        events = Tracer.__EVENTS or []
+        Tracer.__EVENTS = None
+
+        slots = sorted(set(x['tid'] for x in events) | set([0]))
+        names = [{
+            'name': 'thread_name',
+            'ph': 'M',
+            'pid': os.getpid(),
+            'tid': x,
+            'args': {'name': 'job {}'.format(x) if x else 'main'}} for x in slots]
+
+        dump_json({'traceEvents': names + events, 'displayTimeUnit': 'ms'}, file)
+
+####################################################################################################
+
+class _Span():
+    """
+    Context manager recording a span on the main thread.
+    """
+    def __init__(self, name, category, args):
+        """Constructor."""
+        self.__name = name
+        self.__category = category
+        self.__args = args
+        self.__start = None
+
+    def __enter__(self):
+        """Start the span."""
+        import time
+
+        self.__start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *_):
+        """End the span."""
+        import time
+
+        Tracer.add(self.__name, self.__category, self.__start, time.perf_counter(), 0, self.__args)